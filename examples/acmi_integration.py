@@ -5,20 +5,18 @@ This example shows how to use ACMILogger for automatic ACMI export
 during Stable-Baselines3 training.
 """
 
+import math
 import sys
 from pathlib import Path
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import gymnasium as gym
-from tensorboard_flight.acmi import ACMILogger
-from tensorboard_flight.data.schema import Telemetry, RLMetrics, Orientation
-import numpy as np
-
 
 def simulate_rl_training():
     """Simulate a simple RL training loop with ACMI export."""
+    from tensorboard_flight.acmi import ACMILogger
+
     print("="*60)
     print("ACMI Integration Example")
     print("="*60)
@@ -40,6 +38,11 @@ def simulate_rl_training():
     num_episodes = 3
     steps_per_episode = 100
 
+    # Circular trajectory
+    radius = 100.0
+    angular_speed = 0.1  # rad/s
+    turn_rate_deg = math.degrees(angular_speed)  # constant for a circular path
+
     for episode in range(num_episodes):
         print(f"\nEpisode {episode + 1}/{num_episodes}")
 
@@ -49,53 +52,49 @@ def simulate_rl_training():
         for step in range(steps_per_episode):
             t = step * 0.02  # 50 Hz
 
-            # Circular trajectory
-            radius = 100.0
-            angular_speed = 0.1  # rad/s
-
-            x = radius * np.cos(angular_speed * t)
-            y = radius * np.sin(angular_speed * t)
-            z = 1000.0 + 10.0 * np.sin(0.1 * t)  # Gentle altitude variation
+            x = radius * math.cos(angular_speed * t)
+            y = radius * math.sin(angular_speed * t)
+            z = 1000.0 + 10.0 * math.sin(0.1 * t)  # Gentle altitude variation
 
             # Velocity
-            vx = -radius * angular_speed * np.sin(angular_speed * t)
-            vy = radius * angular_speed * np.cos(angular_speed * t)
-            vz = 10.0 * 0.1 * np.cos(0.1 * t)
+            vx = -radius * angular_speed * math.sin(angular_speed * t)
+            vy = radius * angular_speed * math.cos(angular_speed * t)
+            vz = 10.0 * 0.1 * math.cos(0.1 * t)
 
             # Orientation (banking into turn)
-            roll = np.degrees(np.arctan2(vy, vx) * 0.2)  # Bank angle
-            pitch = np.degrees(np.arctan2(vz, np.sqrt(vx**2 + vy**2)))
-            yaw = np.degrees(np.arctan2(vy, vx))
+            roll = math.degrees(math.atan2(vy, vx) * 0.2)  # Bank angle
+            pitch = math.degrees(math.atan2(vz, math.sqrt(vx**2 + vy**2)))
+            yaw = math.degrees(math.atan2(vy, vx))
 
             # Airspeed
-            airspeed = np.sqrt(vx**2 + vy**2 + vz**2)
+            airspeed = math.sqrt(vx**2 + vy**2 + vz**2)
 
             # Telemetry
             telemetry = {
                 'airspeed': airspeed,
                 'altitude': z,
-                'g_force': 1.0 + 0.2 * np.abs(np.sin(angular_speed * t)),
-                'throttle': 0.6 + 0.1 * np.sin(0.05 * t),
-                'aoa': 5.0 + 2.0 * np.sin(0.2 * t),
-                'aos': 0.5 * np.cos(0.3 * t),
+                'g_force': 1.0 + 0.2 * abs(math.sin(angular_speed * t)),
+                'throttle': 0.6 + 0.1 * math.sin(0.05 * t),
+                'aoa': 5.0 + 2.0 * math.sin(0.2 * t),
+                'aos': 0.5 * math.cos(0.3 * t),
                 'heading': yaw,
                 'vertical_speed': vz,
-                'turn_rate': np.degrees(angular_speed),
+                'turn_rate': turn_rate_deg,
                 'bank_angle': roll,
             }
 
             # RL metrics (simulated)
-            reward = 1.0 - 0.01 * np.abs(z - 1000.0)  # Reward for altitude hold
+            reward = 1.0 - 0.01 * abs(z - 1000.0)  # Reward for altitude hold
 
             rl_metrics = {
                 'reward': reward,
                 'action': [
-                    0.1 * np.sin(0.2 * t),  # Aileron
-                    0.05 * np.cos(0.3 * t),  # Elevator
-                    0.02 * np.sin(0.4 * t),  # Rudder
+                    0.1 * math.sin(0.2 * t),  # Aileron
+                    0.05 * math.cos(0.3 * t),  # Elevator
+                    0.02 * math.sin(0.4 * t),  # Rudder
                     telemetry['throttle'],   # Throttle
                 ],
-                'value_estimate': 50.0 + 10.0 * np.sin(0.1 * t),
+                'value_estimate': 50.0 + 10.0 * math.sin(0.1 * t),
                 'policy_logprob': -1.5,
                 'entropy': 0.8,
                 'reward_components': {
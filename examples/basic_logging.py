@@ -4,70 +4,59 @@ This example demonstrates how to log flight data to TensorBoard
 using the FlightLogger API.
 """
 
+import math
 import numpy as np
 from tensorboard_flight import FlightLogger
 
 
-def simulate_flight_step(step):
-    """Simulate a single flight step.
+def precompute_flight(n_steps):
+    """Simulate all flight steps at once.
 
-    Returns dummy data for demonstration purposes.
+    Returns dummy data for demonstration purposes as a dict of
+    ``(n_steps,)`` arrays, plus ``'action'`` with shape ``(n_steps, 4)``.
     """
-    t = step * 0.01  # Time in seconds
+    t = np.arange(n_steps) * 0.01  # Time in seconds
 
     # Simple circular trajectory
     radius = 100.0
-    height = 50.0 + 10.0 * np.sin(t * 0.1)
+    sin_t, cos_t = np.sin(t * 0.1), np.cos(t * 0.1)
+    height = 50.0 + 10.0 * sin_t
 
-    x = radius * np.cos(t * 0.1)
-    y = radius * np.sin(t * 0.1)
+    x = radius * cos_t
+    y = radius * sin_t
     z = height
 
     # Velocity
-    vx = -radius * 0.1 * np.sin(t * 0.1)
-    vy = radius * 0.1 * np.cos(t * 0.1)
-    vz = 10.0 * 0.1 * np.cos(t * 0.1)
+    vx = -radius * 0.1 * sin_t
+    vy = radius * 0.1 * cos_t
+    vz = 10.0 * 0.1 * cos_t
 
     # Orientation (bank into turn)
-    roll = np.degrees(np.arctan2(vy, vx)) * 0.2
-    pitch = np.degrees(np.arctan2(vz, np.sqrt(vx**2 + vy**2)))
     yaw = np.degrees(np.arctan2(vy, vx))
+    roll = yaw * 0.2
+    pitch = np.degrees(np.arctan2(vz, np.sqrt(vx**2 + vy**2)))
 
-    # Compute telemetry
-    airspeed = np.sqrt(vx**2 + vy**2 + vz**2)
-
-    telemetry = {
-        'airspeed': airspeed,
-        'altitude': z,
+    return {
+        'x': x, 'y': y, 'z': z,
+        'vx': vx, 'vy': vy, 'vz': vz,
+        'roll': roll, 'pitch': pitch, 'yaw': yaw,
+        # Telemetry
+        'airspeed': np.sqrt(vx**2 + vy**2 + vz**2),
         'g_force': 1.0 + 0.1 * np.sin(t * 0.5),
         'throttle': 0.7 + 0.1 * np.sin(t * 0.3),
         'aoa': 5.0 + 2.0 * np.sin(t * 0.2),
         'aos': 0.5 * np.sin(t * 0.4),
-        'heading': yaw,
-        'vertical_speed': vz,
-        'turn_rate': np.degrees(0.1),
-        'bank_angle': roll,
-    }
-
-    # Dummy RL metrics
-    reward = 1.0 - 0.01 * np.abs(height - 50.0)  # Reward for staying at target altitude
-    action = [
-        0.1 * np.sin(t * 0.2),  # Aileron
-        0.05 * np.cos(t * 0.3),  # Elevator
-        0.02 * np.sin(t * 0.4),  # Rudder
-        0.7  # Throttle
-    ]
-
-    rl_metrics = {
-        'reward': reward,
-        'action': action,
-        'value_estimate': 10.0 + 2.0 * np.sin(t * 0.1),
-        'policy_logprob': -1.5,
-        'entropy': 0.8,
+        # Dummy RL metrics
+        'reward': 1.0 - 0.01 * np.abs(height - 50.0),  # Reward for staying at target altitude
+        'action': np.stack([
+            0.1 * np.sin(t * 0.2),  # Aileron
+            0.05 * np.cos(t * 0.3),  # Elevator
+            0.02 * np.sin(t * 0.4),  # Rudder
+            np.full(n_steps, 0.7),  # Throttle
+        ], axis=1),
+        'value_estimate': 10.0 + 2.0 * sin_t,
     }
 
-    return (x, y, z), (roll, pitch, yaw), (vx, vy, vz), telemetry, rl_metrics
-
 
 def main():
     """Run basic logging example."""
@@ -83,30 +72,52 @@ def main():
     num_episodes = 5
     steps_per_episode = 500
 
+    # Simulate the whole run up front; the loop below only indexes into it
+    flight = precompute_flight(num_episodes * steps_per_episode)
+    flight = {k: v.tolist() for k, v in flight.items()}
+
+    # FlightLogger copies values out of these dicts, so one instance of each is
+    # refilled per step instead of allocating fresh dicts
+    telemetry = {'turn_rate': math.degrees(0.1)}
+    rl_metrics = {'policy_logprob': -1.5, 'entropy': 0.8}
+
     for episode in range(num_episodes):
         print(f"\nEpisode {episode + 1}/{num_episodes}")
 
         logger.start_episode(agent_id="example_agent")
 
-        for step in range(steps_per_episode):
-            # Simulate flight
-            position, orientation, velocity, telemetry, rl_metrics = simulate_flight_step(
-                episode * steps_per_episode + step
-            )
-
-            # Log data
-            logger.log_flight_data(
-                step=step,
-                agent_id="example_agent",
-                position=position,
-                orientation=orientation,
-                velocity=velocity,
-                telemetry=telemetry,
-                rl_metrics=rl_metrics,
-            )
-
-            if step % 100 == 0:
-                print(f"  Step {step}/{steps_per_episode}")
+        # Flush once after the episode's steps instead of per step
+        with logger.batched_writes():
+            for step in range(steps_per_episode):
+                idx = episode * steps_per_episode + step
+
+                telemetry['airspeed'] = flight['airspeed'][idx]
+                telemetry['altitude'] = flight['z'][idx]
+                telemetry['g_force'] = flight['g_force'][idx]
+                telemetry['throttle'] = flight['throttle'][idx]
+                telemetry['aoa'] = flight['aoa'][idx]
+                telemetry['aos'] = flight['aos'][idx]
+                telemetry['heading'] = flight['yaw'][idx]
+                telemetry['vertical_speed'] = flight['vz'][idx]
+                telemetry['bank_angle'] = flight['roll'][idx]
+
+                rl_metrics['reward'] = flight['reward'][idx]
+                rl_metrics['action'] = flight['action'][idx]
+                rl_metrics['value_estimate'] = flight['value_estimate'][idx]
+
+                # Log data
+                logger.log_flight_data(
+                    step=step,
+                    agent_id="example_agent",
+                    position=(flight['x'][idx], flight['y'][idx], flight['z'][idx]),
+                    orientation=(flight['roll'][idx], flight['pitch'][idx], flight['yaw'][idx]),
+                    velocity=(flight['vx'][idx], flight['vy'][idx], flight['vz'][idx]),
+                    telemetry=telemetry,
+                    rl_metrics=rl_metrics,
+                )
+
+                if step % 100 == 0:
+                    print(f"  Step {step}/{steps_per_episode}")
 
         # End episode
         success = episode % 2 == 0  # Alternate success/failure
@@ -12,14 +12,30 @@ The scenario demonstrates:
 - ACMI export for Tacview visualization
 """
 
+import math
 import numpy as np
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Dict
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from tensorboard_flight import FlightLogger
+# Recorded state channels (rows of the per-aircraft SoA state array)
+X, Y, Z, HEADING, PITCH, ROLL, SPEED, THROTTLE, VX, VY, VZ = range(11)
+N_CHANNELS = 11
+
+# Aircraft axis of the combined state array
+AGG, DEF = 0, 1
 
 
 def sigmoid(x, k=1.0):
@@ -27,17 +43,26 @@ def sigmoid(x, k=1.0):
     return 1 / (1 + np.exp(-k * x))
 
 
+@njit(cache=True, fastmath=True)
+def _clip(value, lo, hi):
+    """Scalar clip usable from jitted code."""
+    return min(max(value, lo), hi)
+
+
+@njit(cache=True, fastmath=True, inline='always')
+def _wrap180(angle):
+    """Wrap an angle in degrees to [-180, 180) without a float modulo."""
+    return angle - 360.0 * math.floor((angle + 180.0) * (1.0 / 360.0))
+
+
+@njit(cache=True, fastmath=True, inline='always')
 def smooth_transition(t, t_start, duration, start_val, end_val):
     """Smoothly interpolate between values."""
-    if t < t_start:
-        return start_val
-    elif t > t_start + duration:
-        return end_val
-    else:
-        progress = (t - t_start) / duration
-        # Smooth step
-        progress = progress * progress * (3 - 2 * progress)
-        return start_val + (end_val - start_val) * progress
+    # Clamping the progress replaces the before/after branches
+    progress = min(1.0, max(0.0, (t - t_start) / duration))
+    # Smooth step
+    progress = progress * progress * (3 - 2 * progress)
+    return start_val + (end_val - start_val) * progress
 
 
 class AircraftState:
@@ -69,29 +94,209 @@ class AircraftState:
         vz = self.speed * np.sin(pitch_rad)
         return (vx, vy, vz)
 
+    def as_array(self):
+        """Return the state as a float64 array ordered by state channel."""
+        vx, vy, vz = self.get_velocity()
+        return np.array([self.x, self.y, self.z, self.heading,
+                         self.pitch, self.roll, self.speed, self.throttle,
+                         vx, vy, vz], dtype=np.float64)
 
-def generate_dogfight_scenario(duration=60.0, dt=0.05):
-    """Generate a dynamic dogfight between two aircraft.
 
-    Scenario phases:
-    1. Initial approach (0-10s): Aggressor closing on defender's 6 o'clock
-    2. Defensive break (10-20s): Defender executes hard break turn
-    3. Pursuit curves (20-35s): Aggressor follows, both maneuvering
-    4. Vertical fight (35-45s): Defender goes vertical, aggressor follows
-    5. Rolling scissors (45-55s): Close-in maneuvering
-    6. Separation (55-60s): Aircraft separate
+@njit(cache=True, fastmath=True)
+def _integrate_position(x, y, z, heading, pitch, speed, dt):
+    """Advance a position by one timestep along heading/pitch.
 
     Returns:
-        Tuple of (aggressor_data, defender_data)
+        Tuple of (x, y, z, vx, vy, vz); the velocity is returned so callers
+        never need to recompute the same trig terms.
     """
-    steps = int(duration / dt)
-    aggressor_data = []
-    defender_data = []
+    heading_rad = math.radians(heading)
+    pitch_rad = math.radians(pitch)
+    cos_pitch = math.cos(pitch_rad)
+    vx = speed * math.cos(heading_rad) * cos_pitch
+    vy = speed * math.sin(heading_rad) * cos_pitch
+    vz = speed * math.sin(pitch_rad)
+    x += vx * dt
+    y += vy * dt
+    z += vz * dt
+    # Keep altitude reasonable
+    return x, y, max(200.0, min(2000.0, z)), vx, vy, vz
+
+
+@njit(cache=True, fastmath=True)
+def _store_state(state, k, i, x, y, z, heading, pitch, roll, speed, throttle, vx, vy, vz):
+    """Write one timestep of aircraft ``k`` into column ``i`` of the SoA state array."""
+    state[k, X, i] = x
+    state[k, Y, i] = y
+    state[k, Z, i] = z
+    state[k, HEADING, i] = heading
+    state[k, PITCH, i] = pitch
+    state[k, ROLL, i] = roll
+    state[k, SPEED, i] = speed
+    state[k, THROTTLE, i] = throttle
+    state[k, VX, i] = vx
+    state[k, VY, i] = vy
+    state[k, VZ, i] = vz
+
+
+@dataclass
+class ScenarioData:
+    """Per-aircraft scenario output as float64 SoA arrays (one row per step)."""
+
+    timestamps: np.ndarray  # (N,)
+    positions: np.ndarray  # (N, 3)
+    orientations: np.ndarray  # (N, 3) roll, pitch, heading
+    velocities: np.ndarray  # (N, 3)
+    angular_velocities: np.ndarray  # (N, 3)
+    telemetry: Dict[str, np.ndarray]  # name -> (N,)
+    rl: Dict[str, Any]  # name -> (N,); 'action' is (N, 4), 'reward_components' a dict
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def as_batch(self):
+        """Return keyword arguments for ``FlightLogger.log_flight_data_batch``."""
+        return {
+            'steps': np.arange(len(self)),
+            'timestamps': self.timestamps,
+            'positions': self.positions,
+            'orientations': self.orientations,
+            'velocities': self.velocities,
+            'angular_velocities': self.angular_velocities,
+            'telemetry': self.telemetry,
+            'rl_metrics': self.rl,
+        }
+
+
+def _build_scenario_data(state, t, distance, base_reward, reward, bonus_keys, rng):
+    """Compute telemetry/RL metrics for both aircraft and every step at once.
+
+    Args:
+        state: SoA state array of shape (2, N_CHANNELS, steps), indexed by AGG/DEF
+        t: Timestamps, shape (steps,)
+        distance: Distance between the aircraft, shape (steps,)
+        base_reward: Distance-based reward term, shape (2, steps)
+        reward: Total (unclipped) step reward, shape (2, steps)
+        bonus_keys: Reward component name for ``reward - base_reward``, per aircraft
+        rng: ``np.random.Generator`` for sensor noise
 
-    # Initial positions
-    # Defender starts ahead, aggressor behind and slightly offset
-    defender = AircraftState("defender", x=0, y=0, z=500, heading=0, speed=150)
-    aggressor = AircraftState("aggressor", x=-800, y=50, z=480, heading=5, speed=180)
+    Returns:
+        Tuple of ScenarioData, one per aircraft in AGG/DEF order
+    """
+    n_aircraft, _, steps = state.shape
+    roll, pitch, speed = state[:, ROLL], state[:, PITCH], state[:, SPEED]
+    throttle, vz = state[:, THROTTLE], state[:, VZ]
+    # |(vx, vy, vz)| equals speed by construction of _integrate_position
+    airspeed = speed
+
+    # G-force estimate based on turn rate and pitch rate
+    turn_g = (speed * np.radians(np.abs(roll) * 0.2)) / 9.81
+    pull_g = 1.0 + np.abs(pitch) * 0.05
+    g_force = np.clip(pull_g + turn_g * 0.3, 1.0, 9.0)
+
+    # Angle of attack (simplified), higher in hard turns
+    aoa = np.clip(pitch + rng.normal(0.0, 0.5, size=(n_aircraft, steps))
+                  + np.where(np.abs(roll) > 45, 3.0, 0.0), -5, 25)
+
+    # Time-only signals are shared by both aircraft
+    rudder = np.broadcast_to(np.sin(t * 0.5) * 0.1, roll.shape)
+    cumulative_reward = reward * np.arange(1, steps + 1) / 100
+
+    def f64(values):
+        return np.ascontiguousarray(values, dtype=np.float64)
+
+    telemetry = {
+        'airspeed': airspeed,
+        'altitude': state[:, Z],
+        'vertical_speed': vz,
+        'heading': state[:, HEADING] % 360,
+        'bank_angle': roll,
+        'g_force': g_force,
+        'aoa': aoa,
+        'turn_rate': roll * 0.2,
+        'throttle': throttle,
+        'mach': airspeed * (1.0 / 340.0),  # Approximate
+        'aileron': roll / 90,
+        'elevator': pitch / 30,
+        'rudder': rudder,
+    }
+
+    rl = {
+        'reward': np.clip(reward, -2, 2),
+        'cumulative_reward': cumulative_reward,
+        'value_estimate': 50 + reward * 20,
+        'policy_entropy': np.broadcast_to(0.5 + 0.3 * np.sin(t * 0.1), roll.shape),
+        'distance_to_opponent': np.broadcast_to(distance, roll.shape),
+    }
+    actions = np.stack([roll / 90, pitch / 30, rudder, throttle], axis=-1)
+    energy = 0.1 * (1 - np.abs(g_force - 1) / 8)
+
+    # (aircraft, steps, 3) views of the state channels
+    positions = state[:, [X, Y, Z]].transpose(0, 2, 1)
+    orientations = state[:, [ROLL, PITCH, HEADING]].transpose(0, 2, 1)
+    velocities = state[:, [VX, VY, VZ]].transpose(0, 2, 1)
+    angular_velocities = np.stack([
+        np.broadcast_to(np.sin(t) * 5, roll.shape),
+        np.broadcast_to(np.cos(t) * 3, roll.shape),
+        roll * 0.1,
+    ], axis=-1)
+
+    timestamps = f64(t)
+    return tuple(
+        ScenarioData(
+            timestamps=timestamps,
+            positions=f64(positions[k]),
+            orientations=f64(orientations[k]),
+            velocities=f64(velocities[k]),
+            angular_velocities=f64(angular_velocities[k]),
+            telemetry={name: f64(values[k]) for name, values in telemetry.items()},
+            rl={
+                **{name: f64(values[k]) for name, values in rl.items()},
+                'action': f64(actions[k]),
+                'reward_components': {
+                    'distance': f64(base_reward[k] * 0.6),
+                    bonus_keys[k]: f64(reward[k] - base_reward[k]),
+                    'energy': f64(energy[k]),
+                },
+            },
+        )
+        for k in range(n_aircraft)
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_scenario(steps, dt, agg_init, def_init):
+    """Integrate both aircraft through the scenario phases.
+
+    Works on plain scalars so it can be compiled by Numba; without Numba (or
+    with ``NUMBA_DISABLE_JIT=1``) it runs as ordinary Python.
+
+    Args:
+        steps: Number of timesteps
+        dt: Timestep in seconds
+        agg_init: Initial aggressor state, shape (N_CHANNELS,)
+        def_init: Initial defender state, shape (N_CHANNELS,)
+
+    Returns:
+        State array of shape (2, N_CHANNELS, steps), indexed by AGG/DEF
+    """
+    state = np.empty((2, N_CHANNELS, steps))
+
+    a_x, a_y, a_z, a_heading, a_pitch, a_roll, a_speed, a_throttle = (
+        agg_init[0], agg_init[1], agg_init[2], agg_init[3],
+        agg_init[4], agg_init[5], agg_init[6], agg_init[7])
+    d_x, d_y, d_z, d_heading, d_pitch, d_roll, d_speed, d_throttle = (
+        def_init[0], def_init[1], def_init[2], def_init[3],
+        def_init[4], def_init[5], def_init[6], def_init[7])
+
+    # Loop-invariant angular rates and phase offsets
+    turn_period = 5.0  # seconds per turn reversal (phase 3)
+    turn_omega = 2.0 * math.pi / turn_period
+    scissor_freq = 0.4  # Hz (phase 5)
+    scissor_omega = 2.0 * math.pi * scissor_freq
+    sin_roll_off, cos_roll_off = math.sin(math.pi * 0.3), math.cos(math.pi * 0.3)
+    sin_turn_off, cos_turn_off = math.sin(0.5), math.cos(0.5)
+    sin_pitch_off, cos_pitch_off = math.sin(0.3), math.cos(0.3)
 
     for i in range(steps):
         t = i * dt
@@ -99,67 +304,66 @@ def generate_dogfight_scenario(duration=60.0, dt=0.05):
         # ===== PHASE 1: Initial Approach (0-10s) =====
         if t < 10:
             # Defender: Straight and level, unaware
-            defender.pitch = 0
-            defender.roll = 0
-            defender.speed = 150
+            d_pitch = 0.0
+            d_roll = 0.0
+            d_speed = 150.0
 
             # Aggressor: Closing in, slight lead pursuit
-            dx = defender.x - aggressor.x
-            dy = defender.y - aggressor.y
-            target_heading = np.degrees(np.arctan2(dy, dx))
-            aggressor.heading = smooth_transition(t, 0, 5, aggressor.heading, target_heading)
-            aggressor.speed = 180
-            aggressor.roll = (target_heading - aggressor.heading) * 0.5
+            dx = d_x - a_x
+            dy = d_y - a_y
+            target_heading = math.degrees(math.atan2(dy, dx))
+            a_heading = smooth_transition(t, 0, 5, a_heading, target_heading)
+            a_speed = 180.0
+            a_roll = (target_heading - a_heading) * 0.5
 
         # ===== PHASE 2: Defensive Break (10-20s) =====
         elif t < 20:
             phase_t = t - 10
 
             # Defender: Hard right break with pull
-            defender.roll = smooth_transition(phase_t, 0, 1, 0, 70)  # 70 deg bank
-            turn_rate = 15 * (defender.roll / 70)  # deg/s based on bank
-            defender.heading += turn_rate * dt
-            defender.pitch = smooth_transition(phase_t, 0, 2, 0, 8)  # Pull up
-            defender.speed = max(120, defender.speed - 10 * dt)  # Bleed speed in turn
-            defender.throttle = 1.0  # Full power
+            d_roll = smooth_transition(phase_t, 0, 1, 0, 70)  # 70 deg bank
+            turn_rate = 15 * (d_roll / 70)  # deg/s based on bank
+            d_heading += turn_rate * dt
+            d_pitch = smooth_transition(phase_t, 0, 2, 0, 8)  # Pull up
+            d_speed = max(120, d_speed - 10 * dt)  # Bleed speed in turn
+            d_throttle = 1.0  # Full power
 
             # Aggressor: Lag pursuit, trying to follow
-            dx = defender.x - aggressor.x
-            dy = defender.y - aggressor.y
-            target_heading = np.degrees(np.arctan2(dy, dx))
-            heading_diff = (target_heading - aggressor.heading + 180) % 360 - 180
-            aggressor.heading += np.clip(heading_diff * 0.1, -12, 12) * dt * 60
-            aggressor.roll = np.clip(heading_diff * 2, -60, 60)
-            aggressor.pitch = smooth_transition(phase_t, 1, 2, 0, 5)
-            aggressor.speed = max(140, aggressor.speed - 5 * dt)
+            dx = d_x - a_x
+            dy = d_y - a_y
+            target_heading = math.degrees(math.atan2(dy, dx))
+            heading_diff = _wrap180(target_heading - a_heading)
+            a_heading += _clip(heading_diff * 0.1, -12, 12) * dt * 60
+            a_roll = _clip(heading_diff * 2, -60, 60)
+            a_pitch = smooth_transition(phase_t, 1, 2, 0, 5)
+            a_speed = max(140, a_speed - 5 * dt)
 
         # ===== PHASE 3: Pursuit Curves (20-35s) =====
         elif t < 35:
             phase_t = t - 20
 
             # Defender: Reversing turns, trying to shake pursuit
-            turn_period = 5.0  # seconds per turn reversal
-            turn_direction = np.sin(2 * np.pi * phase_t / turn_period)
-            defender.roll = 60 * turn_direction
+            turn_direction = math.sin(turn_omega * phase_t)
+            d_roll = 60 * turn_direction
             turn_rate = 12 * turn_direction
-            defender.heading += turn_rate * dt
-            defender.pitch = 3 + 5 * np.sin(phase_t * 0.5)  # Slight climb/dive
-            defender.speed = 130 + 10 * np.cos(phase_t * 0.3)
-            defender.throttle = 0.9 + 0.1 * np.sin(phase_t)
+            d_heading += turn_rate * dt
+            d_pitch = 3 + 5 * math.sin(phase_t * 0.5)  # Slight climb/dive
+            d_speed = 130 + 10 * math.cos(phase_t * 0.3)
+            d_throttle = 0.9 + 0.1 * math.sin(phase_t)
 
             # Aggressor: Pure pursuit with lead
-            dx = defender.x - aggressor.x
-            dy = defender.y - aggressor.y
-            dz = defender.z - aggressor.z
-            target_heading = np.degrees(np.arctan2(dy, dx))
-            target_pitch = np.degrees(np.arctan2(dz, np.sqrt(dx**2 + dy**2)))
-
-            heading_diff = (target_heading - aggressor.heading + 180) % 360 - 180
-            aggressor.heading += np.clip(heading_diff * 0.15, -15, 15) * dt * 60
-            aggressor.roll = np.clip(heading_diff * 2.5, -70, 70)
-            pitch_diff = target_pitch - aggressor.pitch
-            aggressor.pitch += np.clip(pitch_diff * 0.1, -5, 5) * dt * 60
-            aggressor.speed = 160
+            dx = d_x - a_x
+            dy = d_y - a_y
+            dz = d_z - a_z
+            target_heading = math.degrees(math.atan2(dy, dx))
+            target_pitch = math.degrees(math.atan2(dz, math.sqrt(dx**2 + dy**2)))
+
+            heading_diff = _wrap180(target_heading - a_heading)
+            a_heading += _clip(heading_diff * 0.15, -15, 15) * dt * 60
+            a_roll = _clip(heading_diff * 2.5, -70, 70)
+            pitch_diff = target_pitch - a_pitch
+            a_pitch += _clip(pitch_diff * 0.1, -5, 5) * dt * 60
+            a_speed = 160.0
 
         # ===== PHASE 4: Vertical Fight (35-45s) =====
         elif t < 45:
@@ -168,173 +372,143 @@ def generate_dogfight_scenario(duration=60.0, dt=0.05):
             # Defender: Goes vertical, then over the top
             if phase_t < 5:
                 # Climb
-                defender.pitch = smooth_transition(phase_t, 0, 2, defender.pitch, 60)
-                defender.roll = smooth_transition(phase_t, 0, 1, defender.roll, 0)
-                defender.speed = max(100, defender.speed - 15 * dt)
+                d_pitch = smooth_transition(phase_t, 0, 2, d_pitch, 60)
+                d_roll = smooth_transition(phase_t, 0, 1, d_roll, 0)
+                d_speed = max(100, d_speed - 15 * dt)
             else:
                 # Over the top and reverse
-                defender.pitch = smooth_transition(phase_t, 5, 3, 60, -30)
-                defender.heading += 20 * dt  # Heading change at top
-                defender.roll = smooth_transition(phase_t, 5, 2, 0, -45)
-                defender.speed = min(160, defender.speed + 20 * dt)
-            defender.throttle = 1.0
+                d_pitch = smooth_transition(phase_t, 5, 3, 60, -30)
+                d_heading += 20 * dt  # Heading change at top
+                d_roll = smooth_transition(phase_t, 5, 2, 0, -45)
+                d_speed = min(160, d_speed + 20 * dt)
+            d_throttle = 1.0
 
             # Aggressor: Following into vertical
-            dx = defender.x - aggressor.x
-            dy = defender.y - aggressor.y
-            dz = defender.z - aggressor.z
-            target_pitch = np.degrees(np.arctan2(dz, np.sqrt(dx**2 + dy**2)))
-            target_heading = np.degrees(np.arctan2(dy, dx))
+            dx = d_x - a_x
+            dy = d_y - a_y
+            dz = d_z - a_z
+            target_pitch = math.degrees(math.atan2(dz, math.sqrt(dx**2 + dy**2)))
+            target_heading = math.degrees(math.atan2(dy, dx))
 
-            heading_diff = (target_heading - aggressor.heading + 180) % 360 - 180
-            aggressor.heading += np.clip(heading_diff * 0.12, -10, 10) * dt * 60
+            heading_diff = _wrap180(target_heading - a_heading)
+            a_heading += _clip(heading_diff * 0.12, -10, 10) * dt * 60
 
-            pitch_diff = target_pitch - aggressor.pitch
-            aggressor.pitch = smooth_transition(phase_t, 0.5, 2, aggressor.pitch,
-                                                aggressor.pitch + np.clip(pitch_diff, -40, 40))
-            aggressor.roll = np.clip(heading_diff * 2, -50, 50)
-            aggressor.speed = max(90, 160 - 10 * phase_t)
+            pitch_diff = target_pitch - a_pitch
+            a_pitch = smooth_transition(phase_t, 0.5, 2, a_pitch,
+                                                a_pitch + _clip(pitch_diff, -40, 40))
+            a_roll = _clip(heading_diff * 2, -50, 50)
+            a_speed = max(90, 160 - 10 * phase_t)
 
         # ===== PHASE 5: Rolling Scissors (45-55s) =====
         elif t < 55:
             phase_t = t - 45
 
-            # Both aircraft in close, alternating rolls
-            scissor_freq = 0.4  # Hz
+            # Both aircraft in close, alternating rolls. One sin/cos pair per
+            # base angle; the aggressor's offsets use the angle-sum identities.
+            arg = scissor_omega * phase_t
+            s, c = math.sin(arg), math.cos(arg)
+            s_half, c_half = math.sin(arg * 0.5), math.cos(arg * 0.5)
 
             # Defender
-            defender.roll = 80 * np.sin(2 * np.pi * scissor_freq * phase_t)
-            defender.heading += 8 * np.cos(2 * np.pi * scissor_freq * phase_t) * dt
-            defender.pitch = 10 + 15 * np.sin(2 * np.pi * scissor_freq * phase_t * 0.5)
-            defender.speed = 110 + 20 * np.sin(phase_t * 0.5)
-            defender.throttle = 0.7 + 0.3 * np.abs(np.sin(phase_t))
+            d_roll = 80 * s
+            d_heading += 8 * c * dt
+            d_pitch = 10 + 15 * s_half
+            d_speed = 110 + 20 * math.sin(phase_t * 0.5)
+            d_throttle = 0.7 + 0.3 * abs(math.sin(phase_t))
 
             # Aggressor: Counter-rolling
-            aggressor.roll = 75 * np.sin(2 * np.pi * scissor_freq * phase_t + np.pi * 0.3)
-            aggressor.heading += 7 * np.cos(2 * np.pi * scissor_freq * phase_t + 0.5) * dt
-            aggressor.pitch = 8 + 12 * np.sin(2 * np.pi * scissor_freq * phase_t * 0.5 + 0.3)
-            aggressor.speed = 115 + 15 * np.sin(phase_t * 0.5 + 0.2)
-            aggressor.throttle = 0.8 + 0.2 * np.abs(np.cos(phase_t))
+            a_roll = 75 * (s * cos_roll_off + c * sin_roll_off)
+            a_heading += 7 * (c * cos_turn_off - s * sin_turn_off) * dt
+            a_pitch = 8 + 12 * (s_half * cos_pitch_off + c_half * sin_pitch_off)
+            a_speed = 115 + 15 * math.sin(phase_t * 0.5 + 0.2)
+            a_throttle = 0.8 + 0.2 * abs(math.cos(phase_t))
 
         # ===== PHASE 6: Separation (55-60s) =====
         else:
             phase_t = t - 55
 
             # Defender: Break away, dive and accelerate
-            defender.roll = smooth_transition(phase_t, 0, 1, defender.roll, -30)
-            defender.pitch = smooth_transition(phase_t, 0, 2, defender.pitch, -15)
-            defender.heading += 5 * dt
-            defender.speed = min(180, defender.speed + 20 * dt)
-            defender.throttle = 1.0
+            d_roll = smooth_transition(phase_t, 0, 1, d_roll, -30)
+            d_pitch = smooth_transition(phase_t, 0, 2, d_pitch, -15)
+            d_heading += 5 * dt
+            d_speed = min(180, d_speed + 20 * dt)
+            d_throttle = 1.0
 
             # Aggressor: Break opposite direction
-            aggressor.roll = smooth_transition(phase_t, 0, 1, aggressor.roll, 25)
-            aggressor.pitch = smooth_transition(phase_t, 0, 2, aggressor.pitch, -10)
-            aggressor.heading -= 5 * dt
-            aggressor.speed = min(175, aggressor.speed + 15 * dt)
-            aggressor.throttle = 0.95
+            a_roll = smooth_transition(phase_t, 0, 1, a_roll, 25)
+            a_pitch = smooth_transition(phase_t, 0, 2, a_pitch, -10)
+            a_heading -= 5 * dt
+            a_speed = min(175, a_speed + 15 * dt)
+            a_throttle = 0.95
 
         # ===== Update Positions =====
-        for aircraft in [defender, aggressor]:
-            vx, vy, vz = aircraft.get_velocity()
-            aircraft.x += vx * dt
-            aircraft.y += vy * dt
-            aircraft.z += vz * dt
-            # Keep altitude reasonable
-            aircraft.z = max(200, min(2000, aircraft.z))
-
-        # ===== Calculate Distance =====
-        dx = defender.x - aggressor.x
-        dy = defender.y - aggressor.y
-        dz = defender.z - aggressor.z
-        distance = np.sqrt(dx**2 + dy**2 + dz**2)
-
-        # ===== Generate Telemetry =====
-        for aircraft, data_list, is_aggressor in [
-            (aggressor, aggressor_data, True),
-            (defender, defender_data, False)
-        ]:
-            vx, vy, vz = aircraft.get_velocity()
-            airspeed = np.sqrt(vx**2 + vy**2 + vz**2)
-
-            # G-force estimate based on turn rate and pitch rate
-            turn_g = (aircraft.speed * np.radians(abs(aircraft.roll) * 0.2)) / 9.81
-            pull_g = 1.0 + abs(aircraft.pitch) * 0.05
-            g_force = max(1.0, min(9.0, pull_g + turn_g * 0.3))
-
-            # Angle of attack (simplified)
-            aoa = aircraft.pitch + np.random.normal(0, 0.5)
-            if abs(aircraft.roll) > 45:
-                aoa += 3  # Higher AoA in hard turns
-
-            telemetry = {
-                'airspeed': float(airspeed),
-                'altitude': float(aircraft.z),
-                'vertical_speed': float(vz),
-                'heading': float(aircraft.heading % 360),
-                'bank_angle': float(aircraft.roll),
-                'g_force': float(g_force),
-                'aoa': float(np.clip(aoa, -5, 25)),
-                'turn_rate': float(aircraft.roll * 0.2),
-                'throttle': float(aircraft.throttle),
-                'mach': float(airspeed / 340),  # Approximate
-                'aileron': float(aircraft.roll / 90),
-                'elevator': float(aircraft.pitch / 30),
-                'rudder': float(np.sin(t * 0.5) * 0.1),
-            }
-
-            # RL metrics - different strategies for each aircraft
-            if is_aggressor:
-                # Aggressor: Reward for closing distance, penalty for losing sight
-                base_reward = 1.0 - distance / 1000  # Closer = better
-                angle_to_target = np.degrees(np.arctan2(dy, dx))
-                angle_off = abs((angle_to_target - aircraft.heading + 180) % 360 - 180)
-                tracking_bonus = max(0, 1 - angle_off / 90)
-                reward = base_reward + tracking_bonus * 0.5
-                action_label = "pursuit"
-            else:
-                # Defender: Reward for increasing distance, evading
-                base_reward = distance / 500 - 1  # Further = better
-                # Bonus for being out of aggressor's forward cone
-                evasion_bonus = 0.5 if distance > 400 else 0
-                reward = base_reward + evasion_bonus
-                action_label = "evasion"
-
-            cumulative_reward = reward * (i + 1) / 100
-
-            rl_metrics = {
-                'reward': float(np.clip(reward, -2, 2)),
-                'cumulative_reward': float(cumulative_reward),
-                'value_estimate': float(50 + reward * 20),
-                'action': [
-                    float(aircraft.roll / 90),
-                    float(aircraft.pitch / 30),
-                    float(np.sin(t * 0.5) * 0.1),
-                    float(aircraft.throttle)
-                ],
-                'policy_entropy': float(0.5 + 0.3 * np.sin(t * 0.1)),
-                'reward_components': {
-                    'distance': float(base_reward * 0.6),
-                    'tracking' if is_aggressor else 'evasion': float(reward - base_reward),
-                    'energy': float(0.1 * (1 - abs(g_force - 1) / 8)),
-                },
-                'distance_to_opponent': float(distance),
-            }
-
-            data_list.append({
-                'step': i,
-                'timestamp': t,
-                'position': aircraft.get_position(),
-                'orientation': aircraft.get_orientation(),
-                'velocity': aircraft.get_velocity(),
-                'angular_velocity': (
-                    float(np.sin(t) * 5),
-                    float(np.cos(t) * 3),
-                    float(aircraft.roll * 0.1)
-                ),
-                'telemetry': telemetry,
-                'rl_metrics': rl_metrics,
-            })
+        d_x, d_y, d_z, d_vx, d_vy, d_vz = _integrate_position(
+            d_x, d_y, d_z, d_heading, d_pitch, d_speed, dt)
+        a_x, a_y, a_z, a_vx, a_vy, a_vz = _integrate_position(
+            a_x, a_y, a_z, a_heading, a_pitch, a_speed, dt)
+
+        _store_state(state, AGG, i, a_x, a_y, a_z, a_heading, a_pitch, a_roll,
+                     a_speed, a_throttle, a_vx, a_vy, a_vz)
+        _store_state(state, DEF, i, d_x, d_y, d_z, d_heading, d_pitch, d_roll,
+                     d_speed, d_throttle, d_vx, d_vy, d_vz)
+
+    return state
+
+
+def generate_dogfight_scenario(duration=60.0, dt=0.05, seed=None):
+    """Generate a dynamic dogfight between two aircraft.
+
+    Scenario phases:
+    1. Initial approach (0-10s): Aggressor closing on defender's 6 o'clock
+    2. Defensive break (10-20s): Defender executes hard break turn
+    3. Pursuit curves (20-35s): Aggressor follows, both maneuvering
+    4. Vertical fight (35-45s): Defender goes vertical, aggressor follows
+    5. Rolling scissors (45-55s): Close-in maneuvering
+    6. Separation (55-60s): Aircraft separate
+
+    Args:
+        duration: Scenario duration in seconds
+        dt: Timestep in seconds
+        seed: Seed for the sensor-noise generator (None for nondeterministic)
+
+    Returns:
+        Tuple of (aggressor_data, defender_data) ScenarioData
+    """
+    steps = int(duration / dt)
+
+    # Initial positions
+    # Defender starts ahead, aggressor behind and slightly offset
+    defender = AircraftState("defender", x=0, y=0, z=500, heading=0, speed=150)
+    aggressor = AircraftState("aggressor", x=-800, y=50, z=480, heading=5, speed=180)
+
+    state = _simulate_scenario(
+        steps, dt, aggressor.as_array(), defender.as_array())
+
+    # ===== Derive Telemetry & RL Metrics (vectorized over all steps) =====
+    t = np.arange(steps) * dt
+    dx = state[DEF, X] - state[AGG, X]
+    dy = state[DEF, Y] - state[AGG, Y]
+    dz = state[DEF, Z] - state[AGG, Z]
+    distance = np.sqrt(dx**2 + dy**2 + dz**2)
+
+    # Aggressor: Reward for closing distance, bonus for keeping the nose on target
+    agg_base = 1.0 - distance / 1000  # Closer = better
+    angle_to_target = np.degrees(np.arctan2(dy, dx))
+    angle_off = np.abs((angle_to_target - state[AGG, HEADING] + 180) % 360 - 180)
+    tracking_bonus = np.maximum(0.0, 1 - angle_off / 90)
+    agg_reward = agg_base + tracking_bonus * 0.5
+
+    # Defender: Reward for increasing distance, evading
+    def_base = distance / 500 - 1  # Further = better
+    # Bonus for being out of aggressor's forward cone
+    evasion_bonus = np.where(distance > 400, 0.5, 0.0)
+    def_reward = def_base + evasion_bonus
+
+    rng = np.random.default_rng(seed)
+    aggressor_data, defender_data = _build_scenario_data(
+        state, t, distance,
+        np.stack([agg_base, def_base]), np.stack([agg_reward, def_reward]),
+        ('tracking', 'evasion'), rng)
 
     return aggressor_data, defender_data
 
@@ -343,11 +517,16 @@ def main():
     """Generate dogfight demo and save to example_data/."""
     import argparse
 
+    # Imported here so the scenario generator can be used without TensorBoard
+    from tensorboard_flight import FlightLogger
+
     parser = argparse.ArgumentParser(description='Generate dogfight demo data')
     parser.add_argument('--output', default='example_data/dogfight',
                         help='Output directory (default: example_data/dogfight)')
     parser.add_argument('--duration', type=float, default=60.0,
                         help='Scenario duration in seconds (default: 60)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Random seed for sensor noise (default: random)')
     args = parser.parse_args()
 
     output_dir = Path(__file__).parent.parent / args.output
@@ -360,64 +539,31 @@ def main():
     # Generate flight data
     aggressor_data, defender_data = generate_dogfight_scenario(
         duration=args.duration,
-        dt=0.05  # 20 Hz
+        dt=0.05,  # 20 Hz
+        seed=args.seed,
     )
 
     print(f"Generated {len(aggressor_data)} timesteps per aircraft")
 
-    # Create separate loggers for each agent (allows side-by-side comparison)
-    aggressor_logger = FlightLogger(log_dir=str(output_dir / "aggressor"))
-    defender_logger = FlightLogger(log_dir=str(output_dir / "defender"))
+    # One logger (one event file) for both agents; each aircraft is its own
+    # episode, tagged by agent_id, so they remain separable in the Flight tab
+    logger = FlightLogger(log_dir=str(output_dir))
 
-    # Log episodes
     print("\nLogging flight data...")
-    aggressor_logger.start_episode(agent_id="aggressor")
-    defender_logger.start_episode(agent_id="defender")
-
-    for agg, dfn in zip(aggressor_data, defender_data):
-        # Log aggressor
-        aggressor_logger.log_flight_data(
-            step=agg['step'],
-            agent_id="aggressor",
-            position=agg['position'],
-            orientation=agg['orientation'],
-            velocity=agg['velocity'],
-            angular_velocity=agg['angular_velocity'],
-            telemetry=agg['telemetry'],
-            rl_metrics=agg['rl_metrics'],
-            timestamp=agg['timestamp'],
-        )
-
-        # Log defender
-        defender_logger.log_flight_data(
-            step=dfn['step'],
-            agent_id="defender",
-            position=dfn['position'],
-            orientation=dfn['orientation'],
-            velocity=dfn['velocity'],
-            angular_velocity=dfn['angular_velocity'],
-            telemetry=dfn['telemetry'],
-            rl_metrics=dfn['rl_metrics'],
-            timestamp=dfn['timestamp'],
+    for agent_id, data, strategy in (
+        ("aggressor", aggressor_data, "pursuit"),
+        ("defender", defender_data, "evasion"),
+    ):
+        logger.start_episode(agent_id=agent_id)
+        logger.log_flight_data_batch(agent_id=agent_id, **data.as_batch())
+        logger.end_episode(
+            success=True,
+            termination_reason="scenario_complete",
+            config={'role': agent_id, 'strategy': strategy},
+            tags=['demo', 'dogfight', agent_id],
         )
 
-    # End episodes
-    aggressor_logger.end_episode(
-        success=True,
-        termination_reason="scenario_complete",
-        config={'role': 'aggressor', 'strategy': 'pursuit'},
-        tags=['demo', 'dogfight', 'aggressor'],
-    )
-
-    defender_logger.end_episode(
-        success=True,
-        termination_reason="scenario_complete",
-        config={'role': 'defender', 'strategy': 'evasion'},
-        tags=['demo', 'dogfight', 'defender'],
-    )
-
-    aggressor_logger.close()
-    defender_logger.close()
+    logger.close()
 
     # Summary
     print("\n" + "=" * 60)
@@ -425,8 +571,8 @@ def main():
     print("=" * 60)
 
     print(f"\nTensorBoard logs: {output_dir}/")
-    print(f"  - aggressor/  (pursuit strategy)")
-    print(f"  - defender/   (evasion strategy)")
+    print(f"  - aggressor_ep0  (pursuit strategy)")
+    print(f"  - defender_ep1   (evasion strategy)")
 
     print("\n" + "-" * 60)
     print("TO VIEW THE DEMO:")
@@ -435,7 +581,7 @@ def main():
     print(f"   tensorboard --logdir {output_dir}")
     print(f"\n2. Open browser to http://localhost:6006")
     print(f"   Navigate to the 'Flight' tab")
-    print(f"\n3. Select both runs to see both aircraft")
+    print(f"\n3. Select the aggressor or defender episode")
 
     print("\n" + "=" * 60)
 
@@ -1,10 +1,32 @@
 #!/usr/bin/env python3
 """Extract test data from logged TensorBoard events for frontend testing."""
 
+import gzip
 import json
+import mmap
 import sys
 from pathlib import Path
 from tensorboard.backend.event_processing import event_accumulator
+from tensorboard.compat.proto.event_pb2 import Event
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _loads(data: bytes):
+    """Decode a UTF-8 JSON payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _dumps(obj) -> bytes:
+    """Encode an object as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 def extract_flight_data(log_dir: str, output_file: str = "src/frontend/test-data.js"):
     """Extract flight episode data from TensorBoard events.
@@ -16,9 +38,6 @@ def extract_flight_data(log_dir: str, output_file: str = "src/frontend/test-data
     print(f"Loading events from: {log_dir}")
 
     # Load event files directly using protobuf
-    from pathlib import Path
-    from tensorboard.compat.proto.event_pb2 import Event
-
     event_files = list(Path(log_dir).glob("events.out.tfevents.*"))
 
     if not event_files:
@@ -31,30 +50,36 @@ def extract_flight_data(log_dir: str, output_file: str = "src/frontend/test-data
 
     episode_data = None
 
-    # Read events from the file using TFRecord format
-    import struct
-
-    with open(event_file, 'rb') as f:
-        while True:
-            # Read length (8 bytes: uint64)
-            length_bytes = f.read(8)
-            if not length_bytes:
-                break
-
-            length = struct.unpack('<Q', length_bytes)[0]
-
-            # Read CRC (4 bytes)
-            f.read(4)
-
-            # Read data
-            data = f.read(length)
-
-            # Read data CRC (4 bytes)
-            f.read(4)
+    # Read events from the file using TFRecord format. The file is mapped
+    # rather than read record by record, and CRCs are not verified.
+    if event_file.stat().st_size == 0:
+        print("Could not extract episode data from events!")
+        return
 
-            # Parse event
-            event = Event()
-            event.ParseFromString(data)
+    with open(event_file, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # The plugin name is serialized as a length-prefixed string, so a
+        # byte search locates candidate records without decoding any events;
+        # the record headers are only walked to find the enclosing record.
+        marker = b'\x06flight'
+        hit = mm.find(marker)
+        offset = 0
+        event = Event()  # Reused for every decoded record
+        while hit != -1 and offset + 12 <= len(mm):
+            # Record header: length (8 bytes: uint64) + length CRC (4 bytes)
+            length = int.from_bytes(mm[offset:offset + 8], 'little')
+            start = offset + 12
+            # Skip past data and data CRC (4 bytes)
+            offset = start + length + 4
+
+            if hit >= offset:
+                continue  # Marker lies in a later record
+            if hit < start:
+                hit = mm.find(marker, offset)
+                continue  # Marker bytes were part of the record header
+
+            # Parse event (ParseFromString clears the previous contents)
+            event.ParseFromString(mm[start:start + length])
 
             # Check if this event has summary data
             if event.HasField('summary'):
@@ -65,13 +90,15 @@ def extract_flight_data(log_dir: str, output_file: str = "src/frontend/test-data
                             plugin_data = value.metadata.plugin_data
                             if plugin_data.plugin_name == 'flight':
                                 content = plugin_data.content
-                                episode_data = json.loads(content.decode('utf-8'))
+                                episode_data = _loads(content)
                                 print(f"Found flight data in tag: {value.tag}")
                                 break
 
                 if episode_data:
                     break
 
+            hit = mm.find(marker, offset)
+
     if not episode_data:
         print("Could not extract episode data from events!")
         return
@@ -85,14 +112,21 @@ def extract_flight_data(log_dir: str, output_file: str = "src/frontend/test-data
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w') as f:
-        f.write("// Auto-generated test data from logged flight episode\n")
-        f.write("window.testFlightData = ")
-        json.dump(episode_data, f, indent=2)
-        f.write(";\n")
+    payload = b"".join([
+        b"// Auto-generated test data from logged flight episode\n",
+        b"window.testFlightData = ",
+        _dumps(episode_data),
+        b";\n",
+    ])
+    output_path.write_bytes(payload)
+
+    # Pre-compressed copy for serve_test.py to send with Content-Encoding: gzip
+    gz_path = output_path.with_name(output_path.name + '.gz')
+    gz_path.write_bytes(gzip.compress(payload, compresslevel=6))
 
     print(f"\nTest data written to: {output_path}")
-    print(f"File size: {output_path.stat().st_size / 1024:.1f} KB")
+    print(f"File size: {output_path.stat().st_size / 1024:.1f} KB "
+          f"({gz_path.stat().st_size / 1024:.1f} KB gzipped)")
 
 
 if __name__ == "__main__":
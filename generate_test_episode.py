@@ -10,6 +10,34 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from tensorboard_flight.logger import FlightLogger
 
+def _columns(t, position, orientation, velocity, angular_velocity,
+             telemetry, rl_metrics, action, reward_components):
+    """Package per-quantity arrays as ``FlightLogger.log_flight_data_batch`` arguments.
+
+    Args:
+        t: Timestamps, shape (steps,)
+        position, orientation, velocity, angular_velocity: Arrays of shape (steps, 3)
+        telemetry: Dictionary of telemetry name -> (steps,) array
+        rl_metrics: Dictionary of scalar RL metric name -> (steps,) array
+        action: Array of shape (steps, 4)
+        reward_components: Dictionary of component name -> (steps,) array
+    """
+    return {
+        'steps': np.arange(len(t)),
+        'timestamps': t,
+        'positions': position,
+        'orientations': orientation,
+        'velocities': velocity,
+        'angular_velocities': angular_velocity,
+        'telemetry': telemetry,
+        'rl_metrics': {
+            **rl_metrics,
+            'action': action,
+            'reward_components': reward_components,
+        },
+    }
+
+
 def generate_straight_flight(duration=30.0, dt=0.1):
     """Generate a simple straight-line flight pattern for debugging.
 
@@ -19,83 +47,65 @@ def generate_straight_flight(duration=30.0, dt=0.1):
     Args:
         duration: Flight duration in seconds
         dt: Time step in seconds
+
+    Returns:
+        Dictionary of columnar arrays (see ``_columns``)
     """
     steps = int(duration / dt)
+    t = np.arange(steps) * dt
 
     # Straight flight parameters
     speed = 20.0  # m/s
     altitude = 50.0  # meters
     heading = 90.0  # degrees (pointing along +Y axis in XY plane)
 
-    data = []
-
-    for i in range(steps):
-        t = i * dt
-
-        # Position: straight line along +Y axis
-        x = 0.0
-        y = speed * t
-        z = altitude
-
-        # Velocity: constant along +Y
-        vx = 0.0
-        vy = speed
-        vz = 0.0
-
-        # Orientation: no roll, no pitch, constant heading
-        roll = 0.0
-        pitch = 0.0
-        yaw = heading
-
-        # Angular velocity: zero (no rotation)
-        wx = 0.0
-        wy = 0.0
-        wz = 0.0
-
-        # Telemetry
-        airspeed = speed
-        telemetry = {
-            'airspeed': float(airspeed),
-            'altitude': float(z),
-            'vertical_speed': float(vz),
-            'heading': float(yaw),
-            'bank_angle': float(roll),
-            'g_force': 1.0,
-            'aoa': 0.0,
-            'turn_rate': 0.0,
-            'throttle': 0.7,
-            'aileron': 0.0,
-            'elevator': 0.0,
-            'rudder': 0.0,
-        }
-
-        # RL metrics
-        reward = 1.0
-        cumulative_reward = reward * (i + 1)
-
-        rl_metrics = {
-            'reward': float(reward),
-            'cumulative_reward': float(cumulative_reward),
-            'value_estimate': 50.0,
-            'action': [0.0, 0.0, 0.0, 0.7],
-            'reward_components': {
-                'altitude': 0.5,
-                'speed': 0.3,
-                'heading': 0.2,
-            }
-        }
-
-        data.append({
-            'step': i,
-            'position': (float(x), float(y), float(z)),
-            'orientation': (float(roll), float(pitch), float(yaw)),
-            'velocity': (float(vx), float(vy), float(vz)),
-            'angular_velocity': (float(wx), float(wy), float(wz)),
-            'telemetry': telemetry,
-            'rl_metrics': rl_metrics,
-        })
-
-    return data
+    zeros = np.zeros(steps)
+
+    def const(value):
+        return np.full(steps, value)
+
+    # Position: straight line along +Y axis
+    position = np.column_stack([zeros, speed * t, const(altitude)])
+    # Velocity: constant along +Y
+    velocity = np.column_stack([zeros, const(speed), zeros])
+    # Orientation: no roll, no pitch, constant heading
+    orientation = np.column_stack([zeros, zeros, const(heading)])
+    # Angular velocity: zero (no rotation)
+    angular_velocity = np.zeros((steps, 3))
+
+    # Telemetry
+    telemetry = {
+        'airspeed': const(speed),
+        'altitude': const(altitude),
+        'vertical_speed': zeros,
+        'heading': const(heading),
+        'bank_angle': zeros,
+        'g_force': const(1.0),
+        'aoa': zeros,
+        'turn_rate': zeros,
+        'throttle': const(0.7),
+        'aileron': zeros,
+        'elevator': zeros,
+        'rudder': zeros,
+    }
+
+    # RL metrics
+    reward = 1.0
+    rl_metrics = {
+        'reward': const(reward),
+        'cumulative_reward': reward * np.arange(1, steps + 1),
+        'value_estimate': const(50.0),
+    }
+
+    return _columns(
+        t, position, orientation, velocity, angular_velocity, telemetry, rl_metrics,
+        action=np.tile([0.0, 0.0, 0.0, 0.7], (steps, 1)),
+        reward_components={
+            'altitude': const(0.5),
+            'speed': const(0.3),
+            'heading': const(0.2),
+        },
+    )
 
 
 def generate_circular_flight(duration=30.0, dt=0.1):
@@ -104,8 +114,12 @@ def generate_circular_flight(duration=30.0, dt=0.1):
     Args:
         duration: Flight duration in seconds
         dt: Time step in seconds
+
+    Returns:
+        Dictionary of columnar arrays (see ``_columns``)
     """
     steps = int(duration / dt)
+    t = np.arange(steps) * dt
 
     # Circular path parameters
     radius = 100.0  # meters
@@ -113,82 +127,73 @@ def generate_circular_flight(duration=30.0, dt=0.1):
     speed = 20.0    # m/s
     angular_velocity = speed / radius  # rad/s
 
-    data = []
-
-    for i in range(steps):
-        t = i * dt
-        angle = angular_velocity * t
-
-        # Position: circular path
-        x = radius * np.cos(angle)
-        y = radius * np.sin(angle)
-        z = altitude + 5 * np.sin(2 * angle)  # Slight altitude variation
-
-        # Velocity: tangent to circle
-        vx = -speed * np.sin(angle)
-        vy = speed * np.cos(angle)
-        vz = 10 * np.cos(2 * angle) * angular_velocity  # Altitude rate
-
-        # Orientation: banking into turn
-        roll = 15.0 * np.sin(angle)  # Bank angle
-        pitch = 5.0 * np.sin(2 * angle)  # Pitch variation
-        # Yaw should match velocity direction - calculate from velocity vector
-        yaw = np.degrees(np.arctan2(vy, vx))
-
-        # Angular velocity
-        wx = 0.1 * np.sin(t)
-        wy = 0.1 * np.cos(t)
-        wz = np.degrees(angular_velocity)  # Turn rate
-
-        # Telemetry
-        airspeed = np.sqrt(vx**2 + vy**2 + vz**2)
-        telemetry = {
-            'airspeed': float(airspeed),
-            'altitude': float(z),
-            'vertical_speed': float(vz),
-            'heading': float((yaw + 360) % 360),  # Normalize to 0-360
-            'bank_angle': float(roll),
-            'g_force': float(1.0 + 0.2 * abs(np.sin(angle))),
-            'aoa': float(5.0 + 2 * np.sin(t)),
-            'turn_rate': float(wz),
-            'throttle': float(0.7 + 0.1 * np.sin(t)),
-            'aileron': float(roll / 30.0),
-            'elevator': float(pitch / 20.0),
-            'rudder': float(0.05 * np.sin(t)),
-        }
-
-        # RL metrics
-        reward = 1.0 + 0.5 * np.sin(t)  # Varying reward
-        cumulative_reward = reward * (i + 1) / steps * 100
-
-        rl_metrics = {
-            'reward': float(reward),
-            'cumulative_reward': float(cumulative_reward),
-            'value_estimate': float(50 + 10 * np.sin(t)),
-            'action': [
-                float(roll / 30.0),
-                float(pitch / 20.0),
-                float(0.05 * np.sin(t)),
-                float(0.7 + 0.1 * np.sin(t))
-            ],
-            'reward_components': {
-                'altitude': float(0.5 + 0.1 * np.sin(t)),
-                'speed': float(0.3 + 0.1 * np.cos(t)),
-                'heading': float(0.2),
-            }
-        }
-
-        data.append({
-            'step': i,
-            'position': (float(x), float(y), float(z)),
-            'orientation': (float(roll), float(pitch), float(yaw)),
-            'velocity': (float(vx), float(vy), float(vz)),
-            'angular_velocity': (float(wx), float(wy), float(wz)),
-            'telemetry': telemetry,
-            'rl_metrics': rl_metrics,
-        })
-
-    return data
+    angle = angular_velocity * t
+    sin_a, cos_a = np.sin(angle), np.cos(angle)
+    sin_2a, cos_2a = np.sin(2 * angle), np.cos(2 * angle)
+    sin_t, cos_t = np.sin(t), np.cos(t)
+
+    # Position: circular path
+    x = radius * cos_a
+    y = radius * sin_a
+    z = altitude + 5 * sin_2a  # Slight altitude variation
+
+    # Velocity: tangent to circle
+    vx = -speed * sin_a
+    vy = speed * cos_a
+    vz = 10 * cos_2a * angular_velocity  # Altitude rate
+
+    # Orientation: banking into turn
+    roll = 15.0 * sin_a  # Bank angle
+    pitch = 5.0 * sin_2a  # Pitch variation
+    # Yaw should match velocity direction - calculate from velocity vector
+    yaw = np.degrees(np.arctan2(vy, vx))
+
+    # Angular velocity
+    wx = 0.1 * sin_t
+    wy = 0.1 * cos_t
+    wz = np.full(steps, np.degrees(angular_velocity))  # Turn rate
+
+    # Telemetry
+    throttle = 0.7 + 0.1 * sin_t
+    rudder = 0.05 * sin_t
+    telemetry = {
+        'airspeed': np.sqrt(vx**2 + vy**2 + vz**2),
+        'altitude': z,
+        'vertical_speed': vz,
+        'heading': (yaw + 360) % 360,  # Normalize to 0-360
+        'bank_angle': roll,
+        'g_force': 1.0 + 0.2 * np.abs(sin_a),
+        'aoa': 5.0 + 2 * sin_t,
+        'turn_rate': wz,
+        'throttle': throttle,
+        'aileron': roll / 30.0,
+        'elevator': pitch / 20.0,
+        'rudder': rudder,
+    }
+
+    # RL metrics
+    reward = 1.0 + 0.5 * sin_t  # Varying reward
+    rl_metrics = {
+        'reward': reward,
+        'cumulative_reward': reward * np.arange(1, steps + 1) / steps * 100,
+        'value_estimate': 50 + 10 * sin_t,
+    }
+
+    return _columns(
+        t,
+        np.column_stack([x, y, z]),
+        np.column_stack([roll, pitch, yaw]),
+        np.column_stack([vx, vy, vz]),
+        np.column_stack([wx, wy, wz]),
+        telemetry,
+        rl_metrics,
+        action=np.column_stack([roll / 30.0, pitch / 20.0, rudder, throttle]),
+        reward_components={
+            'altitude': 0.5 + 0.1 * sin_t,
+            'speed': 0.3 + 0.1 * cos_t,
+            'heading': np.full(steps, 0.2),
+        },
+    )
 
 
 def main():
@@ -211,24 +216,14 @@ def main():
     else:
         flight_data = generate_circular_flight(duration=30.0, dt=0.1)
 
-    print(f"Generated {len(flight_data)} timesteps ({args.mode} pattern)")
+    n_steps = len(flight_data['steps'])
+    print(f"Generated {n_steps} timesteps ({args.mode} pattern)")
 
     # Start episode
     logger.start_episode(agent_id="test_agent")
 
     # Log all timesteps
-    for data in flight_data:
-        logger.log_flight_data(
-            step=data['step'],
-            agent_id="test_agent",
-            position=data['position'],
-            orientation=data['orientation'],
-            velocity=data['velocity'],
-            angular_velocity=data['angular_velocity'],
-            telemetry=data['telemetry'],
-            rl_metrics=data['rl_metrics'],
-            timestamp=data['step'] * 0.1,
-        )
+    logger.log_flight_data_batch(agent_id="test_agent", **flight_data)
 
     # End episode
     logger.end_episode(
@@ -237,8 +232,8 @@ def main():
     )
 
     print(f"\nFlight episode logged to: {log_dir}")
-    print(f"Total steps: {len(flight_data)}")
-    print(f"Duration: {flight_data[-1]['step'] * 0.1:.1f}s")
+    print(f"Total steps: {n_steps}")
+    print(f"Duration: {flight_data['timestamps'][-1]:.1f}s")
     print("\nNow extracting test data...")
 
     # Extract test data
@@ -43,6 +43,9 @@ setup(
             "flake8>=4.0.0",
             "mypy>=0.950",
         ],
+        "fast": [
+            "fastnumbers>=5.0.0",
+        ],
     },
     entry_points={
         "tensorboard_plugins": [
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Simple HTTP server for testing the frontend locally."""
 
+import datetime
+import email.utils
 import http.server
-import socketserver
 import os
 
 # Change to the frontend directory
@@ -10,9 +11,96 @@ os.chdir(os.path.dirname(__file__))
 
 PORT = 8080
 
-Handler = http.server.SimpleHTTPRequestHandler
 
-with socketserver.TCPServer(("", PORT), Handler) as httpd:
+def _accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header allows a gzip response.
+
+    Codings with ``q=0`` are refused; an explicit ``gzip`` entry takes
+    precedence over ``*``.
+    """
+    qvalues = {}
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[name.strip().lower()] = q
+
+    q = qvalues.get('gzip', qvalues.get('x-gzip', qvalues.get('*', 0.0)))
+    return q > 0
+
+
+class Handler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that serves pre-compressed ``<file>.gz`` siblings.
+
+    When the client accepts gzip and an up-to-date ``.gz`` copy exists next to
+    the requested file (e.g. test-data.js.gz), it is sent as-is with
+    ``Content-Encoding: gzip`` instead of the uncompressed file.
+    """
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        gz_path = path + '.gz'
+        if (not _accepts_gzip(self.headers.get('Accept-Encoding', ''))
+                or not os.path.isfile(path) or not os.path.isfile(gz_path)
+                or os.path.getmtime(gz_path) < os.path.getmtime(path)):
+            return super().send_head()
+
+        f = open(gz_path, 'rb')
+        fs = os.fstat(f.fileno())
+        if self._not_modified_since(fs.st_mtime):
+            f.close()
+            self.send_response(304)
+            self.end_headers()
+            return None
+
+        self.send_response(200)
+        self.send_header("Content-type", self.guess_type(path))
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(fs.st_size))
+        self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+        self.end_headers()
+        return f
+
+    def _not_modified_since(self, mtime):
+        """Whether If-Modified-Since covers ``mtime`` (as in send_head)."""
+        if ("If-Modified-Since" not in self.headers
+                or "If-None-Match" in self.headers):
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            ims = ims.replace(tzinfo=datetime.timezone.utc)
+        last_modified = datetime.datetime.fromtimestamp(mtime, datetime.timezone.utc)
+        return last_modified.replace(microsecond=0) <= ims
+
+    def copyfile(self, source, outputfile):
+        # Send file bodies with socket.sendfile (os.sendfile where available)
+        # instead of the read/write loop of shutil.copyfileobj
+        if outputfile is self.wfile:
+            self.wfile.flush()
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+
+    def end_headers(self):
+        # Let the browser cache assets but revalidate them (Last-Modified) on
+        # each load, so regenerated test data shows up without a hard refresh.
+        # Every response may depend on Accept-Encoding (gzip or plain body),
+        # so caches must not mix them up
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        super().end_headers()
+
+
+with http.server.ThreadingHTTPServer(("", PORT), Handler) as httpd:
     print(f"Server running at http://localhost:{PORT}/")
     print(f"Open http://localhost:{PORT}/test.html in your browser")
     print("\nPress Ctrl+C to stop")
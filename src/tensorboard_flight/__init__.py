@@ -30,29 +30,27 @@ Quick Start:
 
 __version__ = "0.1.0"
 
-from tensorboard_flight.logger import FlightLogger
-from tensorboard_flight.data.schema import (
-    FlightDataPoint,
-    FlightEpisode,
-    Orientation,
-    Telemetry,
-    RLMetrics,
-    Event,
-)
-
-# ACMI support (optional import)
-try:
-    from tensorboard_flight.acmi import (
-        ACMILogger,
-        import_acmi,
-        export_to_acmi,
-        ACMIConverter,
-    )
-    __acmi_available__ = True
-except ImportError:
-    __acmi_available__ = False
-
-__all__ = [
+import importlib
+
+# Public symbols are imported on first attribute access (PEP 562), so that
+# ``import tensorboard_flight`` does not pull in TensorBoard, protobuf or the
+# ACMI subpackage until they are actually used.
+_LAZY_IMPORTS = {
+    "FlightLogger": "tensorboard_flight.logger",
+    "FlightDataPoint": "tensorboard_flight.data.schema",
+    "FlightEpisode": "tensorboard_flight.data.schema",
+    "Orientation": "tensorboard_flight.data.schema",
+    "Telemetry": "tensorboard_flight.data.schema",
+    "RLMetrics": "tensorboard_flight.data.schema",
+    "Event": "tensorboard_flight.data.schema",
+    # ACMI support (optional)
+    "ACMILogger": "tensorboard_flight.acmi",
+    "import_acmi": "tensorboard_flight.acmi",
+    "export_to_acmi": "tensorboard_flight.acmi",
+    "ACMIConverter": "tensorboard_flight.acmi",
+}
+
+_CORE_ALL = [
     "FlightLogger",
     "FlightDataPoint",
     "FlightEpisode",
@@ -61,11 +59,41 @@ __all__ = [
     "RLMetrics",
     "Event",
 ]
+_ACMI_ALL = [
+    "ACMILogger",
+    "import_acmi",
+    "export_to_acmi",
+    "ACMIConverter",
+]
+
+
+def __getattr__(name):
+    if name == "__acmi_available__":
+        try:
+            importlib.import_module("tensorboard_flight.acmi")
+            available = True
+        except ImportError:
+            available = False
+        globals()[name] = available
+        return available
+
+    if name == "__all__":
+        # ACMI symbols are exported only if the subpackage imports, so that
+        # ``from tensorboard_flight import *`` works without the ACMI extras
+        value = list(_CORE_ALL)
+        if __getattr__("__acmi_available__"):
+            value += _ACMI_ALL
+        globals()[name] = value
+        return value
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
 
-if __acmi_available__:
-    __all__.extend([
-        "ACMILogger",
-        "import_acmi",
-        "export_to_acmi",
-        "ACMIConverter",
-    ])
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -31,7 +31,7 @@ from .geo_utils import (
     cartesian_to_geodetic,
     compute_velocity_from_airspeed,
 )
-from .parser import ACMIParser
+from .parser import ACMIParser, ObjectTrack
 from .writer import ACMIWriter
 from .converter import ACMIConverter, import_acmi, export_to_acmi
 from .logger import ACMILogger
@@ -42,6 +42,7 @@ __all__ = [
     "ACMIWriter",
     "ACMIConverter",
     "ACMILogger",
+    "ObjectTrack",
 
     # CAM schema
     "CAMKeys",
@@ -7,9 +7,13 @@ The CAM addendum is fully backward-compatible with standard ACMI viewers (Tacvie
 which simply ignore unknown properties.
 """
 
-from typing import Dict, Any, List, Optional
+import functools
+import sys
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 
 class CAMKeys:
     """Canonical CAM property keys following the addendum specification.
@@ -76,6 +80,79 @@ class CAMKeys:
     CONFIDENCE_STD = "Agent.ConfidenceStd"
 
 
+# Dotted prefixes for the open-ended key families, built once at import time
+_ACTION_PREFIX_DOT = CAMKeys.ACTION_PREFIX + "."
+_REWARD_PREFIX_DOT = CAMKeys.REWARD_COMPONENT_PREFIX + "."
+_CONFIG_PREFIX_DOT = CAMKeys.CONFIG_PREFIX + "."
+
+
+@functools.lru_cache(maxsize=64)
+def _action_keys(n: int) -> Tuple[str, ...]:
+    """Return the CAM keys Agent.Action.0 .. Agent.Action.<n-1>.
+
+    Action dimensionality is fixed for an agent, so the keys are built once
+    per size instead of once per element per record. The keys are interned,
+    like the property names produced by ACMIParser, so lookups between the
+    two compare by identity.
+    """
+    return tuple(sys.intern(f"{_ACTION_PREFIX_DOT}{i}") for i in range(n))
+
+
+@functools.lru_cache(maxsize=128)
+def _reward_component_key(component: str) -> str:
+    """Map a reward component name to its Agent.Reward.<Component> key.
+
+    Component names repeat on every step of an episode, so the normalized
+    key is memoized rather than rebuilt per record.
+    """
+    # Capitalize first letter for consistency
+    return sys.intern(_REWARD_PREFIX_DOT + component.replace("_", "").capitalize())
+
+
+# Scalar RL metric keys -> RLMetrics field names, used by the decoder so each
+# property is classified with a single dict lookup.
+_RL_METRIC_FIELDS = {
+    CAMKeys.REWARD_INSTANT: 'reward',
+    CAMKeys.REWARD_CUM: 'cumulative_reward',
+    CAMKeys.VALUE: 'value_estimate',
+    CAMKeys.LOG_PROB: 'policy_logprob',
+    CAMKeys.ADVANTAGE: 'advantage',
+    CAMKeys.ENTROPY: 'entropy',
+}
+
+# (attribute, CAM key) pairs for fields that are only emitted when set
+_OPTIONAL_RL_FIELDS = (
+    ('value_estimate', CAMKeys.VALUE),
+    ('policy_logprob', CAMKeys.LOG_PROB),
+    ('advantage', CAMKeys.ADVANTAGE),
+    ('entropy', CAMKeys.ENTROPY),
+)
+# Common spellings of a true Agent.Success string, checked before the
+# case-insensitive comparison
+_TRUE_VALUES = frozenset({'true', 'True', 'TRUE'})
+
+_ANGULAR_VEL_KEYS = (
+    CAMKeys.ANGULAR_VEL_P,
+    CAMKeys.ANGULAR_VEL_Q,
+    CAMKeys.ANGULAR_VEL_R,
+)
+_CONTROL_FIELDS = (
+    ('aileron', CAMKeys.CONTROL_AILERON),
+    ('elevator', CAMKeys.CONTROL_ELEVATOR),
+    ('rudder', CAMKeys.CONTROL_RUDDER),
+)
+
+# Fixed CAM keys -> (section, field) of the CAMDecoder.decode_all result,
+# so the fused decoder classifies each property with a single dict lookup.
+# Angular velocity fields are indices into the (p, q, r) rates.
+_DECODE_FIELDS = {
+    **{key: ('rl_metrics', field) for key, field in _RL_METRIC_FIELDS.items()},
+    **{key: ('telemetry', attr) for attr, key in _CONTROL_FIELDS},
+    **{key: ('angular_velocity', i) for i, key in enumerate(_ANGULAR_VEL_KEYS)},
+    CAMKeys.G_FORCE: ('telemetry', 'g_force'),
+}
+
+
 class CAMEncoder:
     """Encode Flight Plugin data structures to CAM properties.
 
@@ -92,33 +169,31 @@ class CAMEncoder:
         Returns:
             Dictionary of CAM properties
         """
-        props = {}
-
         # Core metrics
-        props[CAMKeys.REWARD_INSTANT] = float(rl_metrics.reward)
-        props[CAMKeys.REWARD_CUM] = float(rl_metrics.cumulative_reward)
+        props = {
+            CAMKeys.REWARD_INSTANT: float(rl_metrics.reward),
+            CAMKeys.REWARD_CUM: float(rl_metrics.cumulative_reward),
+        }
 
         # Action array -> Agent.Action.0, Agent.Action.1, ...
-        for i, action_val in enumerate(rl_metrics.action):
-            props[f"{CAMKeys.ACTION_PREFIX}.{i}"] = float(action_val)
+        action = rl_metrics.action
+        if hasattr(action, 'astype'):
+            # numpy array: one C-level conversion to Python floats
+            action = action.astype(float, copy=False).tolist()
+        else:
+            action = list(map(float, action))
+        props.update(zip(_action_keys(len(action)), action))
 
         # Optional metrics
-        if rl_metrics.value_estimate is not None:
-            props[CAMKeys.VALUE] = float(rl_metrics.value_estimate)
-        if rl_metrics.policy_logprob is not None:
-            props[CAMKeys.LOG_PROB] = float(rl_metrics.policy_logprob)
-        if rl_metrics.advantage is not None:
-            props[CAMKeys.ADVANTAGE] = float(rl_metrics.advantage)
-        if rl_metrics.entropy is not None:
-            props[CAMKeys.ENTROPY] = float(rl_metrics.entropy)
+        for attr, key in _OPTIONAL_RL_FIELDS:
+            value = getattr(rl_metrics, attr)
+            if value is not None:
+                props[key] = float(value)
 
         # Reward components dict -> Agent.Reward.<Component>
         if rl_metrics.reward_components:
             for component, value in rl_metrics.reward_components.items():
-                # Capitalize first letter for consistency
-                component_key = component.replace("_", "").capitalize()
-                key = f"{CAMKeys.REWARD_COMPONENT_PREFIX}.{component_key}"
-                props[key] = float(value)
+                props[_reward_component_key(component)] = float(value)
 
         return props
 
@@ -132,16 +207,11 @@ class CAMEncoder:
         Returns:
             Dictionary of control surface CAM properties
         """
-        props = {}
-
-        if telemetry.aileron is not None:
-            props[CAMKeys.CONTROL_AILERON] = float(telemetry.aileron)
-        if telemetry.elevator is not None:
-            props[CAMKeys.CONTROL_ELEVATOR] = float(telemetry.elevator)
-        if telemetry.rudder is not None:
-            props[CAMKeys.CONTROL_RUDDER] = float(telemetry.rudder)
-
-        return props
+        return {
+            key: float(value)
+            for attr, key in _CONTROL_FIELDS
+            if (value := getattr(telemetry, attr)) is not None
+        }
 
     @staticmethod
     def encode_angular_velocity(angular_vel: tuple) -> Dict[str, Any]:
@@ -153,12 +223,7 @@ class CAMEncoder:
         Returns:
             Dictionary of angular velocity CAM properties
         """
-        p, q, r = angular_vel
-        return {
-            CAMKeys.ANGULAR_VEL_P: float(p),
-            CAMKeys.ANGULAR_VEL_Q: float(q),
-            CAMKeys.ANGULAR_VEL_R: float(r),
-        }
+        return dict(zip(_ANGULAR_VEL_KEYS, map(float, angular_vel)))
 
     @staticmethod
     def encode_episode_metadata(episode) -> Dict[str, Any]:
@@ -182,7 +247,7 @@ class CAMEncoder:
         # Config dict -> Agent.Config.key
         if episode.config:
             for key, value in episode.config.items():
-                props[f"{CAMKeys.CONFIG_PREFIX}.{key}"] = value
+                props[f"{_CONFIG_PREFIX_DOT}{key}"] = value
 
         return props
 
@@ -213,6 +278,239 @@ class CAMEncoder:
         """
         return {CAMKeys.G_FORCE: float(g_force)}
 
+    @staticmethod
+    def encode_episode_columns(episode) -> Dict[str, np.ndarray]:
+        """Encode the per-timestep CAM properties of a whole episode as columns.
+
+        Produces the same keys, in the same order, as calling encode_g_force,
+        encode_angular_velocity, encode_control_surfaces and encode_rl_metrics
+        on each datapoint, but as one float64 array per key instead of one
+        dict per timestep. Timesteps where a property is absent hold NaN.
+
+        Args:
+            episode: FlightEpisode instance
+
+        Returns:
+            Dictionary mapping CAM key to a float64 array of len(trajectory)
+        """
+        trajectory = episode.trajectory
+        n = len(trajectory)
+        nan = float('nan')
+
+        # None converts to NaN when building float64 arrays
+        columns = {
+            CAMKeys.G_FORCE: np.array(
+                [dp.telemetry.g_force for dp in trajectory], dtype=np.float64
+            ),
+        }
+
+        # Angular velocity (body rates)
+        rates = [dp.angular_velocity for dp in trajectory]
+        if any(pqr is not None for pqr in rates):
+            rates = np.array(
+                [pqr if pqr is not None else (nan, nan, nan) for pqr in rates],
+                dtype=np.float64,
+            )
+            columns.update(zip(_ANGULAR_VEL_KEYS, rates.T))
+
+        # Control surfaces
+        for attr, key in _CONTROL_FIELDS:
+            column = np.array(
+                [getattr(dp.telemetry, attr) for dp in trajectory], dtype=np.float64
+            )
+            if not np.isnan(column).all():
+                columns[key] = column
+
+        # RL metrics
+        metrics = [dp.rl_metrics for dp in trajectory]
+        present = [m for m in metrics if m]
+        if not present:
+            return columns
+
+        # Action matrix (N, A), padded with NaN for missing or shorter actions
+        width = max(len(m.action) for m in present)
+        actions = np.full((n, width), nan)
+        for i, m in enumerate(metrics):
+            if m:
+                actions[i, :len(m.action)] = m.action
+
+        optional = {}
+        for attr, _ in _OPTIONAL_RL_FIELDS:
+            column = np.array(
+                [getattr(m, attr) if m else None for m in metrics], dtype=np.float64
+            )
+            if not np.isnan(column).all():
+                optional[attr] = column
+
+        # Reward components, in first-seen order
+        reward_components = {}
+        for i, m in enumerate(metrics):
+            if m and m.reward_components:
+                for component, value in m.reward_components.items():
+                    if component not in reward_components:
+                        reward_components[component] = np.full(n, nan)
+                    reward_components[component][i] = value
+
+        columns.update(CAMEncoder.encode_rl_metrics_columns(
+            rewards=[m.reward if m else None for m in metrics],
+            cumulative_rewards=[m.cumulative_reward if m else None for m in metrics],
+            actions=actions,
+            reward_components=reward_components,
+            **optional,
+        ))
+        return columns
+
+    @staticmethod
+    def encode_rl_metrics_columns(
+        rewards,
+        cumulative_rewards,
+        actions,
+        value_estimate=None,
+        policy_logprob=None,
+        advantage=None,
+        entropy=None,
+        reward_components: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Encode a batch of RL metrics given as per-timestep arrays.
+
+        Column-wise counterpart of encode_rl_metrics for training loops that
+        already hold their rollouts as arrays: every conversion is a single
+        numpy cast instead of one float() per value per step.
+
+        Args:
+            rewards: (N,) step rewards
+            cumulative_rewards: (N,) cumulative rewards
+            actions: (N, A) actions
+            value_estimate: Optional (N,) value estimates
+            policy_logprob: Optional (N,) action log probabilities
+            advantage: Optional (N,) advantage estimates
+            entropy: Optional (N,) policy entropies
+            reward_components: Optional dict of component name -> (N,) values
+
+        Returns:
+            Dictionary mapping CAM key to a float64 array of length N, in the
+            same key order as encode_rl_metrics
+        """
+        actions = np.asarray(actions, dtype=np.float64)
+        columns = {
+            CAMKeys.REWARD_INSTANT: np.asarray(rewards, dtype=np.float64),
+            CAMKeys.REWARD_CUM: np.asarray(cumulative_rewards, dtype=np.float64),
+        }
+        columns.update(zip(_action_keys(actions.shape[1]), actions.T))
+
+        optional = {
+            'value_estimate': value_estimate,
+            'policy_logprob': policy_logprob,
+            'advantage': advantage,
+            'entropy': entropy,
+        }
+        for attr, key in _OPTIONAL_RL_FIELDS:
+            if optional[attr] is not None:
+                columns[key] = np.asarray(optional[attr], dtype=np.float64)
+
+        if reward_components:
+            for component, values in reward_components.items():
+                columns[_reward_component_key(component)] = np.asarray(
+                    values, dtype=np.float64
+                )
+
+        return columns
+
+
+@functools.lru_cache(maxsize=32)
+def _specialized_rl_decoder(keys: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build an RL metrics decoder for property dicts with exactly these keys.
+
+    All key classification (core metric, action index, reward component) is
+    done here once per key set, so the returned closure only indexes the
+    known keys.
+    """
+    key_set = frozenset(keys)
+    fields = [(key, field) for key, field in _RL_METRIC_FIELDS.items() if key in key_set]
+
+    # Action keys are contiguous from Agent.Action.0
+    action_keys = []
+    for key in _action_keys(len(keys)):
+        if key not in key_set:
+            break
+        action_keys.append(key)
+
+    components = [
+        (key, key.rpartition('.')[2].lower())
+        for key in keys
+        if key.startswith(_REWARD_PREFIX_DOT) and key not in _RL_METRIC_FIELDS
+    ]
+
+    def decode(props: Dict[str, Any]) -> Dict[str, Any]:
+        metrics = {'reward': 0.0, 'cumulative_reward': 0.0}
+        for key, field in fields:
+            metrics[field] = float(props[key])
+
+        if action_keys:
+            metrics['action'] = [float(props[key]) for key in action_keys]
+        else:
+            # Default action if not present
+            metrics['action'] = [0.0, 0.0, 0.0, 0.5]
+
+        if components:
+            metrics['reward_components'] = {
+                component: float(props[key]) for key, component in components
+            }
+        return metrics
+
+    return decode
+
+
+@functools.lru_cache(maxsize=32)
+def _specialized_decoder(keys: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build a decode_all equivalent for property dicts with exactly these keys."""
+    key_set = frozenset(keys)
+    decode_rl_metrics = _specialized_rl_decoder(keys)
+    rate_keys = [(i, key) for i, key in enumerate(_ANGULAR_VEL_KEYS) if key in key_set]
+    telemetry_fields = [(attr, key) for attr, key in _CONTROL_FIELDS if key in key_set]
+    if CAMKeys.G_FORCE in key_set:
+        telemetry_fields.append(('g_force', CAMKeys.G_FORCE))
+
+    def decode(props: Dict[str, Any]) -> Dict[str, Any]:
+        rates = [0.0, 0.0, 0.0]
+        for i, key in rate_keys:
+            rates[i] = float(props[key])
+        telemetry = {'g_force': 1.0}
+        for attr, key in telemetry_fields:
+            telemetry[attr] = float(props[key])
+        return {
+            'angular_velocity': tuple(rates),
+            'telemetry': telemetry,
+            'rl_metrics': decode_rl_metrics(props),
+        }
+
+    return decode
+
+
+def _finish_rl_metrics(
+    metrics: Dict[str, Any],
+    action_by_idx: Dict[int, float],
+    reward_components: Dict[str, float],
+) -> Dict[str, Any]:
+    """Add the action array and reward components collected by a decoder pass."""
+    # Action array - Agent.Action.0 .. Agent.Action.N without gaps
+    action = []
+    for i in range(len(action_by_idx)):
+        if i not in action_by_idx:
+            break
+        action.append(action_by_idx[i])
+
+    if action:
+        metrics['action'] = action
+    else:
+        # Default action if not present
+        metrics['action'] = [0.0, 0.0, 0.0, 0.5]
+
+    if reward_components:
+        metrics['reward_components'] = reward_components
+
+    return metrics
+
 
 class CAMDecoder:
     """Decode CAM properties to Flight Plugin data structures.
@@ -221,65 +519,104 @@ class CAMDecoder:
     """
 
     @staticmethod
-    def decode_rl_metrics(props: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract RL metrics from CAM properties.
+    def make_specialized(keys: Iterable[str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Return a decode_rl_metrics equivalent specialized to one key set.
+
+        ACMI objects repeat the same property keys on every record, so the
+        prefix matching of decode_rl_metrics can be done once per key set.
+        Decoders are cached by key set.
 
         Args:
-            props: Dictionary of ACMI properties (may contain CAM keys)
+            keys: Property keys of the records to decode (in record order)
 
         Returns:
-            Dictionary suitable for creating RLMetrics dataclass
+            Function mapping a props dict with exactly these keys to the same
+            dictionary decode_rl_metrics would return
         """
-        metrics = {}
+        return _specialized_rl_decoder(tuple(keys))
 
-        # Core metrics
-        if CAMKeys.REWARD_INSTANT in props:
-            metrics['reward'] = float(props[CAMKeys.REWARD_INSTANT])
-        else:
-            metrics['reward'] = 0.0  # Default if not present
+    @staticmethod
+    def make_specialized_all(keys: Iterable[str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Return a decode_all equivalent specialized to one key set.
 
-        if CAMKeys.REWARD_CUM in props:
-            metrics['cumulative_reward'] = float(props[CAMKeys.REWARD_CUM])
-        else:
-            metrics['cumulative_reward'] = 0.0
+        Args:
+            keys: Property keys of the records to decode (in record order)
 
-        # Action array - collect Agent.Action.N
-        action = []
-        i = 0
-        while f"{CAMKeys.ACTION_PREFIX}.{i}" in props:
-            action.append(float(props[f"{CAMKeys.ACTION_PREFIX}.{i}"]))
-            i += 1
+        Returns:
+            Function mapping a props dict with exactly these keys to the same
+            dictionary decode_all would return
+        """
+        return _specialized_decoder(tuple(keys))
 
-        if action:
-            metrics['action'] = action
-        else:
-            # Default action if not present
-            metrics['action'] = [0.0, 0.0, 0.0, 0.5]
+    @staticmethod
+    def decode_all(props: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode all per-record CAM fields in a single pass over the properties.
 
-        # Optional metrics
-        if CAMKeys.VALUE in props:
-            metrics['value_estimate'] = float(props[CAMKeys.VALUE])
-        if CAMKeys.LOG_PROB in props:
-            metrics['policy_logprob'] = float(props[CAMKeys.LOG_PROB])
-        if CAMKeys.ADVANTAGE in props:
-            metrics['advantage'] = float(props[CAMKeys.ADVANTAGE])
-        if CAMKeys.ENTROPY in props:
-            metrics['entropy'] = float(props[CAMKeys.ENTROPY])
-
-        # Reward components - find all Agent.Reward.<Component>
-        # Skip REWARD_INSTANT and REWARD_CUM
+        Equivalent to calling decode_angular_velocity, decode_g_force,
+        decode_control_surfaces and decode_rl_metrics separately.
+
+        Args:
+            props: Dictionary of ACMI properties (may contain CAM keys)
+
+        Returns:
+            Dictionary with 'angular_velocity' (p, q, r) tuple, 'telemetry'
+            dict (g_force and any control surfaces) and 'rl_metrics' dict
+        """
+        rates = [0.0, 0.0, 0.0]
+        sections = {
+            'angular_velocity': rates,
+            'telemetry': {'g_force': 1.0},
+            'rl_metrics': {'reward': 0.0, 'cumulative_reward': 0.0},
+        }
+        action_by_idx = {}
         reward_components = {}
+
         for key, value in props.items():
-            if key.startswith(f"{CAMKeys.REWARD_COMPONENT_PREFIX}."):
-                # Skip the core metrics
-                if key not in [CAMKeys.REWARD_INSTANT, CAMKeys.REWARD_CUM]:
-                    component = key.split('.')[-1].lower()
-                    reward_components[component] = float(value)
+            target = _DECODE_FIELDS.get(key)
+            if target is not None:
+                section, field = target
+                sections[section][field] = float(value)
+            elif key.startswith(_ACTION_PREFIX_DOT):
+                index = key[len(_ACTION_PREFIX_DOT):]
+                if index.isdigit():
+                    action_by_idx[int(index)] = float(value)
+            elif key.startswith(_REWARD_PREFIX_DOT):
+                component = key.rpartition('.')[2].lower()
+                reward_components[component] = float(value)
+
+        sections['angular_velocity'] = tuple(rates)
+        _finish_rl_metrics(sections['rl_metrics'], action_by_idx, reward_components)
+        return sections
 
-        if reward_components:
-            metrics['reward_components'] = reward_components
+    @staticmethod
+    def decode_rl_metrics(props: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract RL metrics from CAM properties.
 
-        return metrics
+        Args:
+            props: Dictionary of ACMI properties (may contain CAM keys)
+
+        Returns:
+            Dictionary suitable for creating RLMetrics dataclass
+        """
+        metrics = {'reward': 0.0, 'cumulative_reward': 0.0}
+        action_by_idx = {}
+        reward_components = {}
+
+        # Single pass over the properties: core metrics are looked up in the
+        # dispatch table, actions and reward components are matched by prefix.
+        for key, value in props.items():
+            field = _RL_METRIC_FIELDS.get(key)
+            if field is not None:
+                metrics[field] = float(value)
+            elif key.startswith(_ACTION_PREFIX_DOT):
+                index = key[len(_ACTION_PREFIX_DOT):]
+                if index.isdigit():
+                    action_by_idx[int(index)] = float(value)
+            elif key.startswith(_REWARD_PREFIX_DOT):
+                component = key.rpartition('.')[2].lower()
+                reward_components[component] = float(value)
+
+        return _finish_rl_metrics(metrics, action_by_idx, reward_components)
 
     @staticmethod
     def decode_control_surfaces(props: Dict[str, Any]) -> Dict[str, Optional[float]]:
@@ -334,27 +671,26 @@ class CAMDecoder:
         if CAMKeys.EPISODE_NUM in props:
             metadata['episode_number'] = int(props[CAMKeys.EPISODE_NUM])
 
-        # Tags
-        if CAMKeys.TAGS in props:
-            tags_str = str(props[CAMKeys.TAGS]).strip('"')
-            metadata['tags'] = [tag.strip() for tag in tags_str.split(',')]
+        # Tags (empty entries dropped)
+        tags = props.get(CAMKeys.TAGS)
+        if tags:
+            tags = tags.strip('"') if isinstance(tags, str) else str(tags)
+            metadata['tags'] = [tag for tag in map(str.strip, tags.split(',')) if tag]
 
         # Config dict - collect Agent.Config.*
         config = {}
         for key, value in props.items():
-            if key.startswith(f"{CAMKeys.CONFIG_PREFIX}."):
-                config_key = key.split('.')[-1]
-                config[config_key] = value
+            if key.startswith(_CONFIG_PREFIX_DOT):
+                config[key.rpartition('.')[2]] = value
         if config:
             metadata['config'] = config
 
         # Termination
         if CAMKeys.SUCCESS in props:
-            success_val = props[CAMKeys.SUCCESS]
-            if isinstance(success_val, str):
-                metadata['success'] = success_val.lower() == 'true'
-            else:
-                metadata['success'] = bool(success_val)
+            success = props[CAMKeys.SUCCESS]
+            if isinstance(success, str):
+                success = success in _TRUE_VALUES or success.lower() == 'true'
+            metadata['success'] = bool(success)
 
         if CAMKeys.TERM_REASON in props:
             metadata['termination_reason'] = str(props[CAMKeys.TERM_REASON]).strip('"')
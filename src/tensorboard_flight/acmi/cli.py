@@ -4,6 +4,7 @@ This module provides CLI tools for working with ACMI files from the command line
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -20,6 +21,7 @@ def cmd_import(args):
         acmi_file=args.input,
         output_dir=args.output,
         agent_prefix=args.prefix,
+        use_cache=args.cache,
     )
 
     print(f"\n✓ Successfully imported {count} episode(s)")
@@ -38,6 +40,7 @@ def cmd_batch_import(args):
         acmi_dir=args.input_dir,
         output_dir=args.output,
         pattern=args.pattern,
+        max_workers=args.workers or os.cpu_count(),
     )
 
     print(f"\n✓ Successfully imported {count} total episode(s)")
@@ -60,60 +63,62 @@ def cmd_info(args):
     print(f"Parsing ACMI file: {args.input}")
 
     parser = ACMIParser()
-    data = parser.parse_file(args.input)
 
-    # Display file info
-    print("\n" + "="*60)
-    print("ACMI File Information")
-    print("="*60)
+    # Stream the states; the parser keeps per-object summaries and only the
+    # CAM keys seen in the first 10 states of each object are collected here
+    seen_keys = set()
+    cam_keys = set()
+    for obj_id, state in parser.iter_records(args.input):
+        if parser.object_summaries[obj_id].count <= 10:  # Check first 10 states
+            # Each distinct key is prefix-checked once; repeats cost one hash
+            new_keys = state.keys() - seen_keys
+            if new_keys:
+                seen_keys |= new_keys
+                cam_keys.update(key for key in new_keys if key.startswith('Agent.'))
+
+    # Display file info (collected and written to stdout in one call)
+    out = []
+    out.append("\n" + "="*60)
+    out.append("ACMI File Information")
+    out.append("="*60)
 
     # Global properties
-    print("\nGlobal Properties:")
-    for key, value in data['global'].items():
-        print(f"  {key}: {value}")
+    out.append("\nGlobal Properties:")
+    for key, value in parser.global_properties.items():
+        out.append(f"  {key}: {value}")
 
     # Objects
-    print(f"\nObjects: {len(data['objects'])}")
-    object_names = parser.get_all_object_names()
-    for obj_id, name in object_names.items():
-        state_count = len(data['objects'][obj_id])
-        duration = 0.0
-        if state_count > 0:
-            first = data['objects'][obj_id][0]['timestamp']
-            last = data['objects'][obj_id][-1]['timestamp']
-            duration = last - first
-
-        print(f"  {obj_id} ({name}): {state_count} states, {duration:.1f}s duration")
+    out.append(f"\nObjects: {len(parser.object_summaries)}")
+    for obj_id, summary in parser.object_summaries.items():
+        if not summary.name:
+            continue
+        duration = summary.last_ts - summary.first_ts
+        out.append(f"  {obj_id} ({summary.name}): {summary.count} states, {duration:.1f}s duration")
 
     # Events
-    if data['events']:
-        print(f"\nEvents: {len(data['events'])}")
-        for event in data['events'][:5]:  # Show first 5
-            print(f"  [{event['timestamp']:.1f}s] {event['type']}: {event.get('message', '')}")
-        if len(data['events']) > 5:
-            print(f"  ... and {len(data['events']) - 5} more")
+    events = parser.events
+    if events:
+        out.append(f"\nEvents: {len(events)}")
+        for event in events[:5]:  # Show first 5
+            out.append(f"  [{event['timestamp']:.1f}s] {event['type']}: {event.get('message', '')}")
+        if len(events) > 5:
+            out.append(f"  ... and {len(events) - 5} more")
 
     # Check for CAM metadata
-    print("\nCAM Metadata Detection:")
-    has_cam = False
-    cam_keys = set()
-
-    for obj_id, states in data['objects'].items():
-        for state in states[:10]:  # Check first 10 states
-            for key in state.keys():
-                if key.startswith('Agent.'):
-                    has_cam = True
-                    cam_keys.add(key)
+    out.append("\nCAM Metadata Detection:")
+    has_cam = bool(cam_keys)
 
     if has_cam:
-        print("  ✓ CAM metadata detected")
-        print(f"  Found {len(cam_keys)} unique Agent.* keys:")
+        out.append("  ✓ CAM metadata detected")
+        out.append(f"  Found {len(cam_keys)} unique Agent.* keys:")
         for key in sorted(cam_keys)[:10]:
-            print(f"    - {key}")
+            out.append(f"    - {key}")
         if len(cam_keys) > 10:
-            print(f"    ... and {len(cam_keys) - 10} more")
+            out.append(f"    ... and {len(cam_keys) - 10} more")
     else:
-        print("  ✗ No CAM metadata found (standard ACMI)")
+        out.append("  ✗ No CAM metadata found (standard ACMI)")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cmd_validate(args):
@@ -122,31 +127,34 @@ def cmd_validate(args):
 
     try:
         parser = ACMIParser()
-        data = parser.parse_file(args.input)
 
-        print("\n✓ File format is valid")
-        print(f"  Objects: {len(data['objects'])}")
-        print(f"  Events: {len(data['events'])}")
+        # Stream the states; only the first state of each object is inspected
+        has_position = {}  # obj_id -> first state has position data
+        for obj_id, state in parser.iter_records(args.input):
+            if obj_id not in has_position:
+                has_position[obj_id] = 'Latitude' in state
+
+        out = []
+        out.append("\n✓ File format is valid")
+        out.append(f"  Objects: {len(has_position)}")
+        out.append(f"  Events: {len(parser.events)}")
 
         # Check for common issues
         warnings = []
 
-        # Check for empty objects
-        for obj_id, states in data['objects'].items():
-            if len(states) == 0:
-                warnings.append(f"Object {obj_id} has no states")
-
         # Check for missing critical properties
-        for obj_id, states in data['objects'].items():
-            if states and 'Latitude' not in states[0]:
+        for obj_id, positioned in has_position.items():
+            if not positioned:
                 warnings.append(f"Object {obj_id} missing position data")
 
         if warnings:
-            print("\nWarning: Warnings:")
+            out.append("\nWarning: Warnings:")
             for warning in warnings:
-                print(f"  - {warning}")
+                out.append(f"  - {warning}")
         else:
-            print("\n✓ No issues detected")
+            out.append("\n✓ No issues detected")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     except Exception as e:
         print(f"\n✗ Validation failed: {e}")
@@ -159,7 +167,7 @@ def cmd_convert(args):
 
     # Import
     converter = ACMIConverter()
-    episodes = converter.acmi_to_episodes(args.input)
+    episodes = converter.acmi_to_episodes(args.input, use_cache=args.cache)
 
     print(f"  Loaded {len(episodes)} episode(s)")
 
@@ -178,8 +186,68 @@ def cmd_convert(args):
         print("  Removed temporary file")
 
 
-def main():
+def _add_import_args(parser):
+    """Register arguments for the import command."""
+    parser.add_argument('input', help='Input ACMI file (.txt.acmi)')
+    parser.add_argument('--output', '-o', default='runs/imported',
+                        help='Output TensorBoard directory (default: runs/imported)')
+    parser.add_argument('--prefix', '-p', default='acmi',
+                        help='Agent ID prefix (default: acmi)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse a parsed-file cache, writing <input>.cache.json '
+                             'next to the input file')
+
+
+def _add_batch_import_args(parser):
+    """Register arguments for the batch-import command."""
+    parser.add_argument('input_dir', help='Input directory containing ACMI files')
+    parser.add_argument('--output', '-o', default='runs/imported',
+                        help='Output TensorBoard directory (default: runs/imported)')
+    parser.add_argument('--pattern', '-p', default='*.txt.acmi',
+                        help='File pattern (default: *.txt.acmi)')
+    parser.add_argument('--workers', '-j', type=int, default=None,
+                        help='Parallel worker processes (default: CPU count)')
+
+
+def _add_export_args(parser):
+    """Register arguments for the export command."""
+    parser.add_argument('--logdir', required=True, help='TensorBoard log directory')
+    parser.add_argument('--output', '-o', required=True, help='Output ACMI file')
+    parser.add_argument('--episode', help='Episode ID to export')
+
+
+def _add_input_arg(parser):
+    """Register the single input file argument (info, validate)."""
+    parser.add_argument('input', help='Input ACMI file')
+
+
+def _add_convert_args(parser):
+    """Register arguments for the convert command."""
+    parser.add_argument('input', help='Input ACMI file')
+    parser.add_argument('--keep', action='store_true',
+                        help='Keep roundtrip output file')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse a parsed-file cache, writing <input>.cache.json '
+                             'next to the input file')
+
+
+# (name, help, argument registration, handler) for each subcommand
+_SUBCOMMANDS = (
+    ('import', 'Import ACMI file to TensorBoard', _add_import_args, cmd_import),
+    ('batch-import', 'Batch import ACMI files', _add_batch_import_args, cmd_batch_import),
+    ('export', 'Export TensorBoard episode to ACMI', _add_export_args, cmd_export),
+    ('info', 'Display ACMI file information', _add_input_arg, cmd_info),
+    ('validate', 'Validate ACMI file format', _add_input_arg, cmd_validate),
+    ('convert', 'Test roundtrip conversion', _add_convert_args, cmd_convert),
+)
+_SUBCOMMAND_NAMES = frozenset(name for name, _, _, _ in _SUBCOMMANDS)
+
+
+def main(argv=None):
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(
         description="TensorBoard Flight Plugin - ACMI Tools",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -204,50 +272,18 @@ Examples:
 
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
-    # Import command
-    import_parser = subparsers.add_parser('import', help='Import ACMI file to TensorBoard')
-    import_parser.add_argument('input', help='Input ACMI file (.txt.acmi)')
-    import_parser.add_argument('--output', '-o', default='runs/imported',
-                              help='Output TensorBoard directory (default: runs/imported)')
-    import_parser.add_argument('--prefix', '-p', default='acmi',
-                              help='Agent ID prefix (default: acmi)')
-    import_parser.set_defaults(func=cmd_import)
-
-    # Batch import command
-    batch_parser = subparsers.add_parser('batch-import', help='Batch import ACMI files')
-    batch_parser.add_argument('input_dir', help='Input directory containing ACMI files')
-    batch_parser.add_argument('--output', '-o', default='runs/imported',
-                             help='Output TensorBoard directory (default: runs/imported)')
-    batch_parser.add_argument('--pattern', '-p', default='*.txt.acmi',
-                             help='File pattern (default: *.txt.acmi)')
-    batch_parser.set_defaults(func=cmd_batch_import)
-
-    # Export command
-    export_parser = subparsers.add_parser('export', help='Export TensorBoard episode to ACMI')
-    export_parser.add_argument('--logdir', required=True, help='TensorBoard log directory')
-    export_parser.add_argument('--output', '-o', required=True, help='Output ACMI file')
-    export_parser.add_argument('--episode', help='Episode ID to export')
-    export_parser.set_defaults(func=cmd_export)
-
-    # Info command
-    info_parser = subparsers.add_parser('info', help='Display ACMI file information')
-    info_parser.add_argument('input', help='Input ACMI file')
-    info_parser.set_defaults(func=cmd_info)
-
-    # Validate command
-    validate_parser = subparsers.add_parser('validate', help='Validate ACMI file format')
-    validate_parser.add_argument('input', help='Input ACMI file')
-    validate_parser.set_defaults(func=cmd_validate)
-
-    # Convert (roundtrip test) command
-    convert_parser = subparsers.add_parser('convert', help='Test roundtrip conversion')
-    convert_parser.add_argument('input', help='Input ACMI file')
-    convert_parser.add_argument('--keep', action='store_true',
-                               help='Keep roundtrip output file')
-    convert_parser.set_defaults(func=cmd_convert)
+    # Only the requested subcommand needs its arguments registered; --help,
+    # no command or an unknown command get the full set for usage/errors
+    requested = argv[0] if argv and argv[0] in _SUBCOMMAND_NAMES else None
+    for name, help_text, add_arguments, func in _SUBCOMMANDS:
+        if requested is not None and name != requested:
+            continue
+        subparser = subparsers.add_parser(name, help=help_text)
+        add_arguments(subparser)
+        subparser.set_defaults(func=func)
 
     # Parse args
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
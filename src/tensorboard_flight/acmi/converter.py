@@ -4,9 +4,17 @@ This module provides high-level functions for converting between ACMI files
 and TensorBoard Flight Plugin format with full CAM metadata preservation.
 """
 
-from typing import List, Optional, Dict, Any
+import fnmatch
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from itertools import repeat
+from typing import Iterator, List, Optional, Dict, Any
 from pathlib import Path
 
+import numpy as np
+
 from tensorboard_flight.data.schema import (
     FlightEpisode,
     FlightDataPoint,
@@ -19,14 +27,88 @@ from tensorboard_flight import FlightLogger
 
 from .parser import ACMIParser
 from .writer import ACMIWriter
-from .cam_schema import CAMDecoder
+from .cam_schema import CAMDecoder, CAMKeys
 from .geo_utils import (
-    geodetic_to_cartesian,
+    make_geo_to_cart,
+    geodetic_to_cartesian_batch,
     compute_velocity_from_airspeed,
+    compute_velocity_from_airspeed_batch,
     compute_reference_point,
 )
 
 
+# Numeric per-state ACMI properties and their defaults, in the order
+# _convert_state_to_datapoint unpacks them. Yaw falls back to Heading.
+_STATE_FIELDS = (
+    ('Latitude', 0.0),
+    ('Longitude', 0.0),
+    ('Altitude', 0.0),
+    ('Roll', 0.0),
+    ('Pitch', 0.0),
+    ('Yaw', 0.0),
+    ('IAS', 0.0),
+    ('Throttle', 0.5),
+    ('AOA', 0.0),
+    ('AOS', 0.0),
+    ('TurnRate', 0.0),
+)
+
+# RLMetrics field order, for positional construction from a decoded dict
+_RL_METRICS_FIELDS = tuple(f.name for f in fields(RLMetrics))
+
+
+def _state_value(state: Dict, key: str, default: float):
+    """Read one numeric field of an ACMI state, applying the Yaw fallback."""
+    if key == 'Yaw' and 'Yaw' not in state:
+        return state.get('Heading', default)
+    return state.get(key, default)
+
+
+def _states_to_columns(states: List[Dict]) -> Dict[str, np.ndarray]:
+    """Gather the numeric _STATE_FIELDS of all states into float64 columns.
+
+    Args:
+        states: List of state dicts (timestamped)
+
+    Returns:
+        Dictionary mapping property key -> (N,) float64 array
+    """
+    return {
+        key: np.array([_state_value(state, key, default) for state in states],
+                      dtype=np.float64)
+        for key, default in _STATE_FIELDS
+    }
+
+
+def _cumulative_rewards(
+    rewards: np.ndarray,
+    cam_cumulative: np.ndarray,
+    has_cam: np.ndarray,
+) -> np.ndarray:
+    """Cumulative reward per step.
+
+    Steps that record a CAM cumulative reward keep it; other steps continue
+    the running sum of rewards from the last recorded value (or from zero).
+
+    Args:
+        rewards: (N,) instant rewards
+        cam_cumulative: (N,) CAM cumulative rewards (ignored where absent)
+        has_cam: (N,) bool mask of steps with a CAM cumulative reward
+
+    Returns:
+        (N,) float64 array of cumulative rewards
+    """
+    running = np.cumsum(rewards, dtype=np.float64)
+    if not has_cam.any():
+        return running
+
+    # Carry the offset between each recorded value and the running sum forward
+    offsets = np.where(has_cam, cam_cumulative - running, 0.0)
+    last = np.maximum.accumulate(np.where(has_cam, np.arange(len(rewards)), -1))
+    carried = np.where(last >= 0, offsets[last], 0.0)
+    return np.where(has_cam, cam_cumulative, running + carried)
+
+
 class ACMIConverter:
     """Bidirectional converter between ACMI and FlightEpisode format.
 
@@ -53,14 +135,20 @@ class ACMIConverter:
         """
         self.reference_point = reference_point
         self.decoder = CAMDecoder()
+        # (reference_point, make_geo_to_cart(reference_point))
+        self._geo_fn = None
+        # reference point -> ACMIWriter, reused across episode_to_acmi calls
+        self._writer_cache: Dict[Optional[tuple], ACMIWriter] = {}
 
-    def acmi_to_episodes(self, acmi_file: str) -> List[FlightEpisode]:
+    def acmi_to_episodes(self, acmi_file: str, use_cache: bool = False) -> List[FlightEpisode]:
         """Convert ACMI file to list of FlightEpisode objects.
 
         Each object in the ACMI file becomes a separate episode.
 
         Args:
             acmi_file: Path to .txt.acmi file
+            use_cache: Reuse/write a parsed-file cache next to the ACMI file
+                       (see ACMIParser.parse_file_cached)
 
         Returns:
             List of FlightEpisode instances (one per object)
@@ -72,7 +160,10 @@ class ACMIConverter:
         """
         # Parse ACMI file
         parser = ACMIParser()
-        data = parser.parse_file(acmi_file)
+        if use_cache:
+            data = parser.parse_file_cached(acmi_file)
+        else:
+            data = parser.parse_file(acmi_file)
 
         # Convert each object to an episode
         episodes = []
@@ -91,6 +182,29 @@ class ACMIConverter:
 
         return episodes
 
+    def acmi_to_episodes_iter(self, acmi_file: str) -> Iterator[FlightEpisode]:
+        """Convert an ACMI file to FlightEpisode objects one at a time.
+
+        Yields the same episodes, in the same order, as acmi_to_episodes(),
+        but converts each object only when it is requested, so the caller
+        need not hold every converted episode at once.
+
+        Args:
+            acmi_file: Path to .txt.acmi file
+
+        Yields:
+            FlightEpisode instances (one per object)
+
+        Example:
+            >>> converter = ACMIConverter()
+            >>> for episode in converter.acmi_to_episodes_iter("long_mission.txt.acmi"):
+            ...     logger.log_episode(episode)
+        """
+        parser = ACMIParser()
+        for obj_id, states, global_props in parser.iter_objects(acmi_file):
+            agent_id = states[0].get('Name', obj_id)
+            yield self._convert_object_to_episode(obj_id, agent_id, states, global_props)
+
     def episode_to_acmi(
         self,
         episode: FlightEpisode,
@@ -109,7 +223,11 @@ class ACMIConverter:
             >>> converter.episode_to_acmi(episode, "rl_flight.txt.acmi")
         """
         ref_point = reference_point or self.reference_point
-        writer = ACMIWriter(reference_point=ref_point)
+        if ref_point is not None:
+            ref_point = tuple(ref_point)
+        writer = self._writer_cache.get(ref_point)
+        if writer is None:
+            writer = self._writer_cache[ref_point] = ACMIWriter(reference_point=ref_point)
         writer.write_episode(episode, output_file)
 
     def _convert_object_to_episode(
@@ -137,20 +255,51 @@ class ACMIConverter:
             first_lon = states[0].get('Longitude', -117.9)
             first_alt = states[0].get('Altitude', 700.0)
             self.reference_point = (first_lat, first_lon, first_alt)
+        self._geo_fn = (self.reference_point, make_geo_to_cart(self.reference_point))
 
         # Extract episode metadata from first/last states
         episode_meta = self._extract_episode_metadata(states)
 
+        # Numeric fields as columns (SoA); positions and velocities for the
+        # whole object are then computed in one vectorized pass
+        columns = _states_to_columns(states)
+        positions = geodetic_to_cartesian_batch(
+            columns['Latitude'], columns['Longitude'], columns['Altitude'],
+            self.reference_point,
+        ).tolist()
+        velocities = compute_velocity_from_airspeed_batch(
+            columns['IAS'], columns['Pitch'], columns['Yaw']
+        ).tolist()
+        rows = zip(*(column.tolist() for column in columns.values()))
+
+        # Decode CAM fields. Records of one object normally share a key set;
+        # reuse the decoder specialized to it until the keys change
+        decoded_states = []
+        schema_keys = None
+        decode_cam = None
+        for state in states:
+            if state.keys() != schema_keys:
+                schema_keys = state.keys()
+                decode_cam = self.decoder.make_specialized_all(schema_keys)
+            decoded_states.append(decode_cam(state))
+
+        # Cumulative rewards for the whole object as one prefix sum
+        cumulative_rewards = _cumulative_rewards(
+            np.array([d['rl_metrics']['reward'] for d in decoded_states], dtype=np.float64),
+            np.array([d['rl_metrics']['cumulative_reward'] for d in decoded_states],
+                     dtype=np.float64),
+            np.array([CAMKeys.REWARD_CUM in state for state in states], dtype=bool),
+        ).tolist()
+
         # Convert each state to FlightDataPoint
         trajectory = []
-        cumulative_reward = 0.0
-
-        for i, state in enumerate(states):
-            datapoint = self._convert_state_to_datapoint(
-                i, state, cumulative_reward
-            )
-            cumulative_reward = datapoint.rl_metrics.cumulative_reward
-            trajectory.append(datapoint)
+        for i, (state, decoded, row) in enumerate(zip(states, decoded_states, rows)):
+            trajectory.append(self._convert_state_to_datapoint(
+                i, state, 0.0, decoded, row=row,
+                position=tuple(positions[i]), velocity=tuple(velocities[i]),
+                cumulative_reward=cumulative_rewards[i],
+            ))
+        cumulative_reward = cumulative_rewards[-1] if cumulative_rewards else 0.0
 
         # Create episode
         episode = FlightEpisode(
@@ -174,7 +323,12 @@ class ACMIConverter:
         self,
         step: int,
         state: Dict,
-        prev_cumulative_reward: float
+        prev_cumulative_reward: float,
+        decoded: Optional[Dict] = None,
+        row: Optional[tuple] = None,
+        position: Optional[tuple] = None,
+        velocity: Optional[tuple] = None,
+        cumulative_reward: Optional[float] = None
     ) -> FlightDataPoint:
         """Convert single ACMI state to FlightDataPoint.
 
@@ -182,61 +336,75 @@ class ACMIConverter:
             step: Step number
             state: State dict from ACMI parser
             prev_cumulative_reward: Previous cumulative reward
+            decoded: CAMDecoder.decode_all result for this state
+                     (default: decoded from state)
+            row: Numeric _STATE_FIELDS values of this state, e.g. one row of
+                 _states_to_columns (default: read from state)
+            position: Precomputed cartesian position (default: from state)
+            velocity: Precomputed velocity (default: from state)
+            cumulative_reward: Precomputed cumulative reward (default: CAM
+                               value, else previous plus instant reward)
 
         Returns:
             FlightDataPoint instance
         """
+        if row is None:
+            row = [_state_value(state, key, default) for key, default in _STATE_FIELDS]
+        lat, lon, alt, roll, pitch, yaw, airspeed, throttle, aoa, aos, turn_rate = row
+
         # Extract position (geodetic → cartesian)
-        lat = state.get('Latitude', 0.0)
-        lon = state.get('Longitude', 0.0)
-        alt = state.get('Altitude', 0.0)
-        position = geodetic_to_cartesian(lat, lon, alt, self.reference_point)
+        if position is None:
+            # Conversion bound to the current reference point, rebuilt if
+            # reference_point was reassigned
+            if self._geo_fn is None or self._geo_fn[0] is not self.reference_point:
+                self._geo_fn = (self.reference_point, make_geo_to_cart(self.reference_point))
+            position = self._geo_fn[1](lat, lon, alt)
 
         # Extract orientation
-        roll = state.get('Roll', 0.0)
-        pitch = state.get('Pitch', 0.0)
-        yaw = state.get('Yaw', state.get('Heading', 0.0))
         orientation = Orientation(roll=roll, pitch=pitch, yaw=yaw)
 
         # Extract velocity (compute from IAS if not in CAM)
-        airspeed = state.get('IAS', 0.0)
-        velocity = compute_velocity_from_airspeed(airspeed, pitch, yaw)
+        if velocity is None:
+            velocity = compute_velocity_from_airspeed(airspeed, pitch, yaw)
+
+        # Decode all CAM fields in one pass
+        if decoded is None:
+            decoded = self.decoder.decode_all(state)
 
         # Extract angular velocity (from CAM)
-        angular_velocity = self.decoder.decode_angular_velocity(state)
-
-        # Extract telemetry
-        telemetry_dict = {
-            'airspeed': airspeed,
-            'altitude': alt,
-            'g_force': self.decoder.decode_g_force(state),
-            'throttle': state.get('Throttle', 0.5),
-            'aoa': state.get('AOA', 0.0),
-            'aos': state.get('AOS', 0.0),
-            'heading': yaw,
-            'vertical_speed': velocity[2],  # vz
-            'turn_rate': state.get('TurnRate', 0.0),
-            'bank_angle': roll,
-        }
-
-        # Add control surfaces from CAM
-        controls = self.decoder.decode_control_surfaces(state)
-        telemetry_dict.update(controls)
-
-        telemetry = Telemetry(**telemetry_dict)
+        angular_velocity = decoded['angular_velocity']
+
+        # Extract telemetry, with G-force and control surfaces from CAM
+        # (positional, in Telemetry field order)
+        cam_telemetry = decoded['telemetry']
+        telemetry = Telemetry(
+            airspeed,
+            alt,
+            cam_telemetry['g_force'],
+            throttle,
+            aoa,
+            aos,
+            yaw,          # heading
+            velocity[2],  # vertical speed (vz)
+            turn_rate,
+            roll,         # bank angle
+            cam_telemetry.get('aileron'),
+            cam_telemetry.get('elevator'),
+            cam_telemetry.get('rudder'),
+        )
 
         # Extract RL metrics from CAM
-        rl_metrics_dict = self.decoder.decode_rl_metrics(state)
+        rl_metrics_dict = decoded['rl_metrics']
 
         # Update cumulative reward
         instant_reward = rl_metrics_dict.get('reward', 0.0)
-        if 'cumulative_reward' not in rl_metrics_dict:
+        if cumulative_reward is not None:
+            rl_metrics_dict['cumulative_reward'] = cumulative_reward
+        elif CAMKeys.REWARD_CUM not in state:
             rl_metrics_dict['cumulative_reward'] = prev_cumulative_reward + instant_reward
-        else:
-            # Use CAM value if available
-            rl_metrics_dict['cumulative_reward'] = rl_metrics_dict['cumulative_reward']
+        # Otherwise the decoded CAM value is used as is
 
-        rl_metrics = RLMetrics(**rl_metrics_dict)
+        rl_metrics = RLMetrics(*map(rl_metrics_dict.get, _RL_METRICS_FIELDS))
 
         # Create datapoint
         datapoint = FlightDataPoint(
@@ -278,15 +446,24 @@ class ACMIConverter:
 
 # High-level convenience functions
 
-def import_acmi(acmi_file: str, output_dir: str, agent_prefix: str = "acmi") -> int:
+def import_acmi(
+    acmi_file: str,
+    output_dir: str,
+    agent_prefix: str = "acmi",
+    use_cache: bool = False,
+) -> int:
     """Import ACMI file to TensorBoard format.
 
     Converts ACMI file to FlightEpisode and writes to TensorBoard logs.
+    Without the cache, episodes are converted lazily (see
+    ACMIConverter.acmi_to_episodes_iter), so each episode is written as soon
+    as it is converted.
 
     Args:
         acmi_file: Path to .txt.acmi file
         output_dir: TensorBoard log directory
         agent_prefix: Prefix for agent IDs (default: "acmi")
+        use_cache: Reuse/write a parsed-file cache next to the ACMI file
 
     Returns:
         Number of episodes imported
@@ -297,10 +474,14 @@ def import_acmi(acmi_file: str, output_dir: str, agent_prefix: str = "acmi") ->
     """
     # Convert ACMI to episodes
     converter = ACMIConverter()
-    episodes = converter.acmi_to_episodes(acmi_file)
+    if use_cache:
+        episodes = converter.acmi_to_episodes(acmi_file, use_cache=True)
+    else:
+        episodes = converter.acmi_to_episodes_iter(acmi_file)
 
     # Write to TensorBoard
     logger = FlightLogger(log_dir=output_dir)
+    count = 0
 
     for episode in episodes:
         # Optionally prefix agent ID
@@ -308,13 +489,14 @@ def import_acmi(acmi_file: str, output_dir: str, agent_prefix: str = "acmi") ->
             episode.agent_id = f"{agent_prefix}_{episode.agent_id}"
 
         logger.log_episode(episode)
+        count += 1
 
     logger.close()
 
-    print(f"Imported {len(episodes)} episodes from {acmi_file}")
+    print(f"Imported {count} episodes from {acmi_file}")
     print(f"TensorBoard logs: {output_dir}")
 
-    return len(episodes)
+    return count
 
 
 def export_to_acmi(
@@ -348,13 +530,27 @@ def export_to_acmi(
     return False
 
 
-def batch_import_acmi(acmi_dir: str, output_dir: str, pattern: str = "*.txt.acmi") -> int:
+def batch_import_acmi(
+    acmi_dir: str,
+    output_dir: str,
+    pattern: str = "*.txt.acmi",
+    max_workers: Optional[int] = 1,
+) -> int:
     """Import all ACMI files from a directory.
 
+    With max_workers > 1, files are parsed and converted in parallel worker
+    processes (call this under an ``if __name__ == '__main__':`` guard on
+    platforms that spawn them). Each file is written by its own
+    FlightLogger, and event file names are unique per process, so the
+    workers never share an output file.
+
     Args:
         acmi_dir: Directory containing ACMI files
         output_dir: TensorBoard log directory
-        pattern: File pattern (default: "*.txt.acmi")
+        pattern: Glob pattern relative to acmi_dir (default: "*.txt.acmi");
+                 may include subdirectories or "**"
+        max_workers: Number of worker processes (default: 1, import
+                     sequentially in this process). None uses the CPU count.
 
     Returns:
         Total number of episodes imported
@@ -363,13 +559,34 @@ def batch_import_acmi(acmi_dir: str, output_dir: str, pattern: str = "*.txt.acmi
         >>> count = batch_import_acmi("acmi_files/", "runs/imported")
         >>> print(f"Imported {count} total episodes")
     """
-    acmi_dir = Path(acmi_dir)
-    total_episodes = 0
-
-    for acmi_file in acmi_dir.glob(pattern):
-        print(f"\nProcessing: {acmi_file.name}")
-        count = import_acmi(str(acmi_file), output_dir)
-        total_episodes += count
+    if '/' in pattern or os.sep in pattern or '**' in pattern:
+        # Patterns that descend into subdirectories need the full glob
+        acmi_files = [str(p) for p in Path(acmi_dir).glob(pattern) if p.is_file()]
+    else:
+        # One directory scan; file names are matched against the compiled pattern
+        name_matches = re.compile(fnmatch.translate(pattern)).match
+        with os.scandir(acmi_dir) as entries:
+            acmi_files = [
+                entry.path for entry in entries
+                if name_matches(entry.name) and entry.is_file()
+            ]
+    acmi_files.sort()
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(acmi_files))
+
+    if max_workers <= 1:
+        total_episodes = 0
+        for acmi_file in acmi_files:
+            print(f"\nProcessing: {Path(acmi_file).name}")
+            total_episodes += import_acmi(acmi_file, output_dir)
+    else:
+        print(f"\nProcessing {len(acmi_files)} files with {max_workers} workers")
+        chunksize = max(1, len(acmi_files) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            total_episodes = sum(executor.map(
+                import_acmi, acmi_files, repeat(output_dir), chunksize=chunksize
+            ))
 
     print(f"\nTotal: {total_episodes} episodes imported")
     return total_episodes
@@ -9,7 +9,7 @@ For larger areas, consider using pyproj library for accurate WGS84 transformatio
 """
 
 import math
-from typing import Tuple, Optional
+from typing import Callable, Tuple, Optional
 import numpy as np
 
 
@@ -73,6 +73,81 @@ def geodetic_to_cartesian(
     return (x, y, z)
 
 
+def make_geo_to_cart(
+    ref_point: Optional[Tuple[float, float, float]] = None
+) -> Callable[[float, float, float], Tuple[float, float, float]]:
+    """Build a geodetic_to_cartesian function bound to one reference point.
+
+    The reference point's radians and cosine are computed once here, so
+    the returned function only converts the sample itself.
+
+    Args:
+        ref_point: Reference point (lat, lon, alt) for origin.
+                  If None, uses default Edwards AFB location.
+
+    Returns:
+        Function mapping (lat, lon, alt) to (x, y, z), equivalent to
+        geodetic_to_cartesian(lat, lon, alt, ref_point)
+
+    Example:
+        >>> geo_to_cart = make_geo_to_cart((34.9, -117.9, 700.0))
+        >>> x, y, z = geo_to_cart(34.91, -117.88, 1000.0)
+    """
+    if ref_point is None:
+        ref_lat, ref_lon, ref_alt = DEFAULT_REF_LAT, DEFAULT_REF_LON, DEFAULT_REF_ALT
+    else:
+        ref_lat, ref_lon, ref_alt = ref_point
+
+    ref_lat_rad = math.radians(ref_lat)
+    ref_lon_rad = math.radians(ref_lon)
+    cos_ref_lat = math.cos(ref_lat_rad)
+
+    def geo_to_cart(lat: float, lon: float, alt: float) -> Tuple[float, float, float]:
+        return (
+            EARTH_RADIUS * (math.radians(lon) - ref_lon_rad) * cos_ref_lat,  # East
+            EARTH_RADIUS * (math.radians(lat) - ref_lat_rad),                # North
+            alt - ref_alt,                                                   # Up
+        )
+
+    return geo_to_cart
+
+
+def geodetic_to_cartesian_batch(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    alts: np.ndarray,
+    ref_point: Optional[Tuple[float, float, float]] = None
+) -> np.ndarray:
+    """Vectorized geodetic_to_cartesian over arrays of points.
+
+    The reference point trigonometry is evaluated once for the whole batch.
+
+    Args:
+        lats: (N,) latitudes in degrees
+        lons: (N,) longitudes in degrees
+        alts: (N,) altitudes in meters MSL
+        ref_point: Reference point (lat, lon, alt) for origin.
+                  If None, uses default Edwards AFB location.
+
+    Returns:
+        (N, 3) array of (x, y, z) ENU positions in meters
+    """
+    if ref_point is None:
+        ref_lat, ref_lon, ref_alt = DEFAULT_REF_LAT, DEFAULT_REF_LON, DEFAULT_REF_ALT
+    else:
+        ref_lat, ref_lon, ref_alt = ref_point
+
+    ref_lat_rad = math.radians(ref_lat)
+    ref_lon_rad = math.radians(ref_lon)
+
+    lats = np.asarray(lats, dtype=np.float64)
+    positions = np.empty((lats.shape[0], 3))
+    positions[:, 0] = EARTH_RADIUS * (np.radians(lons) - ref_lon_rad) * math.cos(ref_lat_rad)
+    positions[:, 1] = EARTH_RADIUS * (np.radians(lats) - ref_lat_rad)
+    positions[:, 2] = np.asarray(alts, dtype=np.float64) - ref_alt
+    return positions
+
+
 def cartesian_to_geodetic(
     position: Tuple[float, float, float],
     ref_point: Optional[Tuple[float, float, float]] = None
@@ -120,6 +195,38 @@ def cartesian_to_geodetic(
     return (lat, lon, alt)
 
 
+def cartesian_to_geodetic_batch(
+    positions: np.ndarray,
+    ref_point: Optional[Tuple[float, float, float]] = None
+) -> np.ndarray:
+    """Vectorized cartesian_to_geodetic over an array of positions.
+
+    Args:
+        positions: (N, 3) array (or sequence) of (x, y, z) ENU positions in meters
+        ref_point: Reference point (lat, lon, alt) for origin.
+                  If None, uses default Edwards AFB location.
+
+    Returns:
+        (N, 3) array of (lat, lon, alt) in degrees / meters MSL
+    """
+    if ref_point is None:
+        ref_lat, ref_lon, ref_alt = DEFAULT_REF_LAT, DEFAULT_REF_LON, DEFAULT_REF_ALT
+    else:
+        ref_lat, ref_lon, ref_alt = ref_point
+
+    ref_lat_rad = math.radians(ref_lat)
+    ref_lon_rad = math.radians(ref_lon)
+
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    geodetic = np.empty_like(positions)
+    geodetic[:, 0] = np.degrees(ref_lat_rad + positions[:, 1] / EARTH_RADIUS)
+    geodetic[:, 1] = np.degrees(
+        ref_lon_rad + positions[:, 0] / (EARTH_RADIUS * math.cos(ref_lat_rad))
+    )
+    geodetic[:, 2] = ref_alt + positions[:, 2]
+    return geodetic
+
+
 def compute_velocity_from_airspeed(
     airspeed: float,
     pitch: float,
@@ -162,6 +269,34 @@ def compute_velocity_from_airspeed(
     return (vx, vy, vz)
 
 
+def compute_velocity_from_airspeed_batch(
+    airspeeds: np.ndarray,
+    pitches: np.ndarray,
+    yaws: np.ndarray
+) -> np.ndarray:
+    """Vectorized compute_velocity_from_airspeed over arrays of samples.
+
+    Args:
+        airspeeds: (N,) true airspeeds in m/s
+        pitches: (N,) pitch angles in degrees
+        yaws: (N,) yaw angles in degrees
+
+    Returns:
+        (N, 3) array of (vx, vy, vz) in m/s
+    """
+    airspeeds = np.asarray(airspeeds, dtype=np.float64)
+    pitch_rad = np.radians(pitches)
+    yaw_rad = np.radians(yaws)
+
+    horizontal_speed = airspeeds * np.cos(pitch_rad)
+
+    velocities = np.empty((airspeeds.shape[0], 3))
+    velocities[:, 0] = horizontal_speed * np.sin(yaw_rad)  # East
+    velocities[:, 1] = horizontal_speed * np.cos(yaw_rad)  # North
+    velocities[:, 2] = airspeeds * np.sin(pitch_rad)       # Up
+    return velocities
+
+
 def compute_airspeed_from_velocity(
     velocity: Tuple[float, float, float]
 ) -> Tuple[float, float, float]:
@@ -186,14 +321,11 @@ def compute_airspeed_from_velocity(
     vx, vy, vz = velocity
 
     # Compute airspeed (magnitude)
-    airspeed = math.sqrt(vx**2 + vy**2 + vz**2)
+    airspeed = math.hypot(vx, vy, vz)
 
     # Compute pitch (angle from horizontal)
-    horizontal_speed = math.sqrt(vx**2 + vy**2)
-    if airspeed > 0:
-        pitch = math.degrees(math.atan2(vz, horizontal_speed))
-    else:
-        pitch = 0.0
+    horizontal_speed = math.hypot(vx, vy)
+    pitch = math.degrees(math.atan2(vz, horizontal_speed)) if horizontal_speed or vz else 0.0
 
     # Compute yaw (heading)
     if horizontal_speed > 0:
@@ -210,7 +342,8 @@ def compute_airspeed_from_velocity(
 def compute_reference_point(positions: list) -> Tuple[float, float, float]:
     """Compute a suitable reference point from a list of Cartesian positions.
 
-    Uses the centroid of the positions as the origin.
+    Keeps the default latitude/longitude and takes the first position's
+    altitude as the reference altitude.
 
     Args:
         positions: List of (x, y, z) tuples in Cartesian coordinates
@@ -221,17 +354,13 @@ def compute_reference_point(positions: list) -> Tuple[float, float, float]:
     Example:
         >>> positions = [(0, 0, 0), (100, 100, 100), (-100, -100, -100)]
         >>> ref = compute_reference_point(positions)
-        >>> # ref ≈ centroid in geodetic
+        >>> # ref == (DEFAULT_REF_LAT, DEFAULT_REF_LON, 0)
     """
     if not positions:
         return (DEFAULT_REF_LAT, DEFAULT_REF_LON, DEFAULT_REF_ALT)
 
-    # Compute centroid in Cartesian space
-    positions_array = np.array(positions)
-    centroid = positions_array.mean(axis=0)
-
     # Use first position's altitude as reference (simple heuristic)
-    ref_alt = positions[0][2] if positions else DEFAULT_REF_ALT
+    ref_alt = positions[0][2]
 
     # For simplicity, use default lat/lon (in production, could compute from data)
     return (DEFAULT_REF_LAT, DEFAULT_REF_LON, ref_alt)
@@ -266,10 +395,12 @@ def normalize_longitude(lon: float) -> float:
     Returns:
         Normalized longitude in [-180, 180]
     """
-    while lon > 180.0:
-        lon -= 360.0
-    while lon < -180.0:
-        lon += 360.0
+    # One modulo instead of a loop of 360° steps; values already in range
+    # (including both ±180 endpoints) are returned unchanged
+    if lon > 180.0:
+        return 180.0 - (180.0 - lon) % 360.0
+    if lon < -180.0:
+        return (lon + 180.0) % 360.0 - 180.0
     return lon
 
 
@@ -282,7 +413,5 @@ def normalize_heading(heading: float) -> float:
     Returns:
         Normalized heading in [0, 360)
     """
-    heading = heading % 360.0
-    if heading < 0:
-        heading += 360.0
-    return heading
+    # Python's % takes the sign of the divisor, so this is already >= 0
+    return heading % 360.0
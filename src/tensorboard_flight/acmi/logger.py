@@ -4,6 +4,8 @@ This module provides ACMILogger, which extends FlightLogger with automatic
 ACMI export capability for easy integration with RL frameworks.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from pathlib import Path
 
@@ -79,8 +81,16 @@ class ACMILogger(FlightLogger):
         if self.enable_acmi_export:
             self.acmi_dir.mkdir(parents=True, exist_ok=True)
 
-        # ACMI writer
+        # ACMI writer. Exports run on a single background thread so that
+        # end_episode() does not wait on file I/O; the lock serializes
+        # writer use with manual exports and reference-point updates.
         self.acmi_writer = ACMIWriter(reference_point=reference_point)
+        self._acmi_lock = threading.Lock()
+        self._acmi_pool = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="acmi-export")
+            if self.enable_acmi_export else None
+        )
+        self._last_episode = None
 
         # Episode counter for ACMI files
         self.acmi_episode_counter = 0
@@ -115,24 +125,81 @@ class ACMILogger(FlightLogger):
 
             self.acmi_episode_counter += 1
 
+        # Export holds its own reference; don't keep the episode alive here
+        self._last_episode = None
+
+    def log_episode(self, episode) -> None:
+        """Log a complete episode (not exported to ACMI).
+
+        Args:
+            episode: Complete FlightEpisode object
+        """
+        super().log_episode(episode)
+        self._last_episode = None
+
+    def _write_episode(self, episode) -> None:
+        """Write episode to TensorBoard and keep it for ACMI export."""
+        super()._write_episode(episode)
+        self._last_episode = episode
+
     def _export_current_episode_to_acmi(self):
-        """Export the most recently completed episode to ACMI file."""
-        if not self.current_episode:
+        """Queue the most recently completed episode for ACMI export."""
+        episode = self._last_episode
+        if episode is None or not episode.trajectory:
             return
 
         # Generate filename
         filename = f"{self.acmi_prefix}_{self.acmi_episode_counter:04d}.txt.acmi"
         output_path = self.acmi_dir / filename
 
+        # The reference point in effect now applies to this episode, even if
+        # it is changed before the export thread gets to it
+        reference_point = self.acmi_writer.reference_point
+
+        if self._acmi_pool is not None:
+            self._acmi_pool.submit(
+                self._write_acmi_file, episode, str(output_path), reference_point
+            )
+        else:
+            # Logger already closed; export synchronously
+            self._write_acmi_file(episode, str(output_path), reference_point)
+
+    def _write_acmi_file(self, episode, output_path: str, reference_point):
+        """Write one episode to ACMI (runs on the export thread).
+
+        Args:
+            episode: FlightEpisode instance
+            output_path: Output .txt.acmi file path
+            reference_point: Reference point captured when the export was queued
+        """
         try:
-            # Write to ACMI
-            self.acmi_writer.write_episode(self.current_episode, str(output_path))
+            with self._acmi_lock:
+                writer = self.acmi_writer
+                if writer.reference_point != reference_point:
+                    writer = ACMIWriter(
+                        reference_point=reference_point, compress=writer.compress
+                    )
+                writer.write_episode(episode, output_path)
 
-            if self.verbose:
-                print(f"Exported ACMI: {filename}")
+            if getattr(self, "verbose", False):
+                print(f"Exported ACMI: {Path(output_path).name}")
 
         except Exception as e:
-            print(f"Warning: Failed to export ACMI {filename}: {e}")
+            print(f"Warning: Failed to export ACMI {Path(output_path).name}: {e}")
+
+    def flush_acmi(self):
+        """Block until all queued ACMI exports have been written."""
+        if self._acmi_pool is not None:
+            # The export thread runs jobs in order, so waiting on an empty
+            # job waits on everything queued before it
+            self._acmi_pool.submit(lambda: None).result()
+
+    def close(self):
+        """Close the logger and finish any pending ACMI exports."""
+        super().close()
+        if self._acmi_pool is not None:
+            self._acmi_pool.shutdown(wait=True)
+            self._acmi_pool = None
 
     def export_episode_to_acmi(self, episode, output_file: str):
         """Manually export a specific episode to ACMI.
@@ -144,7 +211,8 @@ class ACMILogger(FlightLogger):
         Example:
             >>> logger.export_episode_to_acmi(best_episode, "best_flight.txt.acmi")
         """
-        self.acmi_writer.write_episode(episode, output_file)
+        with self._acmi_lock:
+            self.acmi_writer.write_episode(episode, output_file)
 
     def set_acmi_reference_point(self, lat: float, lon: float, alt: float):
         """Update the reference point for ACMI coordinate conversion.
@@ -158,7 +226,8 @@ class ACMILogger(FlightLogger):
             >>> # Set reference to Edwards AFB
             >>> logger.set_acmi_reference_point(34.9054, -117.8839, 700.0)
         """
-        self.acmi_writer.reference_point = (lat, lon, alt)
+        with self._acmi_lock:
+            self.acmi_writer.reference_point = (lat, lon, alt)
 
     def get_acmi_files(self) -> list:
         """Get list of ACMI files created by this logger.
@@ -170,6 +239,8 @@ class ACMILogger(FlightLogger):
             >>> files = logger.get_acmi_files()
             >>> print(f"Created {len(files)} ACMI files")
         """
+        self.flush_acmi()
+
         if not self.acmi_dir.exists():
             return []
 
@@ -4,10 +4,179 @@ This module parses ACMI 2.2 text format files, including Custom Agent Metadata (
 extensions for RL/AI data.
 """
 
+import json
+import os
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
+
+from tensorboard_flight.data.schema import _SLOTS
+
+try:
+    # Optional C string-to-float parser, a drop-in replacement for float()
+    from fastnumbers import float as _parse_float
+except ImportError:
+    _parse_float = float
+
+# Parsed-file cache written next to the source by parse_file_cached(). The
+# key ties the cache to the exact source file; bump the version whenever the
+# shape of the parse_file() result changes.
+_CACHE_SUFFIX = '.cache.json'
+_CACHE_VERSION = 1
+
+
+# Classifies the common property value forms in one match; the group that
+# matched (m.lastindex) selects the conversion in _parse_value
+_VALUE_RE = re.compile(
+    r'(true)|(false)|(null)'                       # 1-3: literals
+    r'|"(.*)"'                                     # 4: quoted string
+    r'|([-+]?\d+)'                                 # 5: int
+    r'|([-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)',  # 6: float
+    re.IGNORECASE | re.DOTALL,
+)
+_VALUE_LITERALS = {1: True, 2: False, 3: None}
+
+# Transform (T) component keys in field order. _TRANSFORM_KEY_SETS[n] holds
+# the keys filled from n components (n capped at 9): position needs 3,
+# orientation 6, U/V (native coordinates) 8 and Heading 9; partial groups
+# are ignored.
+_TRANSFORM_KEYS = (
+    'Longitude', 'Latitude', 'Altitude',
+    'Roll', 'Pitch', 'Yaw',
+    'U', 'V',
+    'Heading',
+)
+_TRANSFORM_KEY_SETS = tuple(
+    _TRANSFORM_KEYS[:width] for width in (0, 0, 0, 3, 3, 3, 6, 6, 8, 9)
+)
+
+
+@dataclass(**_SLOTS)
+class _ObjSummary:
+    """Running per-object summary maintained while parsing."""
+    name: Optional[str]
+    count: int
+    first_ts: float
+    last_ts: float
+
+
+# Geodetic columns stay float64 whatever the requested column dtype: float32
+# resolves longitude to about a metre, too coarse for trajectories.
+_FLOAT64_KEYS = frozenset({'Latitude', 'Longitude'})
+
+
+def _to_column(values: List[Any], dtype=np.float64) -> np.ndarray:
+    """Convert one property's per-state values to a column array.
+
+    Args:
+        values: Values in state order (None where absent)
+        dtype: Floating dtype for numeric columns
+
+    Returns:
+        Float array of ``dtype`` (NaN for None) if every value is an int or
+        float, otherwise an object array
+    """
+    if all(value is None or type(value) in (float, int) for value in values):
+        return np.array(values, dtype=dtype)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+# Transform properties with dedicated ObjectTrack columns: (attribute, key)
+_TRACK_FIELDS = (
+    ('lon', 'Longitude'),
+    ('lat', 'Latitude'),
+    ('alt', 'Altitude'),
+    ('roll', 'Roll'),
+    ('pitch', 'Pitch'),
+    ('yaw', 'Yaw'),
+)
+
+
+@dataclass(**_SLOTS)
+class ObjectTrack:
+    """Columnar (SoA) states of one ACMI object.
+
+    Every array has one entry per state. Position and orientation are
+    float64 columns with NaN where a state did not set them; all other
+    properties are in ``extras``, as produced by parse_file_columnar().
+
+    Example:
+        >>> data = ACMIParser().parse_file("mission.txt.acmi", columnar=True)
+        >>> track = data['objects']['a01']
+        >>> print(track.alt.max(), track.extras['IAS'].mean())
+    """
+    timestamps: np.ndarray
+    lon: np.ndarray
+    lat: np.ndarray
+    alt: np.ndarray
+    roll: np.ndarray
+    pitch: np.ndarray
+    yaw: np.ndarray
+    extras: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def from_columns(cls, timestamps: np.ndarray, props: Dict[str, np.ndarray]) -> "ObjectTrack":
+        """Build a track from one object of parse_file_columnar().
+
+        Args:
+            timestamps: (N,) float64 timestamps
+            props: Property key -> (N,) column
+
+        Returns:
+            ObjectTrack instance
+        """
+        extras = dict(props)
+        columns = {}
+        for attr, key in _TRACK_FIELDS:
+            column = extras.pop(key, None)
+            columns[attr] = column if column is not None else np.full(len(timestamps), np.nan)
+        return cls(timestamps=timestamps, extras=extras, **columns)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def name(self) -> Optional[str]:
+        """Name property of the first state (None if not set)."""
+        names = self.extras.get('Name')
+        return names[0] if names is not None and len(names) else None
+
+    def as_legacy_dicts(self) -> List[Dict[str, Any]]:
+        """Rebuild the per-state dicts that parse_file() returns by default.
+
+        Absent values (NaN or None) are omitted, and numeric properties come
+        back as floats.
+
+        Returns:
+            List of state dicts (timestamped)
+        """
+        columns = [(key, getattr(self, attr).tolist()) for attr, key in _TRACK_FIELDS]
+        columns.extend((key, column.tolist()) for key, column in self.extras.items())
+
+        states = []
+        for i, timestamp in enumerate(self.timestamps.tolist()):
+            state = {}
+            for key, values in columns:
+                value = values[i]
+                if value is not None and value == value:  # skip None and NaN
+                    state[key] = value
+            state['timestamp'] = timestamp
+            states.append(state)
+        return states
+
+
+def _first_name(states) -> Optional[str]:
+    """Name property of an object's first state (list of states or ObjectTrack)."""
+    if isinstance(states, ObjectTrack):
+        return states.name
+    return states[0].get('Name') if states else None
+
 
 class ACMIParser:
     """Parser for ACMI 2.2 text format with CAM support.
@@ -31,28 +200,232 @@ class ACMIParser:
         self.current_time = 0.0
         self.global_properties = {}
         self.objects = {}  # obj_id -> list of states
+        self.object_summaries: Dict[str, _ObjSummary] = {}
         self.events = []
 
-    def parse_file(self, filepath: str) -> Dict[str, Any]:
+    def parse_file(self, filepath: str, columnar: bool = False) -> Dict[str, Any]:
         """Parse ACMI file and return structured data.
 
         Args:
             filepath: Path to .txt.acmi file
+            columnar: Store each object as an ObjectTrack of NumPy columns
+                      instead of a list of per-state dicts
 
         Returns:
             Dictionary with:
                 - 'global': Global properties dict
-                - 'objects': Dict mapping object_id -> list of timestamped states
+                - 'objects': Dict mapping object_id -> list of timestamped
+                  states (or ObjectTrack if columnar)
                 - 'events': List of event dicts
                 - 'reference_time': ISO timestamp string
 
+        Raises:
+            ValueError: If file format is invalid
+            FileNotFoundError: If file doesn't exist
+        """
+        if columnar:
+            tracks = self.parse_file_columnar(filepath)
+            self.objects = {
+                obj_id: ObjectTrack.from_columns(track['t'], track['props'])
+                for obj_id, track in tracks.items()
+            }
+        else:
+            self.objects = {}
+            for obj_id, state in self.iter_records(filepath):
+                if obj_id not in self.objects:
+                    self.objects[obj_id] = []
+                self.objects[obj_id].append(state)
+
+        return {
+            'global': self.global_properties,
+            'objects': self.objects,
+            'events': self.events,
+            'reference_time': self.global_properties.get('ReferenceTime', None),
+        }
+
+    def parse_file_columnar(self, filepath: str, dtype=np.float64) -> Dict[str, Dict[str, Any]]:
+        """Parse ACMI file into per-object columns instead of per-state dicts.
+
+        Numeric properties become float arrays (NaN where a state lacks
+        the property); any other property becomes an object array (None
+        where absent). Global properties, events and object summaries are
+        collected on the parser as in parse_file().
+
+        Args:
+            filepath: Path to .txt.acmi file
+            dtype: Floating dtype for numeric property columns. np.float32
+                   halves their memory; Latitude and Longitude are always
+                   float64, as are the timestamps.
+
+        Returns:
+            Dictionary mapping object_id -> {'t': timestamps array,
+            'props': {property key -> array}}, all of the object's length
+
+        Raises:
+            ValueError: If file format is invalid
+            FileNotFoundError: If file doesn't exist
+        """
+        tracks = {}  # obj_id -> (timestamps, {key: values})
+
+        for obj_id, state in self.iter_records(filepath):
+            track = tracks.get(obj_id)
+            if track is None:
+                track = tracks[obj_id] = ([], {})
+            timestamps, props = track
+
+            n = len(timestamps)
+            timestamps.append(state['timestamp'])
+            for key, value in state.items():
+                if key == 'timestamp':
+                    continue
+                values = props.get(key)
+                if values is None:
+                    values = props[key] = [None] * n
+                values.append(value)
+
+            # props now holds every key of this state; if it holds more,
+            # pad the columns this state did not touch
+            if len(props) != len(state) - 1:
+                for values in props.values():
+                    if len(values) == n:
+                        values.append(None)
+
+        return {
+            obj_id: {
+                't': np.array(timestamps, dtype=np.float64),
+                'props': {
+                    key: _to_column(values, np.float64 if key in _FLOAT64_KEYS else dtype)
+                    for key, values in props.items()
+                },
+            }
+            for obj_id, (timestamps, props) in tracks.items()
+        }
+
+    def parse_file_cached(self, filepath: str) -> Dict[str, Any]:
+        """Parse ACMI file, reusing a cached parse when the file is unchanged.
+
+        The parse_file() result is stored as compact JSON in
+        ``<file>.cache.json`` together with the source size and mtime.
+        Loading that cache skips the text parser entirely on repeat runs;
+        any change to the source file invalidates it. Cache write failures
+        (e.g. read-only directories) are ignored.
+
+        Args:
+            filepath: Path to .txt.acmi file
+
+        Returns:
+            Same dictionary as parse_file()
+
+        Raises:
+            ValueError: If file format is invalid
+            FileNotFoundError: If file doesn't exist
+        """
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"ACMI file not found: {filepath}")
+
+        stat = filepath.stat()
+        key = [_CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+        cache_path = filepath.with_name(filepath.name + _CACHE_SUFFIX)
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached['key'] == key:
+                return self._load_parsed(cached['data'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, stale or corrupt cache: parse the text file
+
+        data = self.parse_file(filepath)
+
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'data': data}, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+        return data
+
+    def _load_parsed(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Restore parser state from a cached parse_file() result.
+
+        Args:
+            data: Dictionary previously returned by parse_file()
+
+        Returns:
+            The same dictionary
+        """
+        self.global_properties = data['global']
+        self.objects = data['objects']
+        self.events = data['events']
+        self.object_summaries = {
+            obj_id: _ObjSummary(
+                name=states[0].get('Name'),
+                count=len(states),
+                first_ts=states[0]['timestamp'],
+                last_ts=states[-1]['timestamp'],
+            )
+            for obj_id, states in self.objects.items()
+            if states
+        }
+        return data
+
+    def iter_objects(self, filepath: str) -> Iterator[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]]:
+        """Yield complete objects from an ACMI file one at a time.
+
+        Objects are grouped exactly as in parse_file(): by ID, in order of
+        first appearance, with an ID that reappears after removal continuing
+        the same object. Since any object may still reappear, nothing is
+        yielded before the end of the file; each object's states are
+        released once yielded, so callers converting them one by one never
+        hold all the converted results at once.
+
+        Args:
+            filepath: Path to .txt.acmi file
+
+        Yields:
+            Tuples of (object_id, states, global_properties)
+
+        Raises:
+            ValueError: If file format is invalid
+            FileNotFoundError: If file doesn't exist
+        """
+        objects = {}  # obj_id -> list of states
+
+        for obj_id, state in self.iter_records(filepath):
+            states = objects.get(obj_id)
+            if states is None:
+                objects[obj_id] = [state]
+            else:
+                states.append(state)
+
+        for obj_id in list(objects):
+            yield obj_id, objects.pop(obj_id), self.global_properties
+
+    def iter_records(self, filepath: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream object states from an ACMI file without retaining them.
+
+        Global properties, events and per-object summaries are still
+        collected into ``global_properties``, ``events`` and
+        ``object_summaries`` as the file is read; only object states are
+        yielded, so callers that just need counts or a summary never hold the
+        whole file in memory.
+
+        Args:
+            filepath: Path to .txt.acmi file
+
+        Yields:
+            Tuples of (object_id, state) in file order
+
         Raises:
             ValueError: If file format is invalid
             FileNotFoundError: If file doesn't exist
         """
         self.current_time = 0.0
         self.global_properties = {}
-        self.objects = {}
+        self.object_summaries = {}
         self.events = []
 
         filepath = Path(filepath)
@@ -72,18 +445,35 @@ class ACMIParser:
                     continue
 
                 try:
-                    self._parse_line(line)
+                    record = self._parse_line(line)
                 except Exception as e:
                     # Continue parsing, but log error
                     print(f"Warning: Error parsing line {line_num}: {e}")
                     continue
 
-        return {
-            'global': self.global_properties,
-            'objects': self.objects,
-            'events': self.events,
-            'reference_time': self.global_properties.get('ReferenceTime', None),
-        }
+                if record is None or record[1] is None:
+                    continue
+                self._update_summary(*record)
+                yield record
+
+    def _update_summary(self, obj_id: str, state: Dict[str, Any]):
+        """Fold one object state into ``object_summaries``.
+
+        Args:
+            obj_id: Object ID
+            state: Parsed object state
+        """
+        summary = self.object_summaries.get(obj_id)
+        if summary is None:
+            self.object_summaries[obj_id] = _ObjSummary(
+                name=state.get('Name'),
+                count=1,
+                first_ts=state['timestamp'],
+                last_ts=state['timestamp'],
+            )
+        else:
+            summary.count += 1
+            summary.last_ts = state['timestamp']
 
     def _parse_header(self, f):
         """Parse and validate ACMI header.
@@ -112,27 +502,34 @@ class ACMIParser:
 
         Args:
             line: Stripped line from ACMI file
+
+        Returns:
+            (object_id, state) for object updates, (object_id, None) for
+            object removals, None otherwise
         """
+        if not line:
+            return None
+
+        # The line type is decided by its first character
+        first = line[0]
+
         # Time frame (e.g., #12.5)
-        if line.startswith('#'):
-            self.current_time = float(line[1:])
+        if first == '#':
+            self.current_time = _parse_float(line[1:])
             return
 
         # Remove object (e.g., -3000102)
-        if line.startswith('-'):
-            obj_id = line[1:]
-            # Could track removed objects if needed
-            return
+        if first == '-':
+            return line[1:], None
 
         # Object or global property update
-        if ',' in line:
+        comma = line.find(',')
+        if comma >= 0:
             # Split on first comma to separate ID from properties
-            parts = line.split(',', 1)
-            obj_id = parts[0].strip()
-            props_str = parts[1] if len(parts) > 1 else ""
+            obj_id = line[:comma].strip()
 
             # Parse properties
-            props = self._parse_properties(props_str)
+            props = self._parse_properties(line[comma + 1:])
             props['timestamp'] = self.current_time
 
             # Object ID "0" is global metadata
@@ -145,9 +542,9 @@ class ACMIParser:
                     self.events.append(event)
             else:
                 # Regular object update
-                if obj_id not in self.objects:
-                    self.objects[obj_id] = []
-                self.objects[obj_id].append(props)
+                return obj_id, props
+
+        return None
 
     def _parse_properties(self, props_str: str) -> Dict[str, Any]:
         """Parse comma-separated key=value properties.
@@ -174,7 +571,8 @@ class ACMIParser:
                 continue
 
             key, value = part.split('=', 1)
-            key = key.strip()
+            # Interned so every state shares one string object per key
+            key = sys.intern(key.strip())
             value = value.strip()
 
             # Parse Transform (T) specially
@@ -196,22 +594,33 @@ class ACMIParser:
         Returns:
             List of parts
         """
+        if '"' not in text:
+            parts = text.split(',')
+            if not parts[-1]:
+                parts.pop()
+            return parts
+
+        # Splitting on quotes leaves the text outside quotes at even indices;
+        # only commas there separate parts. Quote characters are kept.
         parts = []
-        current = []
-        in_quotes = False
-
-        for char in text:
-            if char == '"':
-                in_quotes = not in_quotes
-                current.append(char)
-            elif char == ',' and not in_quotes:
-                parts.append(''.join(current))
-                current = []
-            else:
-                current.append(char)
+        current = ''
+
+        for i, segment in enumerate(text.split('"')):
+            if i:
+                current += '"'
+            if i % 2:
+                current += segment
+                continue
+
+            pieces = segment.split(',')
+            current += pieces[0]
+            if len(pieces) > 1:
+                parts.append(current)
+                parts.extend(pieces[1:-1])
+                current = pieces[-1]
 
         if current:
-            parts.append(''.join(current))
+            parts.append(current)
 
         return parts
 
@@ -226,32 +635,8 @@ class ACMIParser:
         Returns:
             Dictionary with position, orientation, etc.
         """
-        parts = [float(x) for x in t_str.split('|')]
-
-        result = {}
-
-        if len(parts) >= 3:
-            lon, lat, alt = parts[0], parts[1], parts[2]
-            result['Longitude'] = lon
-            result['Latitude'] = lat
-            result['Altitude'] = alt
-
-        if len(parts) >= 6:
-            roll, pitch, yaw = parts[3], parts[4], parts[5]
-            result['Roll'] = roll
-            result['Pitch'] = pitch
-            result['Yaw'] = yaw
-
-        if len(parts) >= 8:
-            # U, V components (native coordinates)
-            result['U'] = parts[6]
-            result['V'] = parts[7]
-
-        if len(parts) >= 9:
-            # Heading (when using native coords)
-            result['Heading'] = parts[8]
-
-        return result
+        parts = list(map(_parse_float, t_str.split('|')))
+        return dict(zip(_TRANSFORM_KEY_SETS[min(len(parts), 9)], parts))
 
     def _parse_value(self, value: str) -> Any:
         """Parse a property value and convert to appropriate type.
@@ -264,14 +649,29 @@ class ACMIParser:
         """
         value = value.strip()
 
+        match = _VALUE_RE.fullmatch(value)
+        if match is not None:
+            kind = match.lastindex
+            if kind == 6:
+                return _parse_float(value)
+            if kind == 5:
+                return int(value)
+            if kind == 4:
+                # Remove quotes and unescape
+                return match.group(4).replace('\\"', '"').replace('\\,', ',')
+            return _VALUE_LITERALS[kind]
+
+        # Other forms (e.g. "1_000", "inf", lone quotes) take the general path
+        lowered = value.lower()
+
         # Boolean
-        if value.lower() == 'true':
+        if lowered == 'true':
             return True
-        if value.lower() == 'false':
+        if lowered == 'false':
             return False
 
         # Null
-        if value.lower() == 'null':
+        if lowered == 'null':
             return None
 
         # Quoted string
@@ -281,7 +681,7 @@ class ACMIParser:
 
         # Number (int or float)
         try:
-            if '.' in value or 'e' in value.lower():
+            if '.' in value or 'e' in lowered:
                 return float(value)
             else:
                 return int(value)
@@ -329,11 +729,12 @@ class ACMIParser:
             name: Object name to search for
 
         Returns:
-            Tuple of (object_id, states) or None if not found
+            Tuple of (object_id, states) or None if not found; states is an
+            ObjectTrack after a columnar parse
         """
         for obj_id, states in self.objects.items():
             # Check first state for Name property
-            if states and states[0].get('Name') == name:
+            if states and _first_name(states) == name:
                 return (obj_id, states)
         return None
 
@@ -346,7 +747,7 @@ class ACMIParser:
         names = {}
         for obj_id, states in self.objects.items():
             if states:
-                name = states[0].get('Name')
+                name = _first_name(states)
                 if name:
                     names[obj_id] = name
         return names
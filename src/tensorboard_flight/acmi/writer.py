@@ -4,12 +4,32 @@ This module writes FlightEpisode data to ACMI 2.2 text format with Custom Agent
 Metadata (CAM) extensions for RL/AI data.
 """
 
+import functools
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TextIO, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 from .cam_schema import CAMEncoder, CAMKeys
-from .geo_utils import cartesian_to_geodetic, compute_airspeed_from_velocity
+from .geo_utils import (
+    cartesian_to_geodetic,
+    cartesian_to_geodetic_batch,
+    compute_airspeed_from_velocity,
+)
+
+# Trajectory lines are joined and written in batches of this many datapoints
+_WRITE_BATCH = 1000
+
+# Fixed prefix of each datapoint (time frame, transform, IAS, throttle) as
+# bound str.format templates, with and without orientation
+_FRAME_HEAD = (
+    "#{:.3f}\n{},T={:.7f}|{:.7f}|{:.2f}|{:.2f}|{:.2f}|{:.2f},IAS={:.2f},Throttle={:.3f}"
+).format
+_FRAME_HEAD_POSITION = "#{:.3f}\n{},T={:.7f}|{:.7f}|{:.2f},IAS={:.2f},Throttle={:.3f}".format
 
 
 class ACMIWriter:
@@ -53,11 +73,26 @@ class ACMIWriter:
         # Create parent directory if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
             self._write_header(f, episode)
             self._write_trajectory(f, episode)
             self._write_footer(f, episode)
 
+    def _render_episode(self, episode) -> str:
+        """Format a complete episode as ACMI text in memory.
+
+        Args:
+            episode: FlightEpisode instance
+
+        Returns:
+            The file contents write_episode() would produce
+        """
+        buf = io.StringIO()
+        self._write_header(buf, episode)
+        self._write_trajectory(buf, episode)
+        self._write_footer(buf, episode)
+        return buf.getvalue()
+
     def _write_header(self, f: TextIO, episode):
         """Write ACMI file header and global metadata.
 
@@ -116,75 +151,86 @@ class ACMIWriter:
         f.write(f"{obj_id},{','.join(props)}\n")
         f.write("\n")
 
-        # Write each datapoint
-        last_idx = len(episode.trajectory) - 1
-        for i, datapoint in enumerate(episode.trajectory):
-            self._write_datapoint(f, obj_id, datapoint, is_last=(i == last_idx))
+        # Per-timestep CAM properties are encoded column-wise for the whole
+        # episode and only zipped back into rows when formatting
+        cam_rows = self._format_cam_columns(
+            self.encoder.encode_episode_columns(episode)
+        )
+
+        # Geodetic positions for the whole trajectory in one vectorized pass
+        geodetic = cartesian_to_geodetic_batch(
+            [dp.position for dp in episode.trajectory], self.reference_point
+        ).tolist()
+
+        # Write each datapoint; lines are joined and written in batches
+        chunk = []
+        rows = zip(episode.trajectory, cam_rows, geodetic)
+        for i, (datapoint, cam_props, lat_lon_alt) in enumerate(rows):
+            chunk.append(self._format_datapoint(obj_id, datapoint, cam_props, lat_lon_alt))
 
             # Add newline every 10 frames for readability
             if i % 10 == 9:
-                f.write("\n")
+                chunk.append("\n")
+
+            if len(chunk) >= _WRITE_BATCH:
+                f.write(''.join(chunk))
+                chunk.clear()
 
-    def _write_datapoint(self, f: TextIO, obj_id: str, dp, is_last: bool):
-        """Write single timestep with full CAM metadata.
+        f.write(''.join(chunk))
+
+    def _format_datapoint(
+        self,
+        obj_id: str,
+        dp,
+        cam_props: list,
+        lat_lon_alt: Optional[Tuple[float, float, float]] = None,
+    ) -> str:
+        """Format single timestep with full CAM metadata.
 
         Args:
-            f: File object
             obj_id: Object ID hex string
             dp: FlightDataPoint instance
-            is_last: Whether this is the last datapoint
+            cam_props: Formatted CAM "key=value" strings for this timestep
+            lat_lon_alt: Precomputed geodetic position (default: converted
+                         from dp.position)
+
+        Returns:
+            Time frame line and object line, newline-terminated
         """
-        # Time frame
-        f.write(f"#{dp.timestamp:.3f}\n")
 
         # Convert position to geodetic
-        lat, lon, alt = cartesian_to_geodetic(dp.position, self.reference_point)
-
-        # Build property list
-        props = []
-
-        # Transform (position + orientation)
-        if dp.orientation is not None:
-            transform = (
-                f"{lon:.7f}|{lat:.7f}|{alt:.2f}|"
-                f"{dp.orientation.roll:.2f}|{dp.orientation.pitch:.2f}|{dp.orientation.yaw:.2f}"
-            )
+        if lat_lon_alt is None:
+            lat_lon_alt = cartesian_to_geodetic(dp.position, self.reference_point)
+        lat, lon, alt = lat_lon_alt
+
+        telemetry = dp.telemetry
+        orientation = dp.orientation
+
+        # Time frame, transform (position + orientation), IAS and throttle
+        if orientation is not None:
+            parts = [_FRAME_HEAD(
+                dp.timestamp, obj_id, lon, lat, alt,
+                orientation.roll, orientation.pitch, orientation.yaw,
+                telemetry.airspeed, telemetry.throttle,
+            )]
         else:
             # Position only
-            transform = f"{lon:.7f}|{lat:.7f}|{alt:.2f}"
+            parts = [_FRAME_HEAD_POSITION(
+                dp.timestamp, obj_id, lon, lat, alt,
+                telemetry.airspeed, telemetry.throttle,
+            )]
 
-        props.append(f"T={transform}")
+        if abs(telemetry.aoa) > 0.01:
+            parts.append(f"AOA={telemetry.aoa:.2f}")
+        if abs(telemetry.aos) > 0.01:
+            parts.append(f"AOS={telemetry.aos:.2f}")
+        if orientation:
+            parts.append(f"Heading={telemetry.heading:.2f}")
 
-        # Standard ACMI telemetry
-        props.append(f"IAS={dp.telemetry.airspeed:.2f}")
-        props.append(f"Throttle={dp.telemetry.throttle:.3f}")
+        # CAM: G-force, angular velocity, control surfaces, RL metrics
+        parts.extend(cam_props)
 
-        if abs(dp.telemetry.aoa) > 0.01:
-            props.append(f"AOA={dp.telemetry.aoa:.2f}")
-        if abs(dp.telemetry.aos) > 0.01:
-            props.append(f"AOS={dp.telemetry.aos:.2f}")
-        if dp.orientation:
-            props.append(f"Heading={dp.telemetry.heading:.2f}")
-
-        # CAM: G-force
-        g_props = self.encoder.encode_g_force(dp.telemetry.g_force)
-        props.extend(self._format_properties(g_props))
-
-        # CAM: Angular velocity (body rates)
-        if dp.angular_velocity is not None:
-            angular_props = self.encoder.encode_angular_velocity(dp.angular_velocity)
-            props.extend(self._format_properties(angular_props))
-
-        # CAM: Control surfaces
-        control_props = self.encoder.encode_control_surfaces(dp.telemetry)
-        props.extend(self._format_properties(control_props))
-
-        # CAM: RL metrics
-        if dp.rl_metrics:
-            rl_props = self.encoder.encode_rl_metrics(dp.rl_metrics)
-            props.extend(self._format_properties(rl_props))
-
-        f.write(f"{obj_id},{','.join(props)}\n")
+        return ','.join(parts) + '\n'
 
     def _write_footer(self, f: TextIO, episode):
         """Write final metadata and remove object.
@@ -209,6 +255,32 @@ class ACMIWriter:
         f.write(f"\n#{last_time + 0.1:.3f}\n")
         f.write(f"-{obj_id}\n")
 
+    def _format_cam_columns(self, columns: dict):
+        """Format CAM columns as per-timestep lists of key=value strings.
+
+        Args:
+            columns: Dictionary of CAM key -> float array (NaN = absent)
+
+        Yields:
+            List of "key=value" strings for each timestep
+        """
+        # Each column is formatted to "key=value" strings in one vectorized call
+        formatted = [
+            np.char.mod(f"{key.replace('%', '%%')}=%.6f", column).tolist()
+            for key, column in columns.items()
+        ]
+        absent = [np.isnan(column) for column in columns.values()]
+
+        if not any(mask.any() for mask in absent):
+            for row in zip(*formatted):
+                yield list(row)
+            return
+
+        # Skip properties absent (NaN) at a timestep
+        present = [(~mask).tolist() for mask in absent]
+        for row, row_present in zip(zip(*formatted), zip(*present)):
+            yield [prop for prop, keep in zip(row, row_present) if keep]
+
     def _format_properties(self, props: dict) -> list:
         """Format properties dict as key=value strings.
 
@@ -241,10 +313,13 @@ class ACMIWriter:
 
         return formatted
 
-    def _agent_id_to_hex(self, agent_id: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _agent_id_to_hex(agent_id: str) -> str:
         """Convert agent_id to hex object ID.
 
-        Uses hash to generate consistent hex ID from agent name.
+        Uses hash to generate consistent hex ID from agent name. Memoized, as
+        each episode needs its ID for the trajectory and again for the footer.
 
         Args:
             agent_id: Agent identifier string
@@ -257,13 +332,28 @@ class ACMIWriter:
         return f"{hash_val:08x}"
 
 
-def write_multiple_episodes(episodes: list, output_dir: str, prefix: str = "episode"):
+def _write_text(path: Path, text: str):
+    """Write text to a file (runs on a write-behind thread)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def write_multiple_episodes(
+    episodes: list,
+    output_dir: str,
+    prefix: str = "episode",
+    max_workers: int = 4,
+):
     """Write multiple episodes to separate ACMI files.
 
+    Episodes are formatted in this thread while earlier files are written
+    by a pool of I/O threads, so formatting overlaps with disk writes.
+
     Args:
         episodes: List of FlightEpisode instances
         output_dir: Output directory path
         prefix: Filename prefix (default: "episode")
+        max_workers: Number of concurrent file writes
 
     Example:
         >>> episodes = [episode1, episode2, episode3]
@@ -275,10 +365,29 @@ def write_multiple_episodes(episodes: list, output_dir: str, prefix: str = "epis
 
     writer = ACMIWriter()
 
-    for i, episode in enumerate(episodes):
-        filename = f"{prefix}_{i:04d}.txt.acmi"
-        output_path = output_dir / filename
+    # (filename, timesteps, future) of writes in flight, oldest first; bounded
+    # so formatted episodes do not pile up in memory ahead of the disk
+    pending = deque()
+
+    def finish_oldest():
+        filename, timesteps, future = pending.popleft()
+        future.result()
+        print(f"Wrote {filename}: {timesteps} timesteps")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for i, episode in enumerate(episodes):
+            filename = f"{prefix}_{i:04d}.txt.acmi"
+            output_path = output_dir / filename
+
+            text = writer._render_episode(episode)
+            pending.append((
+                filename,
+                len(episode.trajectory),
+                pool.submit(_write_text, output_path, text),
+            ))
 
-        writer.write_episode(episode, str(output_path))
+            if len(pending) > 2 * max_workers:
+                finish_oldest()
 
-        print(f"Wrote {filename}: {len(episode.trajectory)} timesteps")
+        while pending:
+            finish_oldest()
@@ -1,9 +1,14 @@
 """Data structures for flight trajectory data."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 import numpy as np
 
+# Slotted dataclasses (no per-instance __dict__) on Python 3.10+, where
+# dataclass() supports generating __slots__ alongside field defaults
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def _to_python_type(value: Any) -> Any:
     """Convert numpy types to native Python types for JSON serialization."""
@@ -18,7 +23,7 @@ def _to_python_type(value: Any) -> Any:
     return value
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Orientation:
     """Aircraft orientation in Euler angles (degrees)."""
     roll: float      # Bank angle: positive = right wing down
@@ -34,7 +39,7 @@ class Orientation:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Telemetry:
     """Core flight telemetry data."""
     airspeed: float           # True airspeed (m/s)
@@ -76,7 +81,7 @@ class Telemetry:
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RLMetrics:
     """Reinforcement learning specific metrics."""
     reward: float                      # Step reward
@@ -110,7 +115,7 @@ class RLMetrics:
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Event:
     """Discrete event marker."""
     timestamp: float
@@ -132,7 +137,7 @@ class Event:
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FlightDataPoint:
     """Single timestep of flight data."""
     timestamp: float                    # Simulation time (seconds)
@@ -170,7 +175,7 @@ class FlightDataPoint:
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FlightEpisode:
     """Complete flight episode/trajectory."""
     episode_id: str                     # Unique identifier
@@ -2,8 +2,9 @@
 
 import json
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Any, Union
 import numpy as np
 
 from tensorboard.compat.proto.summary_pb2 import Summary
@@ -76,6 +77,9 @@ class FlightLogger:
         # Last flush time
         self.last_flush_time = time.time()
 
+        # Nesting depth of batched_writes() blocks
+        self._deferred_flush_depth = 0
+
     def start_episode(self, agent_id: str) -> None:
         """Start a new episode.
 
@@ -200,6 +204,145 @@ class FlightLogger:
         self.current_episode.append(data_point)
 
         # Check if we should flush
+        if self._deferred_flush_depth:
+            return
+        if len(self.current_episode) >= self.max_buffer_size:
+            self._maybe_flush()
+        elif time.time() - self.last_flush_time > self.flush_secs:
+            self._maybe_flush()
+
+    def log_flight_data_batch(
+        self,
+        steps: Sequence[int],
+        agent_id: str,
+        positions: np.ndarray,
+        orientations: np.ndarray,
+        velocities: np.ndarray,
+        telemetry: Dict[str, np.ndarray],
+        rl_metrics: Dict[str, Any],
+        angular_velocities: Optional[np.ndarray] = None,
+        timestamps: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Log many timesteps of flight data at once from columnar arrays.
+
+        Equivalent to calling :meth:`log_flight_data` once per step, but the
+        inputs are converted in bulk and the flush check runs once per batch.
+
+        Args:
+            steps: Episode step numbers, shape (N,)
+            agent_id: Agent identifier
+            positions: (x, y, z) positions in meters, shape (N, 3)
+            orientations: (roll, pitch, yaw) in degrees, shape (N, 3)
+            velocities: (vx, vy, vz) in m/s, shape (N, 3)
+            telemetry: Dictionary of telemetry name -> values of shape (N,)
+            rl_metrics: Dictionary of RL metric name -> values of shape (N,).
+                Must include 'reward' (N,) and 'action' (N, action_dim);
+                'reward_components' may map component name -> (N,) values.
+            angular_velocities: (p, q, r) body rates in rad/s, shape (N, 3)
+            timestamps: Simulation times (defaults to step numbers)
+        """
+        # Auto-start episode if needed
+        if self.current_episode is None:
+            self.start_episode(agent_id)
+
+        # Check agent consistency
+        if agent_id != self.current_agent_id:
+            raise ValueError(
+                f"Agent ID mismatch: {agent_id} != {self.current_agent_id}. "
+                "Call end_episode() before switching agents."
+            )
+
+        steps = np.asarray(steps).tolist()
+        n = len(steps)
+
+        if timestamps is None:
+            timestamps = [float(step) for step in steps]
+        else:
+            timestamps = np.asarray(timestamps, dtype=np.float64).tolist()
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(n, 3)
+        velocities = np.asarray(velocities, dtype=np.float64).reshape(n, 3)
+        if angular_velocities is None:
+            angular_velocities = np.zeros((n, 3))
+        else:
+            angular_velocities = np.asarray(angular_velocities, dtype=np.float64).reshape(n, 3)
+        orientations = np.asarray(orientations, dtype=np.float64).reshape(n, 3).tolist()
+
+        def column(source: Dict[str, Any], key: str, default: Any) -> List[Any]:
+            if key in source and source[key] is not None:
+                return np.asarray(source[key], dtype=np.float64).reshape(n).tolist()
+            return [default] * n
+
+        airspeed = column(telemetry, 'airspeed', 0.0)
+        altitude = column(telemetry, 'altitude', 0.0)
+        g_force = column(telemetry, 'g_force', 1.0)
+        throttle = column(telemetry, 'throttle', 0.0)
+        aoa = column(telemetry, 'aoa', 0.0)
+        aos = column(telemetry, 'aos', 0.0)
+        heading = column(telemetry, 'heading', 0.0)
+        vertical_speed = column(telemetry, 'vertical_speed', 0.0)
+        turn_rate = column(telemetry, 'turn_rate', 0.0)
+        bank_angle = column(telemetry, 'bank_angle', None)
+        aileron = column(telemetry, 'aileron', None)
+        elevator = column(telemetry, 'elevator', None)
+        rudder = column(telemetry, 'rudder', None)
+
+        rewards = column(rl_metrics, 'reward', 0.0)
+        actions = np.asarray(rl_metrics['action'], dtype=np.float64).reshape(n, -1).tolist()
+        policy_logprob = column(rl_metrics, 'policy_logprob', None)
+        value_estimate = column(rl_metrics, 'value_estimate', None)
+        advantage = column(rl_metrics, 'advantage', None)
+        entropy = column(rl_metrics, 'entropy', None)
+
+        component_columns = {
+            name: column(rl_metrics['reward_components'], name, 0.0)
+            for name in (rl_metrics.get('reward_components') or {})
+        }
+
+        for i in range(n):
+            self.cumulative_reward += rewards[i]
+            roll, pitch, yaw = orientations[i]
+
+            self.current_episode.append(FlightDataPoint(
+                timestamp=timestamps[i],
+                step=steps[i],
+                position=positions[i],
+                orientation=Orientation(roll=roll, pitch=pitch, yaw=yaw),
+                velocity=velocities[i],
+                angular_velocity=angular_velocities[i],
+                telemetry=Telemetry(
+                    airspeed=airspeed[i],
+                    altitude=altitude[i],
+                    g_force=g_force[i],
+                    throttle=throttle[i],
+                    aoa=aoa[i],
+                    aos=aos[i],
+                    heading=heading[i],
+                    vertical_speed=vertical_speed[i],
+                    turn_rate=turn_rate[i],
+                    bank_angle=roll if bank_angle[i] is None else bank_angle[i],
+                    aileron=aileron[i],
+                    elevator=elevator[i],
+                    rudder=rudder[i],
+                ),
+                rl_metrics=RLMetrics(
+                    reward=rewards[i],
+                    cumulative_reward=self.cumulative_reward,
+                    action=actions[i],
+                    policy_logprob=policy_logprob[i],
+                    value_estimate=value_estimate[i],
+                    advantage=advantage[i],
+                    entropy=entropy[i],
+                    reward_components=(
+                        {name: values[i] for name, values in component_columns.items()}
+                        if component_columns else None
+                    ),
+                ),
+            ))
+
+        # Check if we should flush (once per batch)
+        if self._deferred_flush_depth:
+            return
         if len(self.current_episode) >= self.max_buffer_size:
             self._maybe_flush()
         elif time.time() - self.last_flush_time > self.flush_secs:
@@ -294,6 +437,27 @@ class FlightLogger:
         self.writer.flush()
         self.last_flush_time = time.time()
 
+    @contextmanager
+    def batched_writes(self) -> Iterator["FlightLogger"]:
+        """Defer periodic flushes until the block exits.
+
+        Useful around per-step logging loops, which otherwise flush the
+        writer on every step once the buffer size or flush interval is hit.
+        Episodes ended inside the block are still written immediately.
+
+        Example:
+            >>> with logger.batched_writes():
+            >>>     for step in range(num_steps):
+            >>>         logger.log_flight_data(...)
+        """
+        self._deferred_flush_depth += 1
+        try:
+            yield self
+        finally:
+            self._deferred_flush_depth -= 1
+            if not self._deferred_flush_depth:
+                self.flush()
+
     def _maybe_flush(self) -> None:
         """Flush data if buffer is full or timeout reached."""
         self.writer.flush()
@@ -2,7 +2,13 @@
 
 import unittest
 from tensorboard_flight.acmi.cam_schema import CAMEncoder, CAMDecoder, CAMKeys
-from tensorboard_flight.data.schema import RLMetrics, Telemetry
+from tensorboard_flight.data.schema import (
+    FlightDataPoint,
+    FlightEpisode,
+    Orientation,
+    RLMetrics,
+    Telemetry,
+)
 
 
 class TestCAMEncoder(unittest.TestCase):
@@ -25,6 +31,24 @@ class TestCAMEncoder(unittest.TestCase):
         self.assertEqual(props['Agent.Action.2'], 0.3)
         self.assertEqual(props['Agent.Action.3'], 0.7)
 
+    def test_encode_rl_metrics_numpy_action(self):
+        """Test encoding a numpy action array."""
+        import numpy as np
+
+        metrics = RLMetrics(
+            reward=0.0,
+            cumulative_reward=0.0,
+            action=np.array([0.25, -0.5, 1], dtype=np.float32),
+        )
+
+        props = CAMEncoder.encode_rl_metrics(metrics)
+
+        self.assertEqual(props['Agent.Action.0'], 0.25)
+        self.assertEqual(props['Agent.Action.1'], -0.5)
+        self.assertEqual(props['Agent.Action.2'], 1.0)
+        self.assertIs(type(props['Agent.Action.2']), float)
+        self.assertNotIn('Agent.Action.3', props)
+
     def test_encode_rl_metrics_optional(self):
         """Test encoding optional RL metrics."""
         metrics = RLMetrics(
@@ -92,6 +116,86 @@ class TestCAMEncoder(unittest.TestCase):
         self.assertEqual(props[CAMKeys.ANGULAR_VEL_Q], 0.2)
         self.assertEqual(props[CAMKeys.ANGULAR_VEL_R], 0.3)
 
+    def test_encode_episode_columns(self):
+        """Test column-wise encoding matches the per-timestep encoders."""
+        import math
+
+        def datapoint(step, rudder, rl_metrics):
+            return FlightDataPoint(
+                timestamp=step * 0.1,
+                step=step,
+                position=(0.0, 0.0, 1000.0),
+                orientation=Orientation(roll=0.0, pitch=0.0, yaw=0.0),
+                velocity=(50.0, 0.0, 0.0),
+                angular_velocity=(0.1, 0.2, 0.3),
+                telemetry=Telemetry(
+                    airspeed=50.0, altitude=1000.0, g_force=1.0 + step,
+                    throttle=0.7, aoa=5.0, aos=0.5, heading=90.0,
+                    vertical_speed=0.0, turn_rate=0.0, bank_angle=0.0,
+                    aileron=0.1, elevator=-0.05, rudder=rudder,
+                ),
+                rl_metrics=rl_metrics,
+            )
+
+        trajectory = [
+            datapoint(0, 0.02, RLMetrics(
+                reward=1.0, cumulative_reward=1.0, action=[0.1, 0.2],
+                value_estimate=3.0, reward_components={'tracking': 0.5},
+            )),
+            datapoint(1, None, None),
+            datapoint(2, 0.03, RLMetrics(
+                reward=2.0, cumulative_reward=3.0, action=[0.3, 0.4],
+            )),
+        ]
+        episode = FlightEpisode(
+            episode_id="ep", agent_id="agent", episode_number=0,
+            start_time=0.0, duration=0.3, total_steps=3, total_reward=3.0,
+            success=True, termination_reason="success", trajectory=trajectory,
+        )
+
+        columns = CAMEncoder.encode_episode_columns(episode)
+
+        for i, dp in enumerate(trajectory):
+            expected = {}
+            expected.update(CAMEncoder.encode_g_force(dp.telemetry.g_force))
+            expected.update(CAMEncoder.encode_angular_velocity(dp.angular_velocity))
+            expected.update(CAMEncoder.encode_control_surfaces(dp.telemetry))
+            if dp.rl_metrics:
+                expected.update(CAMEncoder.encode_rl_metrics(dp.rl_metrics))
+
+            row = {
+                key: column[i] for key, column in columns.items()
+                if not math.isnan(column[i])
+            }
+            self.assertEqual(list(row), list(expected))
+            for key, value in expected.items():
+                self.assertAlmostEqual(row[key], value)
+
+    def test_encode_rl_metrics_columns(self):
+        """Test batch encoding of RL metrics from arrays."""
+        import numpy as np
+
+        columns = CAMEncoder.encode_rl_metrics_columns(
+            rewards=np.array([1.0, 2.0], dtype=np.float32),
+            cumulative_rewards=[1.0, 3.0],
+            actions=np.array([[0.1, 0.2], [0.3, 0.4]]),
+            entropy=[0.8, 0.7],
+            reward_components={'tracking': [0.5, 0.6]},
+        )
+
+        self.assertEqual(list(columns), [
+            CAMKeys.REWARD_INSTANT,
+            CAMKeys.REWARD_CUM,
+            'Agent.Action.0',
+            'Agent.Action.1',
+            CAMKeys.ENTROPY,
+            'Agent.Reward.Tracking',
+        ])
+        for column in columns.values():
+            self.assertEqual(column.dtype, np.float64)
+        np.testing.assert_allclose(columns['Agent.Action.1'], [0.2, 0.4])
+        np.testing.assert_allclose(columns[CAMKeys.REWARD_CUM], [1.0, 3.0])
+
 
 class TestCAMDecoder(unittest.TestCase):
     """Test CAM decoding."""
@@ -135,6 +239,71 @@ class TestCAMDecoder(unittest.TestCase):
         self.assertEqual(metrics['reward_components']['tracking'], 0.8)
         self.assertEqual(metrics['reward_components']['stability'], 0.2)
 
+    def test_decode_dotted_keys_use_last_segment(self):
+        """Test nested reward and config keys decode to their last segment."""
+        props = {
+            CAMKeys.REWARD_INSTANT: 1.0,
+            'Agent.Reward.shaping.Dist': 0.3,
+            'Agent.Config.lr.schedule': 'cosine',
+        }
+
+        expected = {'dist': 0.3}
+        self.assertEqual(CAMDecoder.decode_rl_metrics(props)['reward_components'], expected)
+        self.assertEqual(CAMDecoder.make_specialized(props.keys())(props)['reward_components'], expected)
+        self.assertEqual(CAMDecoder.decode_all(props)['rl_metrics']['reward_components'], expected)
+        self.assertEqual(CAMDecoder.decode_episode_metadata(props)['config'], {'schedule': 'cosine'})
+
+    def test_make_specialized_matches_generic_decoder(self):
+        """Test the key-set specialized decoder matches decode_rl_metrics."""
+        props_list = [
+            {
+                CAMKeys.REWARD_INSTANT: 1.0,
+                CAMKeys.REWARD_CUM: 2.0,
+                'Agent.Action.0': 0.1,
+                'Agent.Action.1': 0.2,
+                'Agent.Action.3': 0.4,
+                CAMKeys.VALUE: 5.0,
+                'Agent.Reward.Tracking': 0.8,
+                'IAS': 50.0,
+            },
+            {'Name': 'agent', CAMKeys.EPISODE_ID: 'ep'},
+        ]
+
+        for props in props_list:
+            decode = CAMDecoder.make_specialized(props.keys())
+            self.assertEqual(decode(props), CAMDecoder.decode_rl_metrics(props))
+            self.assertIs(CAMDecoder.make_specialized(props.keys()), decode)
+
+    def test_decode_all_matches_separate_decoders(self):
+        """Test the fused decoder matches the per-section decoders."""
+        props_list = [
+            {
+                CAMKeys.REWARD_INSTANT: 1.0,
+                'Agent.Action.0': 0.1,
+                'Agent.Action.1': 0.2,
+                'Agent.Reward.Tracking': 0.8,
+                CAMKeys.ANGULAR_VEL_P: 0.1,
+                CAMKeys.ANGULAR_VEL_R: 0.3,
+                CAMKeys.G_FORCE: 4.5,
+                CAMKeys.CONTROL_ELEVATOR: -0.05,
+                'IAS': 50.0,
+            },
+            {'Name': 'agent', CAMKeys.EPISODE_ID: 'ep'},
+        ]
+
+        for props in props_list:
+            expected = {
+                'angular_velocity': CAMDecoder.decode_angular_velocity(props),
+                'telemetry': {
+                    'g_force': CAMDecoder.decode_g_force(props),
+                    **CAMDecoder.decode_control_surfaces(props),
+                },
+                'rl_metrics': CAMDecoder.decode_rl_metrics(props),
+            }
+            self.assertEqual(CAMDecoder.decode_all(props), expected)
+            decode = CAMDecoder.make_specialized_all(props.keys())
+            self.assertEqual(decode(props), expected)
+
     def test_decode_control_surfaces(self):
         """Test decoding control surfaces."""
         props = {
@@ -182,6 +351,17 @@ class TestCAMDecoder(unittest.TestCase):
         self.assertIn('config', metadata)
         self.assertEqual(metadata['config']['policy'], 'PPO')
 
+    def test_decode_episode_metadata_success_values(self):
+        """Test Agent.Success decoding of strings, bools and numbers."""
+        cases = [
+            ('true', True), ('tRue', True), ('false', False), ('yes', False),
+            (True, True), (False, False), (1, True), (0, False), (2.0, True), (0.5, True),
+        ]
+
+        for value, expected in cases:
+            metadata = CAMDecoder.decode_episode_metadata({CAMKeys.SUCCESS: value})
+            self.assertIs(metadata['success'], expected, value)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,8 +4,12 @@ import unittest
 import math
 from tensorboard_flight.acmi.geo_utils import (
     geodetic_to_cartesian,
+    geodetic_to_cartesian_batch,
+    make_geo_to_cart,
     cartesian_to_geodetic,
+    cartesian_to_geodetic_batch,
     compute_velocity_from_airspeed,
+    compute_velocity_from_airspeed_batch,
     compute_airspeed_from_velocity,
     normalize_longitude,
     normalize_heading,
@@ -105,6 +109,50 @@ class TestGeoConversion(unittest.TestCase):
         self.assertAlmostEqual(pitch1, pitch2, places=1)
         self.assertAlmostEqual(yaw1, yaw2, places=1)
 
+    def test_geodetic_to_cartesian_batch_matches_scalar(self):
+        """Test batch conversion matches the scalar conversion."""
+        ref = (34.9054, -117.8839, 700.0)
+        points = [(34.9154, -117.8839, 700.0), (34.9, -117.87, 1200.0)]
+
+        positions = geodetic_to_cartesian_batch(
+            [p[0] for p in points], [p[1] for p in points], [p[2] for p in points], ref
+        )
+
+        self.assertEqual(positions.shape, (2, 3))
+        for row, point in zip(positions, points):
+            for got, expected in zip(row, geodetic_to_cartesian(*point, ref)):
+                self.assertAlmostEqual(got, expected, places=6)
+
+    def test_make_geo_to_cart_matches_scalar(self):
+        """Test the reference-bound conversion matches geodetic_to_cartesian."""
+        for ref in (None, (34.9054, -117.8839, 700.0)):
+            geo_to_cart = make_geo_to_cart(ref)
+            for point in [(34.9154, -117.8839, 700.0), (34.9, -117.87, 1200.0)]:
+                self.assertEqual(geo_to_cart(*point), geodetic_to_cartesian(*point, ref))
+
+    def test_cartesian_to_geodetic_batch_matches_scalar(self):
+        """Test batch geodetic conversion matches cartesian_to_geodetic."""
+        positions = [(0.0, 0.0, 0.0), (1000.0, -2500.0, 300.0), (-7.5, 42.0, 1e4)]
+        for ref in (None, (34.9054, -117.8839, 700.0)):
+            geodetic = cartesian_to_geodetic_batch(positions, ref)
+
+            self.assertEqual(geodetic.shape, (3, 3))
+            for row, pos in zip(geodetic.tolist(), positions):
+                self.assertEqual(tuple(row), cartesian_to_geodetic(pos, ref))
+
+    def test_compute_velocity_from_airspeed_batch_matches_scalar(self):
+        """Test batch velocity matches the scalar computation."""
+        samples = [(50.0, 10.0, 45.0), (80.0, -5.0, 270.0)]
+
+        velocities = compute_velocity_from_airspeed_batch(
+            [s[0] for s in samples], [s[1] for s in samples], [s[2] for s in samples]
+        )
+
+        self.assertEqual(velocities.shape, (2, 3))
+        for row, sample in zip(velocities, samples):
+            for got, expected in zip(row, compute_velocity_from_airspeed(*sample)):
+                self.assertAlmostEqual(got, expected, places=9)
+
 
 class TestUtilities(unittest.TestCase):
     """Test utility functions."""
@@ -0,0 +1,64 @@
+"""Tests for ACMILogger export."""
+
+import unittest
+import tempfile
+import threading
+from pathlib import Path
+
+from tensorboard_flight.acmi.logger import ACMILogger
+
+
+class TestACMILogger(unittest.TestCase):
+    """Test automatic ACMI export."""
+
+    def setUp(self):
+        """Create temp directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up."""
+        self.temp_dir.cleanup()
+
+    def log_episode(self, logger):
+        """Log a one-step episode at the local origin."""
+        logger.start_episode(agent_id="test_agent")
+        logger.log_flight_data(
+            step=0,
+            agent_id="test_agent",
+            position=(0.0, 0.0, 100.0),
+            orientation=(0.0, 0.0, 0.0),
+            velocity=(25.0, 0.0, 0.0),
+            telemetry={'airspeed': 25.0, 'altitude': 100.0, 'throttle': 0.8},
+            rl_metrics={'reward': 1.0, 'action': [0.1, 0.2, 0.3, 0.8]},
+        )
+        logger.end_episode(success=True)
+
+    def test_pending_export_keeps_reference_point(self):
+        """Test a queued export uses the reference point set when it was queued."""
+        logger = ACMILogger(
+            str(self.temp_path),
+            enable_acmi_export=True,
+            reference_point=(10.0, 20.0, 0.0),
+        )
+
+        # Hold the export thread so the episode's export stays pending
+        release = threading.Event()
+        logger._acmi_pool.submit(release.wait)
+        try:
+            self.log_episode(logger)
+            logger.set_acmi_reference_point(50.0, 60.0, 0.0)
+        finally:
+            release.set()
+
+        files = logger.get_acmi_files()
+        logger.close()
+
+        self.assertEqual(len(files), 1)
+        content = files[0].read_text(encoding='utf-8')
+        self.assertIn(",T=20.0000000|10.0000000|100.00", content)
+        self.assertEqual(logger.acmi_writer.reference_point, (50.0, 60.0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
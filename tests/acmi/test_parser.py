@@ -1,9 +1,13 @@
 """Tests for ACMI parser."""
 
+import math
 import unittest
 import tempfile
 from pathlib import Path
-from tensorboard_flight.acmi.parser import ACMIParser
+
+import numpy as np
+
+from tensorboard_flight.acmi.parser import ACMIParser, ObjectTrack
 
 
 class TestACMIParser(unittest.TestCase):
@@ -140,6 +144,124 @@ class TestACMIParser(unittest.TestCase):
         self.assertIn('a01', names)
         self.assertEqual(names['a01'], 'TestAgent')
 
+    def test_iter_records_streams_states(self):
+        """Test streaming states with running object summaries."""
+        filepath = self.create_sample_acmi(with_cam=True)
+
+        parser = ACMIParser()
+        records = list(parser.iter_records(str(filepath)))
+
+        self.assertEqual([obj_id for obj_id, _ in records], ['a01', 'a01', 'a01'])
+        self.assertEqual(records[1][1]['Agent.Reward.Instant'], 1.5)
+        self.assertEqual(parser.objects, {})
+        self.assertEqual(parser.global_properties['Title'], 'Test Flight')
+
+        summary = parser.object_summaries['a01']
+        self.assertEqual(summary.name, 'TestAgent')
+        self.assertEqual(summary.count, 3)
+        self.assertAlmostEqual(summary.first_ts, 0.0)
+        self.assertAlmostEqual(summary.last_ts, 0.2)
+
+    def test_iter_objects_matches_parse_file(self):
+        """Test iter_objects groups objects like parse_file, across removals."""
+        filepath = self.temp_path / 'objects.txt.acmi'
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("FileType=text/acmi/tacview\n")
+            f.write("FileVersion=2.2\n")
+            f.write("#0.0\n")
+            f.write('a01,Name="First",IAS=50.0\n')
+            f.write('a02,Name="Second",IAS=60.0\n')
+            f.write("#0.1\n")
+            f.write("a02,IAS=61.0\n")
+            f.write("-a02\n")
+            f.write("a01,IAS=51.0\n")
+            f.write("#0.2\n")
+            f.write("a02,IAS=62.0\n")
+
+        parser = ACMIParser()
+        objects = [
+            (obj_id, [state['IAS'] for state in states])
+            for obj_id, states, _ in parser.iter_objects(str(filepath))
+        ]
+
+        self.assertEqual(objects, [('a01', [50.0, 51.0]), ('a02', [60.0, 61.0, 62.0])])
+        self.assertEqual(parser.object_summaries['a02'].count, 3)
+
+        data = ACMIParser().parse_file(str(filepath))
+        self.assertEqual(
+            objects,
+            [(obj_id, [s['IAS'] for s in states]) for obj_id, states in data['objects'].items()],
+        )
+
+    def test_parse_file_columnar(self):
+        """Test parsing into per-object property columns."""
+        filepath = self.create_sample_acmi(with_cam=True)
+
+        parser = ACMIParser()
+        tracks = parser.parse_file_columnar(str(filepath))
+
+        track = tracks['a01']
+        self.assertEqual(track['t'].tolist(), [0.0, 0.1, 0.2])
+
+        props = track['props']
+        self.assertEqual(props['Name'].tolist(), ['TestAgent', None, None])
+        self.assertEqual(props['IAS'].dtype.kind, 'f')
+        self.assertTrue(math.isnan(props['IAS'][0]))
+        self.assertEqual(props['IAS'][1:].tolist(), [50.0, 51.0])
+        self.assertTrue(math.isnan(props['Agent.Reward.Instant'][2]))
+        self.assertEqual(parser.object_summaries['a01'].count, 3)
+
+    def test_parse_file_columnar_float32(self):
+        """Test float32 columns keep geodetic coordinates in float64."""
+        filepath = self.create_sample_acmi(with_cam=True)
+
+        parser = ACMIParser()
+        props = parser.parse_file_columnar(str(filepath), dtype=np.float32)['a01']['props']
+
+        self.assertEqual(props['IAS'].dtype, np.float32)
+        self.assertEqual(props['Latitude'].dtype, np.float64)
+        self.assertEqual(props['Name'].dtype, object)
+
+    def test_parse_file_columnar_tracks(self):
+        """Test columnar parse_file returns ObjectTracks."""
+        filepath = self.create_sample_acmi(with_cam=True)
+
+        parser = ACMIParser()
+        states = parser.parse_file(str(filepath))['objects']['a01']
+        track = parser.parse_file(str(filepath), columnar=True)['objects']['a01']
+
+        self.assertIsInstance(track, ObjectTrack)
+        self.assertEqual(len(track), 3)
+        self.assertEqual(track.alt.tolist()[1:], [1000.0, 1010.0])
+        self.assertTrue(math.isnan(track.alt[0]))
+        self.assertEqual(track.extras['IAS'].tolist()[1:], [50.0, 51.0])
+        self.assertEqual(track.as_legacy_dicts(), states)
+        self.assertEqual(parser.get_all_object_names(), {'a01': 'TestAgent'})
+
+    def test_parse_file_cached(self):
+        """Test the parsed-file cache is reused and invalidated on change."""
+        filepath = self.create_sample_acmi(with_cam=True)
+        cache_path = Path(str(filepath) + '.cache.json')
+
+        expected = ACMIParser().parse_file(str(filepath))
+
+        parser = ACMIParser()
+        first = parser.parse_file_cached(str(filepath))
+        self.assertTrue(cache_path.exists())
+        self.assertEqual(first, expected)
+
+        parser = ACMIParser()
+        second = parser.parse_file_cached(str(filepath))
+        self.assertEqual(second, expected)
+        self.assertEqual(parser.get_all_object_names(), {'a01': 'TestAgent'})
+        self.assertEqual(parser.object_summaries['a01'].count, 3)
+
+        # Changing the source file invalidates the cache
+        with open(filepath, 'a', encoding='utf-8') as f:
+            f.write('#2.0\na02,Name="Other"\n')
+        third = ACMIParser().parse_file_cached(str(filepath))
+        self.assertIn('a02', third['objects'])
+
     def test_parse_quoted_strings(self):
         """Test parsing quoted strings with special chars."""
         filepath = self.temp_path / 'test.txt.acmi'
@@ -234,6 +234,33 @@ class TestACMIRoundtrip(unittest.TestCase):
             self.assertIsNotNone(episode2.tags)
             self.assertEqual(set(episode2.tags), set(episode1.tags))
 
+    def test_iter_matches_list_conversion(self):
+        """Test acmi_to_episodes_iter yields the same episodes as acmi_to_episodes."""
+        acmi_file = self.temp_path / "objects.txt.acmi"
+        with open(acmi_file, 'w', encoding='utf-8') as f:
+            f.write("FileType=text/acmi/tacview\n")
+            f.write("FileVersion=2.2\n")
+            f.write("#0.0\n")
+            f.write('a01,T=-117.88|34.90|700,Name="A"\n')
+            f.write('b01,T=-117.50|35.10|900,Name="B"\n')
+            f.write("#1.0\n")
+            f.write("b01,T=-117.51|35.11|910\n")
+            f.write("-b01\n")
+            f.write("a01,T=-117.89|34.91|710\n")
+            f.write("#2.0\n")
+            f.write("b01,T=-117.52|35.12|920\n")
+
+        listed = ACMIConverter().acmi_to_episodes(str(acmi_file))
+        streamed = list(ACMIConverter().acmi_to_episodes_iter(str(acmi_file)))
+
+        self.assertEqual([ep.agent_id for ep in listed], ['A', 'B'])
+        self.assertEqual(listed[0].trajectory[0].position, (0.0, 0.0, 0.0))
+        self.assertEqual(len(listed[1].trajectory), 3)
+        self.assertEqual(
+            [(ep.agent_id, [dp.position for dp in ep.trajectory]) for ep in streamed],
+            [(ep.agent_id, [dp.position for dp in ep.trajectory]) for ep in listed],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
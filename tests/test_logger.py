@@ -374,6 +374,138 @@ class TestFlightLogger:
 
         logger.close()
 
+    def _batch_columns(self, n):
+        """Build columnar inputs for n steps."""
+        steps = np.arange(n)
+        positions = np.column_stack([np.zeros(n), np.zeros(n), 100.0 + steps])
+        orientations = np.column_stack([np.full(n, 5.0), np.zeros(n), np.zeros(n)])
+        velocities = np.tile([25.0, 0.0, 0.0], (n, 1))
+        telemetry = {
+            'airspeed': np.full(n, 25.0),
+            'altitude': 100.0 + steps,
+            'g_force': np.ones(n),
+            'throttle': np.full(n, 0.8),
+        }
+        rl_metrics = {
+            'reward': np.ones(n),
+            'action': np.tile([0.1, 0.2, 0.3, 0.8], (n, 1)),
+            'reward_components': {'tracking': np.full(n, 0.5)},
+        }
+        return steps, positions, orientations, velocities, telemetry, rl_metrics
+
+    def test_log_flight_data_batch(self, temp_log_dir):
+        """Test logging a batch of steps from columnar arrays."""
+        logger = FlightLogger(log_dir=temp_log_dir)
+        steps, positions, orientations, velocities, telemetry, rl_metrics = self._batch_columns(10)
+
+        logger.log_flight_data_batch(
+            steps=steps,
+            agent_id="test_agent",
+            positions=positions,
+            orientations=orientations,
+            velocities=velocities,
+            telemetry=telemetry,
+            rl_metrics=rl_metrics,
+        )
+
+        assert len(logger.current_episode) == 10
+        assert logger.cumulative_reward == 10.0
+        point = logger.current_episode[9]
+        assert point.step == 9
+        assert point.telemetry.altitude == 109.0
+        assert point.telemetry.bank_angle == 5.0
+        assert point.rl_metrics.cumulative_reward == 10.0
+        assert point.rl_metrics.reward_components == {'tracking': 0.5}
+
+        logger.end_episode(success=True, termination_reason="completed")
+        logger.close()
+
+    def test_log_flight_data_batch_matches_per_step(self, temp_log_dir):
+        """Test batch logging produces the same points as per-step logging."""
+        steps, positions, orientations, velocities, telemetry, rl_metrics = self._batch_columns(5)
+
+        batch_logger = FlightLogger(log_dir=temp_log_dir)
+        batch_logger.log_flight_data_batch(
+            steps=steps,
+            agent_id="test_agent",
+            positions=positions,
+            orientations=orientations,
+            velocities=velocities,
+            telemetry=telemetry,
+            rl_metrics=rl_metrics,
+        )
+
+        step_logger = FlightLogger(log_dir=temp_log_dir)
+        for i in range(5):
+            step_logger.log_flight_data(
+                step=int(steps[i]),
+                agent_id="test_agent",
+                position=tuple(positions[i]),
+                orientation=tuple(orientations[i]),
+                velocity=tuple(velocities[i]),
+                telemetry={key: values[i] for key, values in telemetry.items()},
+                rl_metrics={
+                    'reward': rl_metrics['reward'][i],
+                    'action': rl_metrics['action'][i],
+                    'reward_components': {
+                        key: values[i]
+                        for key, values in rl_metrics['reward_components'].items()
+                    },
+                },
+            )
+
+        for batch_point, step_point in zip(batch_logger.current_episode, step_logger.current_episode):
+            assert batch_point.to_dict() == step_point.to_dict()
+
+        batch_logger.close()
+        step_logger.close()
+
+    def test_log_flight_data_batch_agent_id_mismatch(self, temp_log_dir):
+        """Test error on agent ID mismatch in batch logging."""
+        logger = FlightLogger(log_dir=temp_log_dir)
+        logger.start_episode(agent_id="agent1")
+        steps, positions, orientations, velocities, telemetry, rl_metrics = self._batch_columns(3)
+
+        with pytest.raises(ValueError, match="Agent ID mismatch"):
+            logger.log_flight_data_batch(
+                steps=steps,
+                agent_id="agent2",
+                positions=positions,
+                orientations=orientations,
+                velocities=velocities,
+                telemetry=telemetry,
+                rl_metrics=rl_metrics,
+            )
+
+        logger.close()
+
+    def test_batched_writes_defers_flush(self, temp_log_dir):
+        """Test that batched_writes() flushes once on exit."""
+        logger = FlightLogger(log_dir=temp_log_dir, max_buffer_size=1)
+        flushes = []
+        logger.writer.flush = lambda: flushes.append(1)
+
+        with logger.batched_writes():
+            for step in range(5):
+                logger.log_flight_data(
+                    step=step,
+                    agent_id="test_agent",
+                    position=(0.0, 0.0, 100.0),
+                    orientation=(0.0, 0.0, 0.0),
+                    velocity=(25.0, 0.0, 0.0),
+                    telemetry={'airspeed': 25.0},
+                    rl_metrics={
+                        'reward': 1.0,
+                        'action': [0.1, 0.2, 0.3, 0.8],
+                    },
+                )
+            assert flushes == []
+
+        assert len(flushes) == 1
+        assert len(logger.current_episode) == 5
+
+        logger.close()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])